@@ -1,5 +1,13 @@
 from rdfproxy.adapter import SPARQLModelAdapter  # noqa: F401
+from rdfproxy.cache import MemoryCache, QueryCache, SQLiteCache  # noqa: F401
 from rdfproxy.mapper import ModelBindingsMapper  # noqa: F401
 from rdfproxy.sparqlwrapper import SPARQLWrapper  # noqa: F401
-from rdfproxy.utils._types import ConfigDict, SPARQLBinding  # noqa: F401
+from rdfproxy.utils._types import (  # noqa: F401
+    ConfigDict,
+    CountPolicy,
+    ItemLookup,
+    MapperEngine,
+    PaginationMode,
+    SPARQLBinding,
+)
 from rdfproxy.utils.models import Page, QueryParameters  # noqa: F401
@@ -1,24 +1,68 @@
 """SPARQLModelAdapter class for SPARQL query result set to Pydantic model conversions."""
 
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator
+import concurrent.futures
+from contextlib import aclosing
 import logging
 import math
-from typing import Generic
+import threading
+from typing import Any, Generic, TypeAlias
 import warnings
+import weakref
 
 from rdflib import Graph
-from rdfproxy.constructor import _ItemQueryConstructor, _PageQueryConstructor
+from rdfproxy.cache import MemoryCache
+from rdfproxy.constructor import (
+    _ItemQueryConstructor,
+    _ItemsQueryConstructor,
+    _PageQueryConstructor,
+)
 from rdfproxy.mapper import _ModelBindingsMapper
 from rdfproxy.sparqlwrapper import SPARQLWrapper
-from rdfproxy.utils._types import _TModelInstance
-from rdfproxy.utils.checkers.item_checker import check_item_model, check_key
+from rdfproxy.utils._types import (
+    CountPolicy,
+    ItemLookup,
+    MapperEngine,
+    PaginationMode,
+    ParsedSPARQL,
+    _TModelInstance,
+    _TSPARQLBindingValue,
+)
+from rdfproxy.utils.checkers.item_checker import (
+    check_item_model,
+    check_items_key,
+    check_items_models,
+    check_key,
+)
 from rdfproxy.utils.checkers.model_checker import check_model
-from rdfproxy.utils.checkers.query_checker import check_query
+from rdfproxy.utils.checkers.query_checker import check_parsed_query
+from rdfproxy.utils.cursor_utils import encode_cursor, get_cursor_values
+from rdfproxy.utils.exceptions import MultipleResultsFound, NoResultsFound
 from rdfproxy.utils.models import Page, QueryParameters
 
 
 logger = logging.getLogger(__name__)
 
 
+_TItemBatchKey: TypeAlias = tuple[str, str | None, str | None]
+"Key field, xsd_type and lang_tag of a batch of get_item requests."
+
+_TItemBatch: TypeAlias = dict[Any, list[asyncio.Future]]
+"Mapping of key values to the futures of get_item requests in a batch."
+
+_TPrefetch: TypeAlias = (
+    concurrent.futures.Future[list[dict[str, _TSPARQLBindingValue]]]
+    | asyncio.Future[list[dict[str, _TSPARQLBindingValue]]]
+)
+"""Future of a speculative items query.
+
+Prefetches of get_page run on the event loop of the SPARQLWrapper (concurrent.futures.Future),
+prefetches of aget_page run as tasks on the caller's event loop (asyncio.Future).
+"""
+
+
 class SPARQLModelAdapter(Generic[_TModelInstance]):
     """Adapter/Mapper for SPARQL query result set to Pydantic model conversions.
 
@@ -33,49 +77,495 @@ class SPARQLModelAdapter(Generic[_TModelInstance]):
     Result grouping is controlled through the model,
     i.e. grouping is triggered when a field of list[pydantic.BaseModel] is encountered.
 
+    The target is either a SPARQL endpoint URL, an rdflib.Graph or a SPARQLWrapper instance;
+    passing a SPARQLWrapper allows several adapters to share a pooled connection client.
+    Adapters that create their own SPARQLWrapper can be closed with SPARQLModelAdapter.close;
+    a SPARQLWrapper passed to an adapter is not closed by the adapter.
+
+    The count_policy parameter controls the count query run for Page.total/Page.pages:
+    the count query is either run for every page request (default),
+    cached per count query for count_ttl seconds or disabled altogether,
+    see rdfproxy.CountPolicy.
+
+    The pagination parameter selects LIMIT/OFFSET pagination (default)
+    or keyset pagination, which filters on the keys of the last result of the previous page
+    passed as an opaque cursor (QueryParameters.cursor/Page.next_cursor) instead of using OFFSET,
+    see rdfproxy.PaginationMode.
+
+    With item_batch_window, concurrent get_item/aget_item calls are collected
+    for item_batch_window seconds and resolved with a single batch item query (see get_items);
+    synchronous get_item calls are then run on the event loop of the SPARQLWrapper.
+
+    With prefetch_pages, serving a page schedules a speculative items query for the next page
+    on the event loop of the SPARQLWrapper (get_page) or on the caller's event loop (aget_page);
+    prefetched bindings are kept for prefetch_ttl seconds
+    and at most prefetch_pages speculative queries are in flight at once.
+    Note that count queries are not prefetched, see count_policy.
+
+    The mapper_engine parameter selects the engine for mapping bindings to models,
+    see rdfproxy.MapperEngine.
+
+    The item_lookup parameter controls how get_item/get_items match key values,
+    i.e. in a FILTER clause (default) or in a VALUES clause, see rdfproxy.ItemLookup.
+
     See https://github.com/acdh-oeaw/rdfproxy/tree/main/examples for examples.
     """
 
     def __init__(
         self,
-        target: str | Graph,
+        target: str | Graph | SPARQLWrapper,
         query: str,
         model: type[_TModelInstance],
+        *,
+        count_policy: CountPolicy | str = CountPolicy.ALWAYS,
+        count_ttl: float | None = 300.0,
+        pagination: PaginationMode | str = PaginationMode.OFFSET,
+        item_batch_window: float | None = None,
+        prefetch_pages: int | None = None,
+        prefetch_ttl: float | None = 30.0,
+        mapper_engine: MapperEngine | str = MapperEngine.PANDAS,
+        item_lookup: ItemLookup | str = ItemLookup.FILTER,
     ) -> None:
-        self._target = target
-        self._query = check_query(query)
+        self._owns_sparqlwrapper: bool = not isinstance(target, SPARQLWrapper)
+        self.sparqlwrapper = (
+            target if isinstance(target, SPARQLWrapper) else SPARQLWrapper(target)
+        )
+
+        self._target = self.sparqlwrapper.target
+        self._parsed_query: ParsedSPARQL = check_parsed_query(ParsedSPARQL(query=query))
+        self._query: str = self._parsed_query.data
         self._model = check_model(model)
 
-        self.sparqlwrapper = SPARQLWrapper(self._target)
+        self.pagination = PaginationMode(pagination)
+        self.mapper_engine = MapperEngine(mapper_engine)
+        self.item_lookup = ItemLookup(item_lookup)
+        self.item_batch_window = item_batch_window
+        self.count_policy = CountPolicy(count_policy)
+        self._count_cache: MemoryCache | None = (
+            MemoryCache(ttl=count_ttl)
+            if self.count_policy == CountPolicy.CACHED
+            else None
+        )
+
+        self._item_batches: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[_TItemBatchKey, _TItemBatch]
+        ] = weakref.WeakKeyDictionary()
+        self._item_batch_tasks: set[asyncio.Task] = set()
+
+        if prefetch_pages is not None and prefetch_pages < 1:
+            raise ValueError("Parameter 'prefetch_pages' must be a positive integer.")
+
+        self.prefetch_pages = prefetch_pages
+        self._prefetch_cache: MemoryCache | None = (
+            None if prefetch_pages is None else MemoryCache(ttl=prefetch_ttl)
+        )
+        self._prefetches: dict[str, _TPrefetch] = {}
+        self._prefetch_lock = threading.Lock()
 
         logger.info("Initialized SPARQLModelAdapter.")
         logger.debug("Target: %s", self._target)
         logger.debug("Model: %s", self._model)
         logger.debug("Query: \n%s", self._query)
 
+    def close(self) -> None:
+        """Cancel pending page prefetches and close the SPARQLWrapper of the adapter.
+
+        SPARQLWrapper instances passed to the adapter are not closed,
+        since they can be shared between adapters; close them with SPARQLWrapper.close.
+        """
+        with self._prefetch_lock:
+            prefetches = list(self._prefetches.values())
+
+        for future in prefetches:
+            if isinstance(future, concurrent.futures.Future):
+                future.cancel()
+            elif not future.get_loop().is_closed():
+                future.get_loop().call_soon_threadsafe(future.cancel)
+
+        if self._owns_sparqlwrapper:
+            self.sparqlwrapper.close()
+
+    async def aclose(self) -> None:
+        """Close the SPARQLWrapper client bound to the running event loop.
+
+        Pending page prefetches of aget_page on the running event loop are cancelled.
+        As with SPARQLModelAdapter.close, SPARQLWrapper instances passed to the adapter are not closed.
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._prefetch_lock:
+            prefetches = [
+                future
+                for future in self._prefetches.values()
+                if isinstance(future, asyncio.Future) and future.get_loop() is loop
+            ]
+
+        for future in prefetches:
+            future.cancel()
+
+        if self._owns_sparqlwrapper:
+            await self.sparqlwrapper.aclose()
+
     def get_item(
         self, *, xsd_type: str | None = None, lang_tag: str | None = None, **key
     ) -> _TModelInstance:
         """Run a query against a target and return a model instance."""
+        if self.item_batch_window is not None:
+            return self.sparqlwrapper.run(
+                self.aget_item(xsd_type=xsd_type, lang_tag=lang_tag, **key)
+            )
+
         logger.info(
             "Running SPARQLModelAdapter.get_item against endpoint '%s'", self._target
         )
 
-        check_key(key=key, query=self._query, model=self._model)
+        item_query = self._get_item_query(key=key, xsd_type=xsd_type, lang_tag=lang_tag)
+        item_query_bindings, *_ = self.sparqlwrapper.queries(item_query)
+
+        return self._get_item_model(bindings=item_query_bindings, key=key)
+
+    async def aget_item(
+        self, *, xsd_type: str | None = None, lang_tag: str | None = None, **key
+    ) -> _TModelInstance:
+        """Asynchronously run a query against a target and return a model instance.
+
+        Coroutine counterpart of SPARQLModelAdapter.get_item
+        that runs on the caller's event loop.
+        """
+        if self.item_batch_window is not None:
+            check_key(key=key, query=self._parsed_query, model=self._model)
+            return await self._aget_batched_item(
+                key=key, xsd_type=xsd_type, lang_tag=lang_tag
+            )
+
+        logger.info(
+            "Running SPARQLModelAdapter.aget_item against endpoint '%s'", self._target
+        )
+
+        item_query = self._get_item_query(key=key, xsd_type=xsd_type, lang_tag=lang_tag)
+        item_query_bindings, *_ = await self.sparqlwrapper.aqueries(item_query)
+
+        return self._get_item_model(bindings=item_query_bindings, key=key)
+
+    def get_items(
+        self,
+        *,
+        xsd_type: str | None = None,
+        lang_tag: str | None = None,
+        **key: Iterable[Any],
+    ) -> dict[Any, _TModelInstance | NoResultsFound | MultipleResultsFound]:
+        """Run a single query against a target and return model instances for multiple keys.
+
+        The key is a single kwarg with an iterable of key values, e.g. get_items(id=[1, 2]).
+        The result dict maps key values to model instances;
+        missing or duplicate results are reported per key value
+        as NoResultsFound or MultipleResultsFound exception instances.
+        """
+        logger.info(
+            "Running SPARQLModelAdapter.get_items against endpoint '%s'", self._target
+        )
+
+        items_key = check_items_key(
+            key=key, query=self._parsed_query, model=self._model
+        )
+
+        if (
+            items_query := self._get_items_query(items_key, xsd_type, lang_tag)
+        ) is None:
+            return {}
+
+        items_query_bindings, *_ = self.sparqlwrapper.queries(items_query)
+
+        return self._get_items_models(bindings=items_query_bindings, key=items_key)
+
+    async def aget_items(
+        self,
+        *,
+        xsd_type: str | None = None,
+        lang_tag: str | None = None,
+        **key: Iterable[Any],
+    ) -> dict[Any, _TModelInstance | NoResultsFound | MultipleResultsFound]:
+        """Asynchronously run a single query against a target and return model instances for multiple keys.
+
+        Coroutine counterpart of SPARQLModelAdapter.get_items
+        that runs on the caller's event loop.
+        """
+        logger.info(
+            "Running SPARQLModelAdapter.aget_items against endpoint '%s'", self._target
+        )
+
+        items_key = check_items_key(
+            key=key, query=self._parsed_query, model=self._model
+        )
+
+        if (
+            items_query := self._get_items_query(items_key, xsd_type, lang_tag)
+        ) is None:
+            return {}
+
+        items_query_bindings, *_ = await self.sparqlwrapper.aqueries(items_query)
+
+        return self._get_items_models(bindings=items_query_bindings, key=items_key)
+
+    def get_page(
+        self, query_parameters: QueryParameters = QueryParameters()
+    ) -> Page[_TModelInstance]:
+        """Run a query against a target and return a Page model object."""
+        logger.info(
+            "Running SPARQLModelAdapter.get_page against endpoint '%s'", self._target
+        )
+
+        items_query, count_query, cursor_variables = self._get_page_queries(
+            query_parameters
+        )
+        total = self._get_cached_total(count_query)
+
+        future = self._get_prefetch_future(items_query)
+
+        if isinstance(future, concurrent.futures.Future):
+            concurrent.futures.wait([future])
+        items_query_bindings = self._get_prefetched_bindings(future)
+
+        if items_query_bindings is None and (count_query is None or total is not None):
+            items_query_bindings, *_ = self.sparqlwrapper.queries(items_query)
+        elif items_query_bindings is None:
+            items_query_bindings, count_query_bindings = self.sparqlwrapper.queries(
+                items_query, count_query
+            )
+            total = self._get_total(count_query, count_query_bindings)
+        elif count_query is not None and total is None:
+            (count_query_bindings,) = self.sparqlwrapper.queries(count_query)
+            total = self._get_total(count_query, count_query_bindings)
+
+        page = self._get_page_model(
+            items_query_bindings=items_query_bindings,
+            total=total,
+            cursor_variables=cursor_variables,
+            query_parameters=query_parameters,
+        )
+        self._prefetch_next_page(query_parameters, page)
+
+        return page
+
+    def iter_models(
+        self,
+        query_parameters: QueryParameters = QueryParameters(),
+        concurrency: int = 1,
+    ) -> Iterator[_TModelInstance]:
+        """Run queries against a target and lazily iterate over all model instances.
+
+        The result set is walked in chunks of query_parameters.size starting
+        from query_parameters.page (or query_parameters.cursor for keyset pagination)
+        according to the grouped/ungrouped pagination logic of get_page,
+        so groups are never split across chunks. Count queries are not run.
+
+        With concurrency > 1 (offset pagination only), up to concurrency chunk queries
+        are kept in flight on the event loop of the SPARQLWrapper
+        while completed chunks are mapped and yielded in order.
+        """
+        logger.info(
+            "Running SPARQLModelAdapter.iter_models against endpoint '%s'",
+            self._target,
+        )
+
+        chunks = self._aiter_chunks(query_parameters, concurrency)
+
+        async def _anext_chunk() -> list[_TModelInstance]:
+            return await anext(chunks)
+
+        try:
+            while True:
+                try:
+                    items = self.sparqlwrapper.run(_anext_chunk())
+                except StopAsyncIteration:
+                    return
+
+                yield from items
+        finally:
+            self.sparqlwrapper.run(chunks.aclose())
+
+    async def aiter_models(
+        self,
+        query_parameters: QueryParameters = QueryParameters(),
+        concurrency: int = 1,
+    ) -> AsyncIterator[_TModelInstance]:
+        """Asynchronously run queries against a target and lazily iterate over all model instances.
+
+        Async generator counterpart of SPARQLModelAdapter.iter_models
+        that runs on the caller's event loop.
+        """
+        logger.info(
+            "Running SPARQLModelAdapter.aiter_models against endpoint '%s'",
+            self._target,
+        )
+
+        async with aclosing(
+            self._aiter_chunks(query_parameters, concurrency)
+        ) as chunks:
+            async for items in chunks:
+                for item in items:
+                    yield item
+
+    async def aget_page(
+        self, query_parameters: QueryParameters = QueryParameters()
+    ) -> Page[_TModelInstance]:
+        """Asynchronously run a query against a target and return a Page model object.
+
+        Coroutine counterpart of SPARQLModelAdapter.get_page
+        that runs on the caller's event loop.
+        """
+        logger.info(
+            "Running SPARQLModelAdapter.aget_page against endpoint '%s'", self._target
+        )
+
+        items_query, count_query, cursor_variables = self._get_page_queries(
+            query_parameters
+        )
+        total = self._get_cached_total(count_query)
+
+        future = self._get_prefetch_future(items_query)
+
+        if isinstance(future, concurrent.futures.Future):
+            await asyncio.wait([asyncio.wrap_future(future)])
+        elif future is not None and future.get_loop() is asyncio.get_running_loop():
+            await asyncio.wait([future])
+        items_query_bindings = self._get_prefetched_bindings(future)
+
+        if items_query_bindings is None and (count_query is None or total is not None):
+            items_query_bindings, *_ = await self.sparqlwrapper.aqueries(items_query)
+        elif items_query_bindings is None:
+            (
+                items_query_bindings,
+                count_query_bindings,
+            ) = await self.sparqlwrapper.aqueries(items_query, count_query)
+            total = self._get_total(count_query, count_query_bindings)
+        elif count_query is not None and total is None:
+            (count_query_bindings,) = await self.sparqlwrapper.aqueries(count_query)
+            total = self._get_total(count_query, count_query_bindings)
+
+        page = self._get_page_model(
+            items_query_bindings=items_query_bindings,
+            total=total,
+            cursor_variables=cursor_variables,
+            query_parameters=query_parameters,
+        )
+        self._prefetch_next_page(
+            query_parameters, page, loop=asyncio.get_running_loop()
+        )
+
+        return page
+
+    async def _aget_batched_item(
+        self, key: dict[str, Any], xsd_type: str | None, lang_tag: str | None
+    ) -> _TModelInstance:
+        """Add a get_item request to the batch of the running event loop and await its result.
+
+        The first request for a batch key schedules the batch dispatch
+        after item_batch_window seconds.
+        """
+        assert self.item_batch_window is not None  # type narrow
+
+        loop = asyncio.get_running_loop()
+        batches = self._item_batches.setdefault(loop, {})
+
+        (key_field, key_value), *_ = key.items()
+        batch_key: _TItemBatchKey = (key_field, xsd_type, lang_tag)
+
+        if (batch := batches.get(batch_key)) is None:
+            batch = batches[batch_key] = {}
+
+            task = loop.create_task(self._dispatch_item_batch(batches, batch_key))
+            self._item_batch_tasks.add(task)
+            task.add_done_callback(self._item_batch_tasks.discard)
+            # tasks cancelled before they start never run _dispatch_item_batch
+            task.add_done_callback(
+                lambda _, batch=batch: self._discard_item_batch(
+                    batches, batch_key, batch
+                )
+            )
+
+        future: asyncio.Future[_TModelInstance] = loop.create_future()
+        batch.setdefault(key_value, []).append(future)
+
+        return await future
+
+    async def _dispatch_item_batch(
+        self, batches: dict[_TItemBatchKey, _TItemBatch], batch_key: _TItemBatchKey
+    ) -> None:
+        """Resolve a batch of get_item requests with a single batch item query.
+
+        Every pending request of the batch is resolved, also if the dispatch fails
+        or is cancelled; requests of a cancelled dispatch are cancelled.
+        """
+        assert self.item_batch_window is not None  # type narrow
+        batch = batches[batch_key]
+
+        try:
+            await asyncio.sleep(self.item_batch_window)
+            del batches[batch_key]
+
+            key_field, xsd_type, lang_tag = batch_key
+            logger.info("Dispatching batch of %s get_item requests.", len(batch))
+
+            try:
+                results = await self.aget_items(
+                    xsd_type=xsd_type, lang_tag=lang_tag, **{key_field: list(batch)}
+                )
+            except Exception as e:
+                results = dict.fromkeys(batch, e)
+
+            for key_value, futures in batch.items():
+                result = results[key_value]
+
+                for future in filter(lambda future: not future.done(), futures):
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        finally:
+            self._discard_item_batch(batches, batch_key, batch)
+
+    @staticmethod
+    def _discard_item_batch(
+        batches: dict[_TItemBatchKey, _TItemBatch],
+        batch_key: _TItemBatchKey,
+        batch: _TItemBatch,
+    ) -> None:
+        """Remove a batch from the pending batches and cancel its unresolved requests."""
+        if batches.get(batch_key) is batch:
+            del batches[batch_key]
+
+        for futures in batch.values():
+            for future in filter(lambda future: not future.done(), futures):
+                future.cancel()
+
+    def _get_item_query(
+        self, key: dict[str, Any], xsd_type: str | None, lang_tag: str | None
+    ) -> str:
+        """Check a key and construct an item query for get_item/aget_item."""
+        check_key(key=key, query=self._parsed_query, model=self._model)
 
         query_constructor = _ItemQueryConstructor(
             key=key,
             xsd_type=xsd_type,
             lang_tag=lang_tag,
-            query=self._query,
+            query=self._parsed_query,
             model=self._model,
+            lookup=self.item_lookup,
         )
         item_query = query_constructor.get_item_query()
 
         logger.debug("Running item query: \n%s", item_query)
 
-        item_query_bindings, *_ = self.sparqlwrapper.queries(item_query)
-        mapper = _ModelBindingsMapper(self._model, item_query_bindings)
+        return item_query
+
+    def _get_item_model(
+        self,
+        bindings: Iterator[dict[str, _TSPARQLBindingValue]],
+        key: dict[str, Any],
+    ) -> _TModelInstance:
+        """Map item query bindings and check for a single model instance."""
+        mapper = _ModelBindingsMapper(self._model, bindings, engine=self.mapper_engine)
 
         item_model = check_item_model(
             models=mapper.get_models(), model_type=self._model, key=key
@@ -83,35 +573,319 @@ class SPARQLModelAdapter(Generic[_TModelInstance]):
 
         return item_model
 
-    def get_page(
-        self, query_parameters: QueryParameters = QueryParameters()
-    ) -> Page[_TModelInstance]:
-        """Run a query against a target and return a Page model object."""
-        logger.info(
-            "Running SPARQLModelAdapter.get_page against endpoint '%s'", self._target
+    def _get_items_query(
+        self, key: dict[str, list[Any]], xsd_type: str | None, lang_tag: str | None
+    ) -> str | None:
+        """Construct a batch item query for get_items/aget_items.
+
+        The query is None if no key values are given.
+        """
+        (_, key_values), *_ = key.items()
+
+        if not key_values:
+            return None
+
+        query_constructor = _ItemsQueryConstructor(
+            key=key,
+            xsd_type=xsd_type,
+            lang_tag=lang_tag,
+            query=self._parsed_query,
+            model=self._model,
+            lookup=self.item_lookup,
+        )
+        items_query = query_constructor.get_items_query()
+
+        logger.debug("Running batch item query: \n%s", items_query)
+
+        return items_query
+
+    def _get_items_models(
+        self,
+        bindings: Iterator[dict[str, _TSPARQLBindingValue]],
+        key: dict[str, list[Any]],
+    ) -> dict[Any, _TModelInstance | NoResultsFound | MultipleResultsFound]:
+        """Map batch item query bindings and assign model instances to key values."""
+        mapper = _ModelBindingsMapper(self._model, bindings, engine=self.mapper_engine)
+
+        return check_items_models(
+            models=mapper.get_models(), model_type=self._model, key=key
         )
 
+    async def _aiter_chunks(
+        self, query_parameters: QueryParameters, concurrency: int
+    ) -> AsyncIterator[list[_TModelInstance]]:
+        """Async generator for the model chunks of iter_models/aiter_models.
+
+        For offset pagination, chunk queries for the following pages are scheduled
+        up to concurrency queries in flight; for keyset pagination, the next chunk query
+        depends on the cursor of the previous chunk.
+        Chunk mapping runs in a thread, so in-flight queries progress meanwhile.
+        """
+        if concurrency < 1:
+            raise ValueError("Parameter 'concurrency' must be a positive integer.")
+        if concurrency > 1 and self.pagination == PaginationMode.KEYSET:
+            raise ValueError("Concurrent chunk queries require offset pagination.")
+
+        size = query_parameters.size
+        chunks: deque[tuple[asyncio.Task, list[str] | None]] = deque()
+
+        def _schedule_chunk(query_parameters: QueryParameters) -> None:
+            items_query, cursor_variables = self._get_chunk_query(query_parameters)
+            task = asyncio.ensure_future(self.sparqlwrapper.aqueries(items_query))
+            chunks.append((task, cursor_variables))
+
+        _schedule_chunk(query_parameters)
+
+        try:
+            while True:
+                if self.pagination == PaginationMode.OFFSET:
+                    while len(chunks) < concurrency:
+                        query_parameters = self._get_next_chunk_parameters(
+                            query_parameters, None
+                        )
+                        _schedule_chunk(query_parameters)
+
+                task, cursor_variables = chunks.popleft()
+                items_query_bindings, *_ = await task
+
+                items, next_cursor = await asyncio.to_thread(
+                    self._get_chunk_models,
+                    items_query_bindings=items_query_bindings,
+                    cursor_variables=cursor_variables,
+                    size=size,
+                )
+
+                yield items
+
+                if len(items) < size:
+                    return
+
+                if self.pagination == PaginationMode.KEYSET:
+                    query_parameters = self._get_next_chunk_parameters(
+                        query_parameters, next_cursor
+                    )
+                    _schedule_chunk(query_parameters)
+        finally:
+            for task, _ in chunks:
+                task.cancel()
+
+    def _get_chunk_query(
+        self, query_parameters: QueryParameters
+    ) -> tuple[str, list[str] | None]:
+        """Construct an items query for iter_models.
+
+        The cursor variables are None for offset pagination.
+        """
         query_constructor = _PageQueryConstructor(
-            query=self._query,
+            query=self._parsed_query,
             query_parameters=query_parameters,
             model=self._model,
+            pagination=self.pagination,
         )
 
-        count_query = query_constructor.get_count_query()
         items_query = query_constructor.get_items_query()
+        logger.debug("Running items query: \n%s", items_query)
 
+        return items_query, query_constructor.cursor_variables
+
+    def _get_next_chunk_parameters(
+        self, query_parameters: QueryParameters, next_cursor: str | None
+    ) -> QueryParameters:
+        """Get query parameters for the chunk following a chunk."""
+        if self.pagination == PaginationMode.KEYSET:
+            return query_parameters.model_copy(update={"cursor": next_cursor})
+        return query_parameters.model_copy(update={"page": query_parameters.page + 1})
+
+    def _get_page_queries(
+        self, query_parameters: QueryParameters
+    ) -> tuple[str, str | None, list[str] | None]:
+        """Construct items and count queries for get_page/aget_page.
+
+        The count query is None if the count policy is disabled.
+        The cursor variables are None for offset pagination.
+        """
+        query_constructor = _PageQueryConstructor(
+            query=self._parsed_query,
+            query_parameters=query_parameters,
+            model=self._model,
+            pagination=self.pagination,
+        )
+        cursor_variables = query_constructor.cursor_variables
+
+        items_query = query_constructor.get_items_query()
         logger.debug("Running items query: \n%s", items_query)
+
+        if self.count_policy == CountPolicy.DISABLED:
+            return items_query, None, cursor_variables
+
+        count_query = query_constructor.get_count_query()
         logger.debug("Running count query: \n%s", count_query)
 
-        items_query_bindings, count_query_bindings = self.sparqlwrapper.queries(
-            items_query, count_query
+        return items_query, count_query, cursor_variables
+
+    def _get_cached_total(self, count_query: str | None) -> int | None:
+        """Get a cached total for a count query or None if not cached."""
+        if count_query is None or self._count_cache is None:
+            return None
+
+        if (count_query_bindings := self._count_cache.get(count_query)) is None:
+            return None
+
+        logger.debug("Using cached count query result.")
+        return int(count_query_bindings[0]["cnt"])
+
+    def _get_total(
+        self,
+        count_query: str,
+        count_query_bindings: Iterator[dict[str, _TSPARQLBindingValue]],
+    ) -> int:
+        """Get the total from count query bindings and cache it if applicable."""
+        total: int = int(next(count_query_bindings)["cnt"])
+
+        if self._count_cache is not None:
+            self._count_cache.set(count_query, [{"cnt": total}])
+
+        return total
+
+    def _get_prefetch_future(self, items_query: str) -> _TPrefetch | None:
+        """Get a future for prefetched items query bindings or None if not prefetched.
+
+        Futures of completed prefetches are served from the prefetch cache.
+        """
+        if self._prefetch_cache is None:
+            return None
+
+        if (bindings := self._prefetch_cache.get(items_query)) is not None:
+            logger.debug("Using prefetched items query result.")
+            future: concurrent.futures.Future = concurrent.futures.Future()
+            future.set_result(bindings)
+            return future
+
+        with self._prefetch_lock:
+            return self._prefetches.get(items_query)
+
+    @staticmethod
+    def _get_prefetched_bindings(
+        future: _TPrefetch | None,
+    ) -> Iterator[dict[str, _TSPARQLBindingValue]] | None:
+        """Get the bindings of a completed prefetch future.
+
+        Pending, failed or cancelled prefetches return None,
+        the items query is then run regularly.
+        Note that get_page/aget_page wait for prefetches they are able to wait for.
+        """
+        if future is None or not future.done():
+            return None
+
+        if future.cancelled() or future.exception() is not None:
+            return None
+
+        return iter(future.result())
+
+    def _prefetch_next_page(
+        self,
+        query_parameters: QueryParameters,
+        page: Page[_TModelInstance],
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        """Schedule a speculative items query for the page following a page.
+
+        The prefetch is scheduled as a task on loop (i.e. the running loop of aget_page)
+        or on the event loop of the SPARQLWrapper if no loop is given.
+
+        Nothing is scheduled if prefetching is disabled, the page is the last page,
+        the next page is already prefetched or prefetch_pages prefetches are in flight.
+        """
+        if self._prefetch_cache is None or self.prefetch_pages is None:
+            return
+
+        if len(page.items) < query_parameters.size:
+            return
+
+        if page.pages is not None and self.pagination == PaginationMode.OFFSET:
+            if page.page >= page.pages:
+                return
+
+        next_query_parameters = self._get_next_chunk_parameters(
+            query_parameters, page.next_cursor
         )
+        items_query, *_ = self._get_chunk_query(next_query_parameters)
+
+        with self._prefetch_lock:
+            if (
+                items_query in self._prefetches
+                or len(self._prefetches) >= self.prefetch_pages
+                or self._prefetch_cache.get(items_query) is not None
+            ):
+                return
+
+            logger.debug("Prefetching items query: \n%s", items_query)
+            future: _TPrefetch = (
+                self.sparqlwrapper.submit(self._aprefetch(items_query))
+                if loop is None
+                else loop.create_task(self._aprefetch(items_query))
+            )
+            self._prefetches[items_query] = future
+
+        prefetch_cache = self._prefetch_cache
+
+        def _prefetch_done(future: _TPrefetch) -> None:
+            if not future.cancelled() and future.exception() is None:
+                prefetch_cache.set(items_query, future.result())
+
+            with self._prefetch_lock:
+                self._prefetches.pop(items_query, None)
+
+        future.add_done_callback(_prefetch_done)
 
-        mapper = _ModelBindingsMapper(self._model, items_query_bindings)
+    async def _aprefetch(
+        self, items_query: str
+    ) -> list[dict[str, _TSPARQLBindingValue]]:
+        """Coroutine for a speculative items query."""
+        (items_query_bindings,) = await self.sparqlwrapper.aqueries(items_query)
+        return list(items_query_bindings)
+
+    def _get_chunk_models(
+        self,
+        items_query_bindings: Iterator[dict[str, _TSPARQLBindingValue]],
+        cursor_variables: list[str] | None,
+        size: int,
+    ) -> tuple[list[_TModelInstance], str | None]:
+        """Map items query bindings of a page/chunk and compute the next cursor.
+
+        For keyset pagination, the next cursor is constructed from the last binding,
+        unless the page/chunk is not full and therefore the last one.
+        """
+        bindings = list(items_query_bindings)
+
+        mapper = _ModelBindingsMapper(self._model, bindings, engine=self.mapper_engine)
         items: list[_TModelInstance] = mapper.get_models()
 
-        total: int = int(next(count_query_bindings)["cnt"])
-        pages: int = math.ceil(total / query_parameters.size)
+        next_cursor: str | None = (
+            encode_cursor(get_cursor_values(bindings[-1], cursor_variables))
+            if cursor_variables is not None and len(items) >= size
+            else None
+        )
+
+        return items, next_cursor
+
+    def _get_page_model(
+        self,
+        items_query_bindings: Iterator[dict[str, _TSPARQLBindingValue]],
+        total: int | None,
+        cursor_variables: list[str] | None,
+        query_parameters: QueryParameters,
+    ) -> Page[_TModelInstance]:
+        """Map items query bindings and construct a Page model object."""
+        items, next_cursor = self._get_chunk_models(
+            items_query_bindings=items_query_bindings,
+            cursor_variables=cursor_variables,
+            size=query_parameters.size,
+        )
+
+        pages: int | None = (
+            None if total is None else math.ceil(total / query_parameters.size)
+        )
 
         return Page(
             items=items,
@@ -119,6 +893,7 @@ class SPARQLModelAdapter(Generic[_TModelInstance]):
             size=query_parameters.size,
             total=total,
             pages=pages,
+            next_cursor=next_cursor,
         )
 
     def query(
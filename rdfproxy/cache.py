@@ -0,0 +1,193 @@
+"""Result caches for rdfproxy.SPARQLWrapper."""
+
+import abc
+import asyncio
+from collections import OrderedDict
+from collections.abc import Hashable
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from rdfproxy.utils._types import _TSPARQLBindingValue
+
+
+_TCacheValue = list[dict[str, _TSPARQLBindingValue]]
+
+
+def get_cache_key(*parts: Hashable) -> str:
+    """Compute a cache key from its string-representable parts."""
+    return hashlib.sha256("\x1f".join(map(str, parts)).encode()).hexdigest()
+
+
+class QueryCache(abc.ABC):
+    """ABC for RDFProxy query result caches.
+
+    A QueryCache maps cache keys (see get_cache_key) to decoded bindings.
+    Entries expire after ttl seconds (if ttl is not None)
+    and the least recently used entries are evicted once the cache exceeds maxsize.
+
+    SPARQLWrapper accesses caches with the QueryCache.aget/QueryCache.aset coroutines,
+    which run QueryCache.get/QueryCache.set in a thread by default,
+    so cache I/O does not block the event loop.
+
+    Note that cached bindings are shared between cache hits and must not be mutated.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float | None = None) -> None:
+        if maxsize < 1:
+            raise ValueError("Parameter 'maxsize' must be a positive integer.")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def get(self, key: str) -> _TCacheValue | None:  # pragma: no cover
+        """Get a cached value or None if the key is missing or expired."""
+        return NotImplemented
+
+    @abc.abstractmethod
+    def set(self, key: str, value: _TCacheValue) -> None:  # pragma: no cover
+        """Cache a value and evict least recently used entries exceeding maxsize."""
+        return NotImplemented
+
+    @abc.abstractmethod
+    def clear(self) -> None:  # pragma: no cover
+        """Remove all entries from the cache."""
+        return NotImplemented
+
+    async def aget(self, key: str) -> _TCacheValue | None:
+        """Asynchronously get a cached value or None if the key is missing or expired."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: _TCacheValue) -> None:
+        """Asynchronously cache a value."""
+        await asyncio.to_thread(self.set, key, value)
+
+
+class MemoryCache(QueryCache):
+    """In-process LRU QueryCache with optional TTL expiry.
+
+    MemoryCache does not do I/O, so MemoryCache.aget/MemoryCache.aset
+    access the cache directly instead of running in a thread.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float | None = None) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._data: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+
+    def get(self, key: str) -> _TCacheValue | None:
+        with self._lock:
+            if (entry := self._data.get(key)) is None:
+                return None
+
+            expires, value = entry
+
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: _TCacheValue) -> None:
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    async def aget(self, key: str) -> _TCacheValue | None:
+        return self.get(key)
+
+    async def aset(self, key: str, value: _TCacheValue) -> None:
+        self.set(key, value)
+
+
+class SQLiteCache(QueryCache):
+    """On-disk LRU QueryCache with optional TTL expiry based on SQLite.
+
+    Values are pickled, so the cache persists across process restarts.
+    Expiry uses wall-clock time for that reason.
+
+    Warning: Cached values are unpickled when read, and unpickling can execute arbitrary code.
+    The database at path must therefore only be writable by trusted users.
+    Never point an SQLiteCache at a file from an untrusted source.
+    """
+
+    def __init__(
+        self, path: str, maxsize: int = 1024, ttl: float | None = None
+    ) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.path = path
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "create table if not exists rdfproxy_cache "
+                "(key text primary key, value blob, expires real, accessed real)"
+            )
+
+    def get(self, key: str) -> _TCacheValue | None:
+        now = time.time()
+
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "select value, expires from rdfproxy_cache where key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, expires = row
+
+            if expires is not None and expires <= now:
+                self._connection.execute(
+                    "delete from rdfproxy_cache where key = ?", (key,)
+                )
+                return None
+
+            self._connection.execute(
+                "update rdfproxy_cache set accessed = ? where key = ?", (now, key)
+            )
+
+        return pickle.loads(value)
+
+    def set(self, key: str, value: _TCacheValue) -> None:
+        now = time.time()
+        expires = None if self.ttl is None else now + self.ttl
+        pickled_value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "insert or replace into rdfproxy_cache values (?, ?, ?, ?)",
+                (key, pickled_value, expires, now),
+            )
+            self._connection.execute(
+                "delete from rdfproxy_cache where expires <= ?", (now,)
+            )
+            self._connection.execute(
+                "delete from rdfproxy_cache where key not in "
+                "(select key from rdfproxy_cache order by accessed desc, rowid desc limit ?)",
+                (self.maxsize,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("delete from rdfproxy_cache")
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        self._connection.close()
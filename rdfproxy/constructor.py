@@ -1,21 +1,34 @@
 from typing import Any
 
-from rdflib import Literal
-from rdfproxy.utils._types import _TModelInstance
+from rdflib import Literal, URIRef, Variable
+from rdflib.term import _is_valid_uri
+from rdfproxy.utils._types import (
+    ItemLookup,
+    PaginationMode,
+    ParsedSPARQL,
+    _TModelInstance,
+)
+from rdfproxy.utils.exceptions import QueryConstructionException
+from rdfproxy.utils.cursor_utils import (
+    _TCursorTerm,
+    decode_cursor,
+    get_cursor_lang_variable,
+)
 from rdfproxy.utils.models import QueryParameters
 from rdfproxy.utils.sparql_utils import (
+    QueryTemplate,
     add_solution_modifier,
     get_query_projection,
-    inject_into_query,
-    remove_sparql_prefixes,
-    replace_query_select_clause,
-)
-from rdfproxy.utils.utils import (
-    FieldsBindingsMap,
-    ModelSPARQLMap,
-    QueryConstructorComponent as component,
-    compose_left,
 )
+from rdfproxy.utils.type_utils import _is_iri_static_type
+from rdfproxy.utils.utils import FieldsBindingsMap, ModelSPARQLMap
+
+
+def _get_query_template(query: str | ParsedSPARQL) -> QueryTemplate:
+    """Get the cached QueryTemplate of a ParsedSPARQL object or a QueryTemplate for a query."""
+    if isinstance(query, ParsedSPARQL):
+        return query.template
+    return QueryTemplate(query)
 
 
 class _ItemQueryConstructor:
@@ -23,6 +36,17 @@ class _ItemQueryConstructor:
 
     The class encapsulates dynamic SPARQL query modification logic
     for single item requests according to an ID key.
+
+    By default, the key is matched in a FILTER clause, by string comparison
+    or by RDF term comparison if xsd_type or lang_tag is given.
+
+    With ItemLookup.VALUES, if the RDF term kind of the key is known (i.e. if xsd_type or lang_tag is given)
+    or can be inferred from the model field type (i.e. for IRI field types),
+    the key is bound as an RDF term in a VALUES clause at the start of the query pattern,
+    which allows triplestores to use their term indexes. Since VALUES joins on RDF term equality,
+    typed key values are normalized to their canonical lexical form
+    (e.g. "01"^^xsd:integer to "1"^^xsd:integer). Keys that are not bound
+    by a triple pattern of the query (e.g. by BIND or OPTIONAL) fall back to the FILTER clause.
     """
 
     def __init__(
@@ -30,40 +54,62 @@ class _ItemQueryConstructor:
         key: dict[str, Any],
         xsd_type: str | None,
         lang_tag: str | None,
-        query: str,
+        query: str | ParsedSPARQL,
         model: type[_TModelInstance],
+        lookup: ItemLookup = ItemLookup.FILTER,
     ) -> None:
         self.key = key
         self.xsd_type = xsd_type
         self.lang_tag = lang_tag
-        self.query = query
+        self.query: str = str(query)
+        self.model = model
+        self.lookup = lookup
+
+        self._parsed_query = query
+        self.template: QueryTemplate = _get_query_template(query)
 
         self.bindings_map = FieldsBindingsMap(model)
 
     def get_item_query(self) -> str:
         """Construct a SPARQL item query for use in rdfproxy.SPARQLModelAdapter."""
-        detail_filter_clause: str = self._get_item_filter_clause()
-        return inject_into_query(
-            self.query, detail_filter_clause, inject_into_pattern=False
-        )
+        (_key_key, _key_value), *_ = self.key.items()
+        key_key = self.bindings_map[_key_key]
 
-    def _get_item_filter_clause(self) -> str:
-        """Compute a FILTER clause for SPARQL item query construction."""
+        if (key_terms := self._get_key_terms(key_key, [_key_value])) is not None:
+            return self.template.render(
+                head_injectant=self._get_values_clause(key_key, key_terms)
+            )
 
-        (_key_key, _key_value), *_ = self.key.items()
+        key_expression, (key_term,) = self._get_key_filter_terms(key_key, [_key_value])
 
-        key_key = self.bindings_map[_key_key]
-        key_value = Literal(
-            _key_value
-        )._quote_encode()  # Literal.n3 would also be an option
+        detail_filter_clause = f"filter ({key_expression} = {key_term})"
+        return self.template.render(tail_injectant=detail_filter_clause)
+
+    def _get_key_filter_terms(
+        self, key_key: str, key_values: list[Any]
+    ) -> tuple[str, list[str]]:
+        """Compute the key expression and the key terms for a FILTER clause.
 
+        Typed key values are normalized to their canonical lexical form,
+        since some engines (e.g. rdflib) compare IN operands by RDF term equality.
+        """
         match (self.xsd_type, self.lang_tag):
             case None, None:
-                filter_clause = f"filter (str(?{key_key}) = {key_value})"
+                key_terms = [
+                    Literal(value)._quote_encode()  # Literal.n3 would also be an option
+                    for value in key_values
+                ]
+                return f"str(?{key_key})", key_terms
             case xsd_type, None:
-                filter_clause = f"filter (?{key_key} = {key_value}^^<{xsd_type}>)"
+                key_terms = [
+                    Literal(value, datatype=xsd_type).n3() for value in key_values
+                ]
+                return f"?{key_key}", key_terms
             case None, lang_tag:
-                filter_clause = f"filter (?{key_key} = {key_value}@{lang_tag})"
+                key_terms = [
+                    Literal(str(value), lang=lang_tag).n3() for value in key_values
+                ]
+                return f"?{key_key}", key_terms
             case xsd_type, lang_tag:
                 raise ValueError(
                     "Parameters xsd_type and lang_tag are mutually exclusive."
@@ -71,7 +117,84 @@ class _ItemQueryConstructor:
             case _:  # pragma: no cover
                 assert False, "This should never happen."
 
-        return filter_clause
+    def _get_key_terms(self, key_key: str, key_values: list[Any]) -> list[str] | None:
+        """Compute N3 RDF terms for a VALUES clause.
+
+        The terms are None if VALUES lookups are not applicable,
+        i.e. for ItemLookup.FILTER, keys not bound by a triple pattern
+        or if the term kind is unknown.
+        """
+        if self.lookup == ItemLookup.FILTER or not self._is_pattern_bound(key_key):
+            return None
+
+        match (self.xsd_type, self.lang_tag):
+            case None, None:
+                (_key_key, _), *_ = self.key.items()
+                key_field = self.model.model_fields.get(_key_key)
+
+                if (
+                    key_field is None
+                    or not _is_iri_static_type(key_field.annotation)
+                    or not all(_is_valid_uri(str(value)) for value in key_values)
+                ):
+                    return None
+
+                return [URIRef(str(value)).n3() for value in key_values]
+            case xsd_type, None:
+                return [Literal(value, datatype=xsd_type).n3() for value in key_values]
+            case None, lang_tag:
+                return [Literal(str(value), lang=lang_tag).n3() for value in key_values]
+            case xsd_type, lang_tag:
+                raise ValueError(
+                    "Parameters xsd_type and lang_tag are mutually exclusive."
+                )
+            case _:  # pragma: no cover
+                assert False, "This should never happen."
+
+    def _is_pattern_bound(self, key_key: str) -> bool:
+        """Check if the key binding is bound in every solution of the query pattern."""
+        parsed_query: ParsedSPARQL = (
+            self._parsed_query
+            if isinstance(self._parsed_query, ParsedSPARQL)
+            else ParsedSPARQL(query=self._parsed_query)
+        )
+
+        return Variable(key_key) in parsed_query.pattern_variables
+
+    @staticmethod
+    def _get_values_clause(key_key: str, key_terms: list[str]) -> str:
+        """Compute a VALUES clause for SPARQL item query construction."""
+        return f"values ?{key_key} {{ {' '.join(key_terms)} }}"
+
+
+class _ItemsQueryConstructor(_ItemQueryConstructor):
+    """SPARQL query constructor for SPARQLModelAdapter.get_items.
+
+    The class encapsulates dynamic SPARQL query modification logic
+    for batch item requests according to multiple values of an ID key.
+
+    Keys are matched in a single FILTER clause with an IN expression
+    or bound in a single VALUES clause according to _ItemQueryConstructor semantics.
+    """
+
+    def get_items_query(self) -> str:
+        """Construct a SPARQL batch item query for use in rdfproxy.SPARQLModelAdapter."""
+        (_key_key, _key_values), *_ = self.key.items()
+        key_key = self.bindings_map[_key_key]
+
+        if (key_terms := self._get_key_terms(key_key, _key_values)) is not None:
+            return self.template.render(
+                head_injectant=self._get_values_clause(key_key, key_terms)
+            )
+
+        key_expression, key_terms = self._get_key_filter_terms(key_key, _key_values)
+
+        items_filter_clause = f"filter ({key_expression} in ({', '.join(key_terms)}))"
+        return self.template.render(tail_injectant=items_filter_clause)
+
+
+_KEYSET_ORDER_VARIABLE = "_rdfproxy_order"
+"Variable for the aggregated order value of groups in grouped keyset items queries."
 
 
 class _PageQueryConstructor:
@@ -80,17 +203,39 @@ class _PageQueryConstructor:
 
     Public methods get_items_query and get_count_query are used in rdfproxy.SPARQLModelAdapter
     to construct queries for retrieving arguments for Page object instantiation.
+
+    With keyset pagination, items queries are ordered by a list of keys
+    (the order_by binding followed by the group_by binding for grouped models
+    or all projected bindings for ungrouped models) and filtered on the key values
+    of the cursor instead of using OFFSET. For grouped models, groups are ordered
+    by the minimum (or maximum for descending order) order_by value of the group.
+    Keys must be bound in the WHERE clause of the query, projection aliases
+    (e.g. "(... AS ?x)") cannot be filtered on and raise a QueryConstructionException.
+    The language tags of the keys are bound and projected as well,
+    so cursors retain language-tagged key values (see get_cursor_values).
+
+    The query is passed as a string or as a ParsedSPARQL object;
+    the latter allows to reuse the parsed query across constructor instances.
     """
 
     def __init__(
         self,
-        query: str,
+        query: str | ParsedSPARQL,
         query_parameters: QueryParameters,
         model: type[_TModelInstance],
+        pagination: PaginationMode = PaginationMode.OFFSET,
     ) -> None:
-        self.query = query
+        self.parsed_query: ParsedSPARQL = (
+            query if isinstance(query, ParsedSPARQL) else ParsedSPARQL(query=query)
+        )
+        self.query: str = self.parsed_query.data
+        self.template: QueryTemplate = self.parsed_query.template
         self.query_parameters = query_parameters
         self.model = model
+        self.pagination = pagination
+
+        if query_parameters.cursor is not None and pagination != PaginationMode.KEYSET:
+            raise ValueError("Parameter 'cursor' requires keyset pagination.")
 
         self.bindings_map = FieldsBindingsMap(model)
         self.orderable_bindings_map = ModelSPARQLMap(model, recursive=True)
@@ -104,10 +249,23 @@ class _PageQueryConstructor:
             else self.orderable_bindings_map[self.query_parameters.order_by]
         )
 
+        self.keyset_keys: list[tuple[str, bool]] | None = (
+            self._compute_keyset_keys() if pagination == PaginationMode.KEYSET else None
+        )
+
+    @property
+    def cursor_variables(self) -> list[str] | None:
+        """Bindings holding the cursor key values or None for offset pagination."""
+        if self.keyset_keys is None:
+            return None
+        return [variable for variable, _ in self.keyset_keys]
+
     def get_items_query(self) -> str:
         """Construct a SPARQL items query for use in rdfproxy.SPARQLModelAdapter."""
         if self.group_by is None:
             return self._get_ungrouped_items_query()
+        if self._is_aggregated_keyset():
+            return self._get_aggregated_grouped_items_query()
         return self._get_grouped_items_query()
 
     def get_count_query(self) -> str:
@@ -117,7 +275,7 @@ class _PageQueryConstructor:
         else:
             select_clause = f"select (count(distinct ?{self.group_by}) as ?cnt)"
 
-        return replace_query_select_clause(self.query, select_clause)
+        return self.template.render(select_clause=select_clause)
 
     @staticmethod
     def _calculate_offset(page: int, size: int) -> int:
@@ -137,20 +295,23 @@ class _PageQueryConstructor:
         order_by_value: str = self._compute_order_by_value()
         limit, offset = self._compute_limit_offset()
 
-        subquery = compose_left(
-            remove_sparql_prefixes,
-            component(replace_query_select_clause, repl=select_clause),
-            component(inject_into_query, injectant=filter_clause),
-            component(
-                add_solution_modifier,
-                order_by=order_by_value,
-                limit=limit,
-                offset=offset,
+        subquery = add_solution_modifier(
+            self.template.unprefixed.render(
+                select_clause=select_clause, tail_injectant=filter_clause
             ),
-        )(self.query)
+            order_by=order_by_value,
+            limit=limit,
+            offset=offset,
+        )
 
         return add_solution_modifier(
-            inject_into_query(self.query, subquery), order_by=order_by_value
+            self.template.render(
+                select_clause=self._compute_cursor_select_clause(),
+                tail_injectant=self._join_clauses(
+                    f"{{{subquery}}}", self._compute_cursor_lang_clause()
+                ),
+            ),
+            order_by=order_by_value,
         )
 
     def _get_ungrouped_items_query(self) -> str:
@@ -159,19 +320,105 @@ class _PageQueryConstructor:
         order_by_value: str = self._compute_order_by_value()
         limit, offset = self._compute_limit_offset()
 
-        return compose_left(
-            component(inject_into_query, injectant=filter_clause),
-            component(
-                add_solution_modifier,
-                order_by=order_by_value,
-                limit=limit,
-                offset=offset,
+        return add_solution_modifier(
+            self.template.render(
+                select_clause=self._compute_cursor_select_clause(),
+                tail_injectant=self._join_clauses(
+                    filter_clause, self._compute_cursor_lang_clause()
+                ),
             ),
-        )(self.query)
+            order_by=order_by_value,
+            limit=limit,
+            offset=offset,
+        )
+
+    def _get_aggregated_grouped_items_query(self) -> str:
+        """Construct a SPARQL keyset items query for grouped models ordered by a non-group binding.
+
+        The group subquery aggregates the order_by binding per group,
+        the aggregated order value is projected for cursor construction.
+        """
+        assert self.group_by is not None and self.order_by is not None  # type narrow
+
+        aggregate = "max" if self.query_parameters.desc else "min"
+        filter_clause: str | None = self._compute_filter_clause()
+        order_by_value: str = self._compute_order_by_value()
+        limit, _ = self._compute_limit_offset()
+
+        group_subquery = add_solution_modifier(
+            self.template.unprefixed.render(
+                select_clause=(
+                    f"select ?{self.group_by} "
+                    f"({aggregate}(?{self.order_by}) as ?{_KEYSET_ORDER_VARIABLE})"
+                )
+            ),
+            group_by=f"?{self.group_by}",
+        )
+
+        subquery = add_solution_modifier(
+            f"select ?{self.group_by} ?{_KEYSET_ORDER_VARIABLE} "
+            f"where {{ {{{group_subquery}}} {filter_clause or ''} }}",
+            order_by=order_by_value,
+            limit=limit,
+        )
+
+        return add_solution_modifier(
+            self.template.render(
+                select_clause=self._compute_cursor_select_clause(),
+                tail_injectant=self._join_clauses(
+                    f"{{{subquery}}}", self._compute_cursor_lang_clause()
+                ),
+            ),
+            order_by=order_by_value,
+        )
+
+    def _compute_cursor_select_clause(self) -> str | None:
+        """Compute a SELECT clause projecting the cursor keys and their language tags.
+
+        The SELECT clause is None (i.e. unchanged) for offset pagination.
+        """
+        if self.keyset_keys is None:
+            return None
+
+        variables = [
+            _KEYSET_ORDER_VARIABLE
+            for variable, _ in self.keyset_keys
+            if variable == _KEYSET_ORDER_VARIABLE
+        ]
+        variables.extend(
+            get_cursor_lang_variable(variable) for variable, _ in self.keyset_keys
+        )
+
+        return self.template.get_select_clause(*variables)
 
-    def _compute_limit_offset(self) -> tuple[int, int]:
-        """Calculate limit and offset values for SPARQL-based pagination."""
+    def _compute_cursor_lang_clause(self) -> str | None:
+        """Compute BIND clauses for the language tags of the cursor keys.
+
+        The clause is None for offset pagination.
+        """
+        if self.keyset_keys is None:
+            return None
+
+        return " ".join(
+            f"bind (lang(?{variable}) as ?{get_cursor_lang_variable(variable)})"
+            for variable, _ in self.keyset_keys
+        )
+
+    @staticmethod
+    def _join_clauses(*clauses: str | None) -> str | None:
+        """Join optional query clauses; the result is None if no clause is given."""
+        return " ".join(filter(None, clauses)) or None
+
+    def _compute_limit_offset(self) -> tuple[int, int | None]:
+        """Calculate limit and offset values for SPARQL-based pagination.
+
+        Keyset pagination does not use OFFSET.
+        """
         limit = self.query_parameters.size
+
+        if self.pagination == PaginationMode.KEYSET:
+            return limit, None
+
         offset = self._calculate_offset(
             self.query_parameters.page, self.query_parameters.size
         )
@@ -179,8 +426,112 @@ class _PageQueryConstructor:
         return limit, offset
 
     def _compute_filter_clause(self) -> str | None:
-        """Stub: Always None for now."""
-        return None
+        """Compute a FILTER clause for keyset pagination.
+
+        The filter clause is None for offset pagination and for the first keyset page.
+        """
+        if self.query_parameters.cursor is None:
+            return None
+
+        assert self.keyset_keys is not None  # type narrow
+
+        cursor: list[_TCursorTerm] = decode_cursor(self.query_parameters.cursor)
+
+        if len(cursor) != len(self.keyset_keys):
+            raise ValueError("Cursor does not match the ordering of the query.")
+
+        # lexicographic keyset condition as a flat disjunction:
+        # (k1 after c1) || (k1 = c1 && k2 after c2) || ...
+        conditions: list[str] = []
+        equal_prefix: list[str] = []
+
+        for (variable, desc), value in zip(self.keyset_keys, cursor, strict=True):
+            conditions.extend(
+                " && ".join([*equal_prefix, condition])
+                for condition in self._compute_keyset_conditions(variable, desc, value)
+            )
+            equal_prefix.append(
+                f"!bound(?{variable})"
+                if value is None
+                else f"?{variable} = {value.n3()}"
+            )
+
+        condition = " || ".join(f"({condition})" for condition in conditions)
+        return f"filter ({condition or 'false'})"
+
+    @staticmethod
+    def _compute_keyset_conditions(
+        variable: str, desc: bool, value: _TCursorTerm
+    ) -> list[str]:
+        """Compute conditions for solutions ordered after the cursor value of a single key.
+
+        Following SPARQL ORDER BY semantics, unbound values are ordered first
+        (or last for descending order). IRIs and language-tagged literals
+        are compared by their string values.
+        """
+        if value is None:
+            return [] if desc else [f"bound(?{variable})"]
+
+        operator = "<" if desc else ">"
+
+        if isinstance(value, URIRef) or (
+            isinstance(value, Literal) and value.language is not None
+        ):
+            conditions = [f"str(?{variable}) {operator} {Literal(str(value)).n3()}"]
+        else:
+            conditions = [f"?{variable} {operator} {value.n3()}"]
+
+        if desc:
+            conditions.append(f"!bound(?{variable})")
+
+        return conditions
+
+    def _compute_keyset_keys(self) -> list[tuple[str, bool]]:
+        """Compute the (binding, descending) keys for keyset pagination."""
+        desc = bool(self.query_parameters.desc)
+        self._check_keyset_bindings()
+
+        if self.group_by is not None:
+            if self._is_aggregated_keyset():
+                return [(_KEYSET_ORDER_VARIABLE, desc), (self.group_by, False)]
+            return [(self.group_by, desc and self.order_by is not None)]
+
+        keys = [] if self.order_by is None else [(self.order_by, desc)]
+        projection = [
+            str(variable)
+            for variable in get_query_projection(self.parsed_query)
+            if str(variable) != self.order_by
+        ]
+
+        return keys + [(variable, False) for variable in projection]
+
+    def _check_keyset_bindings(self) -> None:
+        """Check that the key bindings for keyset pagination occur in the WHERE clause.
+
+        Cursor filters are applied in the WHERE clause, so keyset keys
+        cannot be projection aliases of the SELECT clause.
+        """
+        key_bindings = (
+            [self.group_by, self.order_by]
+            if self.group_by is not None
+            else [self.order_by, *map(str, get_query_projection(self.parsed_query))]
+        )
+
+        for binding in filter(None, key_bindings):
+            if Variable(binding) not in self.parsed_query.where_variables:
+                raise QueryConstructionException(
+                    f"Keyset pagination requires binding '{binding}' "
+                    "to be bound in the WHERE clause of the query."
+                )
+
+    def _is_aggregated_keyset(self) -> bool:
+        """Check if groups are ordered by an aggregated order_by value for keyset pagination."""
+        return (
+            self.pagination == PaginationMode.KEYSET
+            and self.group_by is not None
+            and self.order_by is not None
+            and self.order_by != self.group_by
+        )
 
     def _compute_select_clause(self):
         """Stub: Static SELECT clause for now."""
@@ -188,9 +539,15 @@ class _PageQueryConstructor:
 
     def _compute_order_by_value(self):
         """Compute a value for ORDER BY used in RDFProxy query modification."""
+        if self.keyset_keys is not None:
+            return " ".join(
+                f"{'DESC' if desc else 'ASC'}(?{variable})"
+                for variable, desc in self.keyset_keys
+            )
+
         match self.group_by, self.order_by:
             case None, None:
-                return f"?{get_query_projection(self.query)[0]}"
+                return f"?{get_query_projection(self.parsed_query)[0]}"
             case group_by, None:
                 return f"?{group_by}"
 
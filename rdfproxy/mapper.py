@@ -3,50 +3,51 @@
 import abc
 from collections.abc import Iterable, Iterator
 from itertools import chain
-from types import UnionType
-from typing import Any, cast, get_args
+from typing import Any
 import warnings
 
-import pandas as pd
-from pandas.api.typing import DataFrameGroupBy, SeriesGroupBy
 from pydantic import BaseModel
 from rdfproxy.utils._types import (
+    MapperEngine,
     ModelBoolPredicate,
     _TModelInstance,
     _TSPARQLBindingValue,
 )
 from rdfproxy.utils.checkers.model_checker import check_model
 from rdfproxy.utils.exceptions import InconsistentGroupingException
-from rdfproxy.utils.mapper_utils import get_model_bool_predicate
-from rdfproxy.utils.type_utils import (
-    _is_list_pydantic_model_static_type,
-    _is_list_static_type,
-    _is_pydantic_model_static_type,
-    _is_pydantic_model_union_static_type,
-    _is_sparql_bound_field_type,
+from rdfproxy.utils.frames import _BindingsFrame, get_bindings_frame_type
+from rdfproxy.utils.mapper_utils import (
+    _FieldDescriptor,
+    _FieldKind,
+    _ModelDescriptor,
+    get_model_descriptor,
+    get_model_key,
 )
-from rdfproxy.utils.utils import CurryModel, FieldsBindingsMap, _SENTINEL
+from rdfproxy.utils.utils import _SENTINEL
 
 
 class _ModelConstructor(abc.ABC):
     """ABC for RDFProxy ModelConstructors.
 
-    A ModelConstructor knows how to build a Pydantic model given a dataframe
-    (either a row-dataframe for ungrouped models or a group-dataframe for grouped models).
+    A ModelConstructor knows how to build a Pydantic model given a bindings frame
+    (either a row-frame for ungrouped models or a group-frame for grouped models).
+
+    Model metadata is looked up from the cached _ModelDescriptor of the model class.
+    Field values are collected first and validated once on model instantiation.
     """
 
     def __init__(
         self,
         model: type[BaseModel],
-        df: pd.DataFrame,
-        context: pd.DataFrame | None = None,
+        df: _BindingsFrame,
+        context: _BindingsFrame | None = None,
     ) -> None:
         self.model = model
         self.df = df
         self.context = df if context is None else context
 
-        self.alias_map = FieldsBindingsMap(model=model)
-        self.curried_model = CurryModel(model=model)
+        self.descriptor: _ModelDescriptor = get_model_descriptor(model)
+        self.alias_map = self.descriptor.alias_map
 
     @abc.abstractmethod
     def get_model(self) -> BaseModel:  # pragma: no cover
@@ -57,23 +58,22 @@ class _ModelConstructor(abc.ABC):
     def _get_constructor_type(model: type[BaseModel]) -> type["_ModelConstructor"]:
         """Get either an UngroupedModelConstructor or a GroupedModelConstructor given a model."""
         constructor: type[_ModelConstructor] = (
-            UngroupedModelConstructor
-            if model.model_config.get("group_by", _SENTINEL) is _SENTINEL
-            else GroupedModelConstructor
+            GroupedModelConstructor
+            if get_model_descriptor(model).grouped
+            else UngroupedModelConstructor
         )
 
         return constructor
 
-    def _get_model_union_field_value(self, model_union: UnionType, default: Any) -> Any:
+    def _get_model_union_field_value(
+        self, nested_model: type[BaseModel], default: Any
+    ) -> Any:
         """Resolve a model union and construct a model instance.
 
         The RDFProxy semantics for model unions are defined to instantiate
         the first model of a model union. Model union fields are required
         to define a default value and are checked against model_bool.
         """
-        nested_model: type[BaseModel] = next(
-            filter(_is_pydantic_model_static_type, get_args(model_union))
-        )
         constructor: type[_ModelConstructor] = self._get_constructor_type(
             model=nested_model
         )
@@ -81,9 +81,9 @@ class _ModelConstructor(abc.ABC):
             model=nested_model, df=self._partition_df(nested_model=nested_model)
         ).get_model()
 
-        model_bool_predicate: ModelBoolPredicate = get_model_bool_predicate(
-            nested_model_instance
-        )
+        model_bool_predicate: ModelBoolPredicate = get_model_descriptor(
+            nested_model
+        ).model_bool_predicate
 
         return (
             nested_model_instance
@@ -91,53 +91,34 @@ class _ModelConstructor(abc.ABC):
             else default
         )
 
-    def _get_scalar_field_value(self, field_name: str, default: Any):
+    def _get_scalar_field_value(self, field: _FieldDescriptor):
         """Get the field value for scalar type fields.
 
         Note that this assumes Non-Aggregated Field Sameness,
-        so only the first row of the dataframe is consulted for value retrieval.
+        so only the first row of the frame is consulted for value retrieval.
         See https://github.com/acdh-oeaw/rdfproxy/issues/243.
-
-        Note: Here, pd.Series.get must not use a None default,
-        because None can be a legit value in the series.
         """
-        _field_name = self.alias_map[field_name]
         return (
-            default
-            if (value := self.df.iloc[0].get(_field_name, _SENTINEL)) is _SENTINEL
+            field.default
+            if (value := self.df.get_first_value(field.binding)) is _SENTINEL
             else value
         )
 
-    def _partition_df(self, nested_model: type[BaseModel]) -> pd.DataFrame:
+    def _partition_df(self, nested_model: type[BaseModel]) -> _BindingsFrame:
         """Reverse-partition the context of an ungrouped model.
 
-        Ungrouped models operate on single-row dataframes;
+        Ungrouped models operate on single-row frames;
         if an ungrouped model has a grouped nested model,
-        the row-df must be reverse-partitioned against the most recent context
+        the row-frame must be reverse-partitioned against the most recent context
         according to the grouping key of the nested model.
 
-        For ungrouped models, the method simply returns the current dataframe.
-
-        Note: _partition_df uses a mask/bool-indexing for reverse partitioning,
-        I believe that this is more efficient than pd.DataFrame.groupby here.
+        For ungrouped models, the method simply returns the current frame.
         """
-        _group_by = nested_model.model_config.get("group_by", _SENTINEL)
-
-        if _group_by is _SENTINEL:
+        if (group_by := get_model_descriptor(nested_model).group_by) is None:
             return self.df
 
-        alias_map = FieldsBindingsMap(model=nested_model)
-
-        group_by = alias_map[_group_by]
-        group_value = self.df[group_by].values[0]
-
-        mask = (
-            self.context[group_by].isna()
-            if pd.isna(group_value)
-            else self.context[group_by] == group_value
-        )
-
-        return cast(pd.DataFrame, self.context[mask])
+        group_value = self.df.get_first_value(group_by)
+        return self.context.partition(group_by, group_value)
 
 
 class UngroupedModelConstructor(_ModelConstructor):
@@ -145,37 +126,31 @@ class UngroupedModelConstructor(_ModelConstructor):
 
     def get_model(self) -> BaseModel:
         """Run the UngroupedModelConstructor and instantiate a Pydantic model instance."""
+        field_values: dict[str, Any] = {}
 
-        for field_name, field_info in self.model.model_fields.items():
-            if _is_pydantic_model_static_type(field_info.annotation):
-                nested_model = field_info.annotation
-                constructor: type[_ModelConstructor] = self._get_constructor_type(
-                    model=nested_model
-                )
-
-                df: pd.DataFrame = self._partition_df(nested_model=nested_model)
+        for field in self.descriptor.fields:
+            match field.kind, field.nested_model:
+                case _FieldKind.MODEL, nested_model:
+                    constructor: type[_ModelConstructor] = self._get_constructor_type(
+                        model=nested_model
+                    )
 
-                field_value: BaseModel = constructor(
-                    model=nested_model, df=df, context=self.context
-                ).get_model()
+                    df: _BindingsFrame = self._partition_df(nested_model=nested_model)
 
-            elif _is_pydantic_model_union_static_type(
-                model_union := field_info.annotation
-            ):
-                field_value = self._get_model_union_field_value(
-                    model_union=model_union, default=field_info.default
-                )
-            else:
-                field_value = self._get_scalar_field_value(
-                    field_name=field_name, default=field_info.default
-                )
+                    field_value: BaseModel = constructor(
+                        model=nested_model, df=df, context=self.context
+                    ).get_model()
 
-            self.curried_model(**{field_name: field_value})
+                case _FieldKind.MODEL_UNION, nested_model:
+                    field_value = self._get_model_union_field_value(
+                        nested_model=nested_model, default=field.default
+                    )
+                case _:
+                    field_value = self._get_scalar_field_value(field=field)
 
-        model_instance = self.curried_model()
-        assert isinstance(model_instance, self.model)  # type narrow
+            field_values[field.name] = field_value
 
-        return model_instance
+        return self.model(**field_values)
 
 
 class GroupedModelConstructor(_ModelConstructor):
@@ -187,42 +162,36 @@ class GroupedModelConstructor(_ModelConstructor):
 
     def get_model(self) -> BaseModel:
         """Run the GroupedModelConstructor and instantiate a Pydantic model instance."""
+        field_values: dict[str, Any] = {}
 
-        for field_name, field_info in self.model.model_fields.items():
-            if _is_list_pydantic_model_static_type(field_info.annotation):
-                nested_model, *_ = get_args(field_info.annotation)
-                mapper = _ModelBindingsMapper(model=nested_model, bindings=self.df)
-                field_value = self._get_unique_models(iter(mapper.get_models()))
+        for field in self.descriptor.fields:
+            match field.kind, field.nested_model:
+                case _FieldKind.LIST_MODEL, nested_model:
+                    mapper = _ModelBindingsMapper(model=nested_model, bindings=self.df)
+                    field_value = self._get_unique_models(iter(mapper.get_models()))
 
-            elif _is_list_static_type(field_info.annotation):
-                _field_name = self.alias_map[field_name]
-                field_value = list(dict.fromkeys(self.df[_field_name].dropna()))
+                case _FieldKind.LIST, _:
+                    field_value = self.df.get_unique_values(field.binding)
 
-            elif _is_pydantic_model_static_type(nested_model := field_info.annotation):  # type: ignore
-                constructor: type[_ModelConstructor] = self._get_constructor_type(
-                    model=nested_model
-                )
-                field_value = constructor(
-                    model=nested_model,
-                    df=self.df,
-                ).get_model()
+                case _FieldKind.MODEL, nested_model:
+                    constructor: type[_ModelConstructor] = self._get_constructor_type(
+                        model=nested_model
+                    )
+                    field_value = constructor(
+                        model=nested_model,
+                        df=self.df,
+                    ).get_model()
 
-            elif _is_pydantic_model_union_static_type(
-                model_union := field_info.annotation
-            ):
-                field_value = self._get_model_union_field_value(
-                    model_union=model_union, default=field_info.default
-                )
-            else:
-                field_value = self._get_scalar_field_value(
-                    field_name=field_name, default=field_info.default
-                )
+                case _FieldKind.MODEL_UNION, nested_model:
+                    field_value = self._get_model_union_field_value(
+                        nested_model=nested_model, default=field.default
+                    )
+                case _:
+                    field_value = self._get_scalar_field_value(field=field)
 
-            self.curried_model(**{field_name: field_value})
+            field_values[field.name] = field_value
 
-        model_instance = self.curried_model()
-        assert isinstance(model_instance, self.model)  # type narrow
-        return model_instance
+        return self.model(**field_values)
 
     @staticmethod
     def _get_unique_models(models: Iterator[_TModelInstance]) -> list[_TModelInstance]:
@@ -231,28 +200,43 @@ class GroupedModelConstructor(_ModelConstructor):
         Note: Unless frozen=True is specified in a model class,
         Pydantic models instances are not hashable, i.e. dict.fromkeys
         is not feasible for acquiring ordered unique models.
+        Models are therefore deduplicated by their structural model key;
+        models with unhashable field values fall back to an equality scan.
 
         Note: StopIteration in _get_unique_models should be unreachable,
         because GroupedModelConstructor gets called on grouped dataframes
         and empty groups do not exist.
         """
-        unique_models = []
+        unique_models: list[_TModelInstance] = []
+        model_keys: set[tuple] = set()
 
         _model = next(models, None)
         assert _model is not None, "StopIteration should be unreachable"
 
-        model_bool_predicate: ModelBoolPredicate = get_model_bool_predicate(_model)
+        model_bool_predicate: ModelBoolPredicate = get_model_descriptor(
+            type(_model)
+        ).model_bool_predicate
 
         for model in chain([_model], models):
-            if (model not in unique_models) and (model_bool_predicate(model)):
-                unique_models.append(model)
+            if not model_bool_predicate(model):
+                continue
+
+            try:
+                if (model_key := get_model_key(model)) in model_keys:
+                    continue
+                model_keys.add(model_key)
+            except TypeError:
+                if model in unique_models:
+                    continue
+
+            unique_models.append(model)
 
         return unique_models
 
     def _check_grouping_consistency(self) -> None:
-        """Runs a check on a grouped dataframe in order to detect possible data integrity problems.
+        """Runs a check on a group frame in order to detect possible data integrity problems.
 
-        In a grouped dataframe, if there are distinct values across a column
+        In a group frame, if there are distinct values across a column
         for any field that is not the group key or an aggregation target,
         a data integrity problem is likely and data will be lost in that grouping operation.
 
@@ -266,18 +250,17 @@ class GroupedModelConstructor(_ModelConstructor):
         RDFProxy should probably use a _ConfigModel model internally
         or find another solution with dealing Pydantic's ConfigDict.
         """
-        enforce_grouping_consistency: bool = self.model.model_config.get(
-            "enforce_grouping_consistency", True
+        enforce_grouping_consistency: bool = (
+            self.descriptor.enforce_grouping_consistency
         )
 
-        for field_name, field_info in self.model.model_fields.items():
-            if not _is_sparql_bound_field_type(field_info.annotation):
+        for field in self.descriptor.fields:
+            if not field.sparql_bound:
                 continue
 
-            column_name: str = self.alias_map[field_name]
-            column: SeriesGroupBy = self.df[column_name]  # type: ignore
+            field_name, column_name = field.name, field.binding
 
-            if column.nunique(dropna=False) != 1:
+            if self.df.count_unique(column_name) != 1:
                 msg = (
                     "Grouped result set has distinct values for non-aggregated field "
                     f"'{field_name}' (column '{column_name}'). "
@@ -297,20 +280,24 @@ class _ModelBindingsMapper:
     combination with list-type annoted model fields as grouping
     and aggregation indicators. _ModelBindingsMapper applies this grammar
     for mapping flat bindings to potentially nested and grouped Pydantic models.
+
+    Bindings are mapped on a bindings frame of the given engine (see rdfproxy.MapperEngine);
+    bindings frames are passed through, e.g. for nested mappers.
     """
 
     def __init__(
         self,
         model: type[_TModelInstance],
-        bindings: Iterable[dict[str, _TSPARQLBindingValue]] | pd.DataFrame,
+        bindings: Iterable[dict[str, _TSPARQLBindingValue]] | _BindingsFrame,
+        engine: MapperEngine | str = MapperEngine.PANDAS,
     ) -> None:
         self.model = model
         self.bindings = bindings
 
-        self.df: pd.DataFrame = (
+        self.df: _BindingsFrame = (
             bindings
-            if isinstance(bindings, pd.DataFrame)
-            else pd.DataFrame(data=self.bindings, dtype=object)
+            if isinstance(bindings, _BindingsFrame)
+            else get_bindings_frame_type(engine).from_bindings(bindings)
         )
 
     def get_models(self) -> list[BaseModel]:
@@ -320,23 +307,15 @@ class _ModelBindingsMapper:
         return list(self._instantiate_models())
 
     def _instantiate_models(self) -> Iterator[BaseModel]:
-        _group_by = self.model.model_config.get("group_by", _SENTINEL)
+        group_by = get_model_descriptor(self.model).group_by
 
-        if _group_by is _SENTINEL:
-            for i in range(len(self.df)):
-                row_df = self.df.iloc[[i]]
+        if group_by is None:
+            for row_df in self.df.iter_rows():
                 yield UngroupedModelConstructor(
                     model=self.model, df=row_df, context=self.df
                 ).get_model()
         else:
-            alias_map = FieldsBindingsMap(model=self.model)
-
-            group_by = alias_map[_group_by]
-            group_by_object: DataFrameGroupBy = self.df.groupby(
-                group_by, sort=False, dropna=False
-            )
-
-            for _, group_df in group_by_object:
+            for group_df in self.df.iter_groups(group_by):
                 yield GroupedModelConstructor(model=self.model, df=group_df).get_model()
 
 
@@ -351,6 +330,7 @@ class ModelBindingsMapper(_ModelBindingsMapper):  # pragma: no cover
         self,
         model: type[_TModelInstance],
         bindings: Iterable[dict[str, _TSPARQLBindingValue]],
+        engine: MapperEngine | str = MapperEngine.PANDAS,
     ) -> None:
         checked_model = check_model(model)
-        super().__init__(model=checked_model, bindings=bindings)
+        super().__init__(model=checked_model, bindings=bindings, engine=engine)
@@ -1,139 +1,465 @@
 import asyncio
-from collections.abc import Iterator
-import json
-from typing import Any
+from collections import Counter
+from collections.abc import Coroutine, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+import os
+import threading
+from typing import Any, Literal, TypeAlias, TypeVar
+import weakref
 
 import httpx
-from rdflib import BNode, Graph, Literal, URIRef, XSD
+from rdflib import Graph
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.stores.sparqlstore import SPARQLStore
 from rdflib.query import Result as SPARQLQueryResult
+from rdfproxy.cache import QueryCache, get_cache_key
 from rdfproxy.utils._types import _TSPARQLBindingValue
-from rdfproxy.utils.utils import compose_left
+from rdfproxy.utils.results_utils import (
+    aget_bindings_from_json_stream,
+    get_bindings_from_json_response,
+    get_bindings_from_query_result,
+    get_bindings_from_tsv_response,
+    ijson,
+)
+from rdfproxy.utils.sparql_utils import _SPARQL_PARSER_LOCK
+
+
+T = TypeVar("T")
+
+_TResultFormat: TypeAlias = Literal["json", "tsv"]
+
+_result_formats: dict[str, str] = {
+    "json": "application/sparql-results+json",
+    "tsv": "text/tab-separated-values",
+}
+"""Mapping of result formats to Accept header values."""
+
+_worker_graph: Graph | None = None
+"Graph target of a SPARQLWrapper process pool worker."
+
+
+def _init_graph_worker(graph: Graph) -> None:
+    """Initializer for SPARQLWrapper process pool workers.
+
+    The graph is transferred once per worker process
+    (i.e. inherited with the fork start method or pickled once with spawn).
+    """
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _graph_worker_query(query: str) -> list[dict[str, _TSPARQLBindingValue]]:
+    """Run a query against the graph of a SPARQLWrapper process pool worker.
+
+    As in threads, the parser lock of the worker process is only held while preparing the query.
+    """
+    assert _worker_graph is not None, "Graph worker is not initialized."
+    return SPARQLWrapper._graph_query(_worker_graph, query)
+
+
+class _EventLoopThread:
+    """Daemon thread running a persistent asyncio event loop.
+
+    SPARQLWrapper runs synchronous calls on this loop instead of using asyncio.run,
+    because asyncio.run creates and closes an event loop per call
+    and therefore does not allow connection pools to outlive a single call.
+
+    A single loop thread is shared by all SPARQLWrapper instances of a process,
+    the pooled clients of the synchronous API are bound to this loop.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        """The event loop or None if the loop thread is not started."""
+        return self._loop
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop and lazily start the loop thread."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="rdfproxy-sparqlwrapper-loop",
+                    daemon=True,
+                ).start()
+
+                self._loop = loop
+
+            return self._loop
+
+    def _reset(self) -> None:
+        """Discard the event loop, e.g. in forked processes which do not inherit the loop thread."""
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop thread and block until it is done."""
+        return self.submit(coroutine).result()
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedule a coroutine on the loop thread without blocking."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop())
+
+
+_loop_thread = _EventLoopThread()
+"Event loop thread for the synchronous API of all SPARQLWrapper instances."
+
+os.register_at_fork(after_in_child=_loop_thread._reset)
+
+
+def _close_clients(
+    clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient],
+) -> None:
+    """Finalizer for the pooled clients of a garbage-collected SPARQLWrapper.
+
+    Closing the clients is scheduled on their event loops without blocking,
+    since finalizers can run on any thread, including an event loop thread.
+    """
+    for loop, client in list(clients.items()):
+        if not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
 
 
 class SPARQLWrapper:
-    """Simple httpx-based SPARQLWrapper implementaton for RDFProxy."""
+    """Simple httpx-based SPARQLWrapper implementaton for RDFProxy.
+
+    For remote targets, SPARQLWrapper owns long-lived httpx.AsyncClient instances,
+    so HTTP connections are pooled and kept alive across queries.
+    The connection pool can be configured with the limits and timeout parameters
+    or replaced entirely by passing a pre-configured httpx.AsyncClient.
+
+    The result_format parameter determines the result format requested from remote targets;
+    "tsv" is considerably more compact than the default "json" format
+    and produces the same Python-cast bindings. If the optional ijson dependency is installed,
+    "json" responses are parsed incrementally while streaming, which bounds peak memory
+    to the decoded bindings instead of the full response body and JSON document.
+
+    For rdflib.Graph targets, queries run in threads by default; only query parsing is serialized
+    across threads, but since RDFLib's SPARQL evaluation of in-memory graphs is pure Python
+    and holds the GIL, these queries do not run in parallel.
+    With graph_workers, queries run in a pool of worker processes instead.
+    The graph is transferred to each worker once when the pool starts,
+    so changes to the graph after the first query are not visible to the workers.
+
+    With a QueryCache (see rdfproxy.cache), decoded bindings are cached
+    keyed on the target and the final query string, so cache hits skip both I/O and parsing.
+    Graph targets are identified by their rdflib identifier and object identity,
+    so distinct Graph objects with the same identifier do not share cache entries.
+    Cached bindings of a Graph target are not invalidated when the graph is modified;
+    clear the cache after modifying a graph.
+
+    With coalesce_queries (default), concurrent identical queries on an event loop
+    are deduplicated: only the first query runs against the target
+    and its bindings are shared with all waiting callers.
+
+    Synchronous calls run on an event loop thread shared by all SPARQLWrapper instances
+    of a process, so SPARQLWrappers do not hold threads of their own.
+
+    SPARQLWrapper instances can be shared between SPARQLModelAdapters
+    and should be closed explicitly with SPARQLWrapper.close (or SPARQLWrapper.aclose)
+    or used as a (async) context manager; pooled clients of SPARQLWrapper instances
+    that are garbage-collected without being closed are closed by a finalizer.
+    """
+
+    def __init__(
+        self,
+        target: str | Graph,
+        *,
+        limits: httpx.Limits = httpx.Limits(
+            max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0
+        ),
+        timeout: httpx.Timeout | float | None = 5.0,
+        client: httpx.AsyncClient | None = None,
+        result_format: _TResultFormat = "json",
+        graph_workers: int | None = None,
+        cache: QueryCache | None = None,
+        coalesce_queries: bool = True,
+    ) -> None:
+        if result_format not in _result_formats:
+            raise ValueError(
+                f"Unsupported result format '{result_format}'. "
+                f"Applicable values: {', '.join(_result_formats)}."
+            )
 
-    def __init__(self, target: str | Graph):
         self.target = target
+        self.result_format = result_format
+        self.limits = limits
+        self.timeout = timeout
+        self.graph_workers = graph_workers
+        self.cache = cache
+        self.coalesce_queries = coalesce_queries
+
+        self._client = client
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+        self._in_flight: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            dict[str, asyncio.Future[list[dict[str, _TSPARQLBindingValue]]]],
+        ] = weakref.WeakKeyDictionary()
+        self._in_flight_waiters: Counter[asyncio.Future] = Counter()
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._process_pool_lock = threading.Lock()
+        self._cache_target: str = (
+            f"graph:{target.identifier}:{os.getpid()}:{id(target)}"
+            if isinstance(target, Graph)
+            else target
+        )
+
+        self._finalizer = weakref.finalize(self, _close_clients, self._clients)
+        self._finalizer.atexit = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
 
     def queries(self, *queries: str) -> list[Iterator[dict[str, _TSPARQLBindingValue]]]:
         """Synchronous wrapper for asynchronous SPARQL query execution.
 
         SPARQLWrapper.queries takes multiple SPARQL queries, runs them
         against a service and returns a list of result iterators.
+
+        Queries are run on the persistent event loop shared by SPARQLWrapper instances,
+        which allows to reuse pooled connections across calls.
         """
-        if isinstance(self.target, Graph):
-            queries_coroutine = self._aqueries_graph_object
-        elif isinstance(self.target, str):
-            queries_coroutine = self._aqueries_remote_endpoint
-        else:  # pragma: no cover
-            raise TypeError("Parameter 'target' expects argument of type str | Graph.")
+        return self.run(self.aqueries(*queries))
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the event loop of the synchronous API and block until it is done.
+
+        This allows synchronous callers (e.g. in several threads) to share
+        the pooled client and the in-flight state bound to that event loop.
+        """
+        return _loop_thread.run(coroutine)
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedule a coroutine on the event loop of the synchronous API without blocking.
 
-        return asyncio.run(queries_coroutine(*queries))
+        The returned concurrent.futures.Future allows to wait for the result from any thread;
+        cancelling the future cancels the coroutine.
+        """
+        return _loop_thread.submit(coroutine)
 
-    async def _aqueries_remote_endpoint(
+    async def aqueries(
         self, *queries: str
     ) -> list[Iterator[dict[str, _TSPARQLBindingValue]]]:
-        """Coroutine for running multiple queries against a remote target."""
-        assert isinstance(self.target, str)  # type narrow
+        """Asynchronous SPARQL query execution.
 
-        async with httpx.AsyncClient() as aclient, asyncio.TaskGroup() as tg:
-            tasks = [
-                tg.create_task(
-                    aclient.post(
-                        self.target,
-                        data={"output": "json", "query": query},
-                        headers={
-                            "Accept": "application/sparql-results+json",
-                        },
-                    )
-                )
-                for query in queries
-            ]
-
-        results: list[httpx.Response] = [task.result() for task in tasks]
-
-        python_results = map(
-            compose_left(
-                httpx.Response.raise_for_status,
-                httpx.Response.json,
-                self._get_bindings_from_json_response,
-            ),
-            results,
-        )
+        SPARQLWrapper.aqueries takes multiple SPARQL queries, runs them
+        concurrently on the running event loop and returns a list of result iterators.
 
-        return list(python_results)
+        If a query fails, the other queries are cancelled
+        and the exception of the first failed query is raised.
+        """
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(self._aquery(query)) for query in queries]
+        except ExceptionGroup as exception_group:
+            raise exception_group.exceptions[0]
 
-    @staticmethod
-    async def _agraph_query(graph: Graph, query: str) -> SPARQLQueryResult:
-        """Thin async-thread wrapper for rdflib.Graph.query."""
-        return await asyncio.to_thread(graph.query, query)
+        return [iter(task.result()) for task in tasks]
 
-    async def _aqueries_graph_object(
-        self, *queries: str
-    ) -> list[Iterator[dict[str, _TSPARQLBindingValue]]]:
-        """Coroutine for running multiple queries against an rdflib.Graph target.
+    def close(self) -> None:
+        """Close the HTTP client of the synchronous API.
 
-        Note that _aquery_graph_object wraps rdflib.Graph.query
-        in a separate thread using asyncio.to_thread.
+        Clients passed to SPARQLWrapper via the client parameter are not closed.
+        This also shuts down the process pool of graph_workers.
         """
+        if (loop := _loop_thread.loop) is not None and loop in self._clients:
+            _loop_thread.run(self._aclose_client())
+
+        self._shutdown_process_pool()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client bound to the running event loop.
+
+        Clients passed to SPARQLWrapper via the client parameter are not closed.
+        This also shuts down the process pool of graph_workers.
+        """
+        await self._aclose_client()
+        await asyncio.to_thread(self._shutdown_process_pool)
+
+    async def _aclose_client(self) -> None:
+        """Close the pooled client bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+
+        if (client := self._clients.pop(loop, None)) is not None:
+            await client.aclose()
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool for graph_workers and lazily start it."""
         assert isinstance(self.target, Graph)  # type narrow
 
-        tasks = [self._agraph_query(self.target, query) for query in queries]
-        results: list[SPARQLQueryResult] = await asyncio.gather(*tasks)
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.graph_workers,
+                    initializer=_init_graph_worker,
+                    initargs=(self.target,),
+                )
 
-        python_results = map(
-            compose_left(
-                lambda result: result.serialize(format="json"),
-                json.loads,
-                self._get_bindings_from_json_response,
-            ),
-            results,
-        )
+            return self._process_pool
 
-        return list(python_results)
+    def _shutdown_process_pool(self) -> None:
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+                self._process_pool = None
 
-    @staticmethod
-    def _get_bindings_from_json_response(
-        json_response: dict[str, Any],
-    ) -> Iterator[dict[str, _TSPARQLBindingValue]]:
-        """Get flat dicts from a SPARQL SELECT JSON response."""
-
-        variables = json_response["head"]["vars"]
-        response_bindings = json_response["results"]["bindings"]
-
-        def _get_binding_pairs(binding) -> Iterator[tuple[str, _TSPARQLBindingValue]]:
-            """Generate key value pairs from response_bindings.
-
-            The 'type' and 'datatype' fields of the JSON response
-            are examined to cast values to Python types according to RDFLib.
-            """
-            for var in variables:
-                if (binding_data := binding.get(var, None)) is None:
-                    yield (var, None)
-                    continue
-
-                match binding_data["type"]:
-                    case "uri":
-                        yield (var, URIRef(binding_data["value"]))
-                    case "literal":
-                        literal = Literal(
-                            binding_data["value"],
-                            datatype=binding_data.get("datatype", None),
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled httpx.AsyncClient for the running event loop.
+
+        httpx.AsyncClient connections are bound to the event loop they were opened in,
+        so SPARQLWrapper maintains a client per event loop.
+        """
+        if self._client is not None:
+            return self._client
+
+        loop = asyncio.get_running_loop()
+
+        if (client := self._clients.get(loop)) is None:
+            client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout)
+            self._clients[loop] = client
+
+        return client
+
+    async def _aquery(self, query: str) -> list[dict[str, _TSPARQLBindingValue]]:
+        """Coroutine for running a single query against the target.
+
+        If coalesce_queries is set, callers of an identical query that is already
+        in flight on the running event loop await the pending query instead.
+        The shared task is shielded, so cancelling one caller does not cancel
+        the query for the other callers; the query is only cancelled
+        once all of its callers are cancelled.
+        """
+        if not self.coalesce_queries:
+            return await self._aquery_cached(query)
+
+        loop = asyncio.get_running_loop()
+        in_flight = self._in_flight.setdefault(loop, {})
+
+        if (future := in_flight.get(query)) is None:
+            future = loop.create_task(self._aquery_cached(query))
+            in_flight[query] = future
+            future.add_done_callback(lambda _: in_flight.pop(query, None))
+
+        self._in_flight_waiters[future] += 1
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self._in_flight_waiters[future] -= 1
+            if not self._in_flight_waiters[future]:
+                del self._in_flight_waiters[future]
+                future.cancel()
+
+    async def _aquery_cached(self, query: str) -> list[dict[str, _TSPARQLBindingValue]]:
+        """Coroutine for running a single query against the target or the cache.
+
+        If a cache is set, cached bindings are returned for the target/query pair
+        and bindings of queries run against the target are cached.
+        Cache access runs through the QueryCache coroutines,
+        so blocking cache backends do not stall the event loop.
+        """
+        if self.cache is None:
+            return await self._aquery_target(query)
+
+        cache_key = get_cache_key(self._cache_target, query)
+
+        if (bindings := await self.cache.aget(cache_key)) is None:
+            bindings = await self._aquery_target(query)
+            await self.cache.aset(cache_key, bindings)
+
+        return bindings
+
+    async def _aquery_target(self, query: str) -> list[dict[str, _TSPARQLBindingValue]]:
+        """Dispatch a single query to the coroutine for the target type."""
+        if isinstance(self.target, Graph):
+            return await self._agraph_query(self.target, query)
+        elif isinstance(self.target, str):
+            return await self._aquery_remote_endpoint(query)
+        else:  # pragma: no cover
+            raise TypeError("Parameter 'target' expects argument of type str | Graph.")
+
+    async def _aquery_remote_endpoint(
+        self, query: str
+    ) -> list[dict[str, _TSPARQLBindingValue]]:
+        """Coroutine for running a single query against a remote target.
+
+        If ijson is available, JSON responses are streamed and parsed incrementally,
+        see aget_bindings_from_json_stream; otherwise the response body is decoded at once.
+        """
+        assert isinstance(self.target, str)  # type narrow
+
+        aclient = self._get_client()
+
+        async with aclient.stream(
+            "POST",
+            self.target,
+            data={"output": self.result_format, "query": query},
+            headers={
+                "Accept": _result_formats[self.result_format],
+            },
+        ) as response:
+            response.raise_for_status()
+
+            match self.result_format:
+                case "json" if ijson is not None:
+                    return [
+                        binding
+                        async for binding in aget_bindings_from_json_stream(
+                            response.aiter_bytes()
                         )
+                    ]
+                case "json":
+                    await response.aread()
+                    return list(get_bindings_from_json_response(response.json()))
+                case "tsv":
+                    await response.aread()
+                    return list(get_bindings_from_tsv_response(response.text))
+                case _:  # pragma: no cover
+                    assert False, "This should never happen."
 
-                        # call toPython in any case for validation
-                        literal_to_python = literal.toPython()
+    @staticmethod
+    def _graph_query(graph: Graph, query: str) -> list[dict[str, _TSPARQLBindingValue]]:
+        """Run rdflib.Graph.query and get Python-cast bindings.
+
+        RDFLib parses queries with pyparsing, which is not thread-safe,
+        so the query is prepared while holding the SPARQL parser lock;
+        query evaluation and result materialization run outside the lock.
+
+        SPARQLStore graphs pass query strings to the remote endpoint without parsing.
+        """
+        if isinstance(graph.store, SPARQLStore):
+            result: SPARQLQueryResult = graph.query(query)
+        else:
+            with _SPARQL_PARSER_LOCK:
+                prepared_query = prepareQuery(query, initNs=dict(graph.namespaces()))
+
+            result = graph.query(prepared_query)
 
-                        if literal.datatype in (XSD.gYear, XSD.gYearMonth):
-                            yield (var, literal)
-                        else:
-                            yield (var, literal_to_python)
+        return list(get_bindings_from_query_result(result))
 
-                    case "bnode":
-                        yield (var, BNode(binding_data["value"]))
-                    case _:  # pragma: no cover
-                        assert False, "This should never happen."
+    async def _agraph_query(
+        self, graph: Graph, query: str
+    ) -> list[dict[str, _TSPARQLBindingValue]]:
+        """Thin async-thread/process wrapper for rdflib.Graph.query."""
+        if self.graph_workers is None:
+            return await asyncio.to_thread(self._graph_query, graph, query)
 
-        for binding in response_bindings:
-            yield dict(_get_binding_pairs(binding))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_process_pool(), _graph_worker_query, query
+        )
@@ -3,16 +3,24 @@
 from collections import UserString
 import datetime
 import decimal
+from enum import StrEnum
+from functools import cached_property
 from typing import Generic, Protocol, TypeAlias, TypeVar, runtime_checkable
 from xml.dom.minidom import Document
 
 from pydantic import AnyUrl, BaseModel, ConfigDict as PydanticConfigDict
-from rdflib import BNode, Literal, URIRef
+from rdflib import BNode, Literal, URIRef, Variable
 from rdflib.compat import long_type
-from rdflib.plugins.sparql.parser import parseQuery
 from rdflib.plugins.sparql.parserutils import CompValue
 from rdflib.xsd_datetime import Duration
 from rdfproxy.utils.exceptions import QueryParseException
+from rdfproxy.utils.sparql_utils import (
+    QueryTemplate,
+    get_parse_object_pattern_variables,
+    get_parse_object_projection,
+    get_parse_object_where_variables,
+    parse_query,
+)
 
 
 _TModelInstance = TypeVar("_TModelInstance", bound=BaseModel)
@@ -61,20 +69,98 @@ class ConfigDict(PydanticConfigDict, total=False):
     model_bool: _TModelBoolValue
 
 
+class CountPolicy(StrEnum):
+    """Count query policies for SPARQLModelAdapter.get_page.
+
+    - always: run the count query for every page request
+    - cached: run the count query once and cache the total for count_ttl seconds
+    - disabled: do not run the count query; Page.total and Page.pages are None
+    """
+
+    ALWAYS = "always"
+    CACHED = "cached"
+    DISABLED = "disabled"
+
+
+class PaginationMode(StrEnum):
+    """Pagination modes for SPARQLModelAdapter.get_page.
+
+    - offset: paginate with LIMIT/OFFSET according to QueryParameters.page
+    - keyset: paginate with LIMIT and a filter on the keys of the last result
+      of the previous page according to QueryParameters.cursor/Page.next_cursor
+    """
+
+    OFFSET = "offset"
+    KEYSET = "keyset"
+
+
+class ItemLookup(StrEnum):
+    """Key lookup strategies for SPARQLModelAdapter.get_item/get_items.
+
+    - filter: match the key in a FILTER clause, by string value or
+      by RDF term comparison if xsd_type or lang_tag is given
+    - values: bind the key as an RDF term in a VALUES clause if the term kind is known
+      (xsd_type or lang_tag) or can be inferred from the model field type (IRI types),
+      which allows triplestores to use their term indexes; other keys and keys
+      not bound by a triple pattern of the query (e.g. by BIND or OPTIONAL) use filter
+    """
+
+    FILTER = "filter"
+    VALUES = "values"
+
+
+class MapperEngine(StrEnum):
+    """Mapper engines for mapping SPARQL bindings to models in SPARQLModelAdapter.
+
+    - pandas: map bindings based on pandas DataFrames (reference implementation)
+    - python: map bindings based on plain lists/dicts and hash-based grouping;
+      this engine does not import pandas and has less per-call overhead for small result sets
+    """
+
+    PANDAS = "pandas"
+    PYTHON = "python"
+
+
 _TQuery = TypeVar("_TQuery", bound=str)
 
 
 class ParsedSPARQL(Generic[_TQuery], UserString):
-    """UserString for encapsulating parsed SPARQL queries."""
+    """UserString for encapsulating parsed SPARQL queries.
+
+    ParsedSPARQL objects parse a query once and lazily cache derived query parts,
+    so query construction does not require reparsing the query.
+    Note that UserString operations construct (and parse) new ParsedSPARQL objects;
+    use ParsedSPARQL.data for string operations.
+    """
 
     def __init__(self, query: _TQuery) -> None:
         self.data: _TQuery = query
         self.parse_object: CompValue = self._get_parse_object(query)
 
+    @cached_property
+    def projection(self) -> list[Variable]:
+        """The ordered bindings projection of the query."""
+        return get_parse_object_projection(self.parse_object)
+
+    @cached_property
+    def pattern_variables(self) -> set[Variable]:
+        """The variables bound in every solution of the WHERE clause of the query."""
+        return get_parse_object_pattern_variables(self.parse_object)
+
+    @cached_property
+    def where_variables(self) -> set[Variable]:
+        """The variables occurring in the WHERE clause of the query."""
+        return get_parse_object_where_variables(self.parse_object)
+
+    @cached_property
+    def template(self) -> QueryTemplate:
+        """The QueryTemplate for rendering queries derived from the query."""
+        return QueryTemplate(self.data)
+
     @staticmethod
     def _get_parse_object(query: str) -> CompValue:
         try:
-            _parsed = parseQuery(query)
+            _parsed = parse_query(query)
         except Exception as e:
             raise QueryParseException(e) from e
         else:
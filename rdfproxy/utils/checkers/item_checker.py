@@ -1,8 +1,11 @@
-"""Checker definitions for SPARQLModelAdapter.get_item."""
+"""Checker definitions for SPARQLModelAdapter.get_item and SPARQLModelAdapter.get_items."""
 
+from collections import defaultdict
+from collections.abc import Iterable
 from typing import Any
 
-from rdfproxy.utils._types import _TModelInstance
+from pydantic import TypeAdapter, ValidationError
+from rdfproxy.utils._types import ParsedSPARQL, _TModelInstance
 from rdfproxy.utils.exceptions import (
     MultipleResultsFound,
     NoResultsFound,
@@ -13,7 +16,7 @@ from rdfproxy.utils.utils import FieldsBindingsMap
 
 
 def check_key(
-    key: dict[str, Any], query: str, model: type[_TModelInstance]
+    key: dict[str, Any], query: str | ParsedSPARQL, model: type[_TModelInstance]
 ) -> dict[str, Any]:
     """Check a given model ID key.
 
@@ -56,3 +59,71 @@ def check_item_model(
             )
         case _:  # pragma: no cover
             assert False, "This should never happen."
+
+
+def check_items_key(
+    key: dict[str, Iterable[Any]],
+    query: str | ParsedSPARQL,
+    model: type[_TModelInstance],
+) -> dict[str, list[Any]]:
+    """Check a given model ID key with multiple values.
+
+    Additionally to the constraints of check_key,
+    the key value must be an iterable of (hashable) key values.
+    """
+    check_key(key=key, query=query, model=model)
+
+    (k, values), *_ = key.items()
+
+    if isinstance(values, str | bytes) or not isinstance(values, Iterable):
+        raise TypeError(f"Expected an iterable of key values. Got {values!r}.")
+
+    return {k: list(dict.fromkeys(values))}
+
+
+def check_items_models(
+    models: list[_TModelInstance],
+    model_type: type[_TModelInstance],
+    key: dict[str, list[Any]],
+) -> dict[Any, _TModelInstance | NoResultsFound | MultipleResultsFound]:
+    """Check the _ModelBindingsMapper result for batch model retrieval.
+
+    Models are assigned to key values by comparing the string representations
+    of the model key field and the key value, also trying the key value
+    as validated against the key field type (e.g. 1 for "1" with int fields).
+
+    Missing or duplicate results are reported per key value
+    as NoResultsFound or MultipleResultsFound exception instances.
+    """
+    (key_field, key_values), *_ = key.items()
+    type_adapter = TypeAdapter(model_type.model_fields[key_field].annotation)
+
+    models_by_key: defaultdict[str, list[_TModelInstance]] = defaultdict(list)
+
+    for model in models:
+        models_by_key[str(getattr(model, key_field))].append(model)
+
+    def _get_key_models(key_value: Any) -> list[_TModelInstance]:
+        if key_models := models_by_key.get(str(key_value)):
+            return key_models
+
+        try:
+            validated_key_value = type_adapter.validate_python(key_value)
+        except ValidationError:
+            return []
+
+        return models_by_key.get(str(validated_key_value), [])
+
+    results: dict[Any, _TModelInstance | NoResultsFound | MultipleResultsFound] = {}
+
+    for key_value in key_values:
+        try:
+            results[key_value] = check_item_model(
+                models=_get_key_models(key_value),
+                model_type=model_type,
+                key={key_field: key_value},
+            )
+        except (NoResultsFound, MultipleResultsFound) as e:
+            results[key_value] = e
+
+    return results
@@ -44,14 +44,18 @@ def _check_solution_modifiers(parsed_sparql: ParsedSPARQL) -> ParsedSPARQL:
     return parsed_sparql
 
 
-def check_query(query: _TQuery) -> _TQuery:
-    """Check a SPARQL query by running a compose pipeline of checks."""
-    logger.debug("Running query check pipeline on '%s'", query)
-    parsed_sparql = ParsedSPARQL(query=query)
+def check_parsed_query(parsed_sparql: ParsedSPARQL[_TQuery]) -> ParsedSPARQL[_TQuery]:
+    """Check a parsed SPARQL query by running a compose pipeline of checks."""
+    logger.debug("Running query check pipeline on '%s'", parsed_sparql)
 
     result: ParsedSPARQL = compose_left(
         _check_select_query,
         _check_solution_modifiers,
     )(parsed_sparql)
 
-    return result.data
+    return result
+
+
+def check_query(query: _TQuery) -> _TQuery:
+    """Check a SPARQL query by running a compose pipeline of checks."""
+    return check_parsed_query(ParsedSPARQL(query=query)).data
@@ -0,0 +1,117 @@
+"""Functionality for opaque keyset pagination cursors."""
+
+import base64
+import binascii
+import json
+
+from rdflib import BNode, Literal, URIRef
+from rdfproxy.utils._types import _TSPARQLBindingValue
+
+
+_TCursorTerm = URIRef | Literal | None
+
+
+def get_cursor_lang_variable(variable: str) -> str:
+    """Get the variable holding the language tag of a cursor key binding in keyset items queries."""
+    return f"_rdfproxy_lang_{variable}"
+
+
+def get_cursor_values(
+    binding: dict[str, _TSPARQLBindingValue], variables: list[str]
+) -> list[_TSPARQLBindingValue]:
+    """Get the cursor key values of a binding.
+
+    Python-cast bindings do not retain language tags, so language-tagged key values
+    are restored as rdflib.Literal from the language tag bindings of keyset items queries
+    (see get_cursor_lang_variable).
+    """
+    values: list[_TSPARQLBindingValue] = []
+
+    for variable in variables:
+        value = binding.get(variable)
+
+        if lang := binding.get(get_cursor_lang_variable(variable)):
+            value = Literal(str(value), lang=str(lang))
+
+        values.append(value)
+
+    return values
+
+
+def _get_cursor_term(value: _TSPARQLBindingValue) -> _TCursorTerm:
+    """Convert a Python-cast binding value back to an RDF term for a cursor."""
+    match value:
+        case None | URIRef() | Literal():
+            return value
+        case BNode():
+            raise ValueError("Unable to construct cursor for blank node keys.")
+        case _:
+            return Literal(value)
+
+
+def encode_cursor(values: list[_TSPARQLBindingValue]) -> str:
+    """Encode the key values of the last result of a page as an opaque cursor.
+
+    Key values are serialized in the SPARQL JSON results term format,
+    unbound key values are serialized as null.
+    """
+    terms: list[dict[str, str] | None] = []
+
+    for term in map(_get_cursor_term, values):
+        match term:
+            case None:
+                terms.append(None)
+            case URIRef():
+                terms.append({"type": "uri", "value": str(term)})
+            case Literal(language=str() as lang):
+                terms.append({"type": "literal", "value": str(term), "xml:lang": lang})
+            case Literal(datatype=URIRef() as datatype):
+                terms.append(
+                    {"type": "literal", "value": str(term), "datatype": str(datatype)}
+                )
+            case _:
+                terms.append({"type": "literal", "value": str(term)})
+
+    return base64.urlsafe_b64encode(
+        json.dumps(terms, separators=(",", ":")).encode()
+    ).decode()
+
+
+def _decode_cursor_term(term: dict | None) -> _TCursorTerm:
+    """Construct and validate an RDF term from a decoded cursor term."""
+    match term:
+        case None:
+            return None
+        case {"type": "uri", "value": str(value)}:
+            uri = URIRef(value)
+            uri.n3()  # raises for IRIs that cannot be serialized safely
+            return uri
+        case {"type": "literal", "value": str(value), "xml:lang": str(lang)}:
+            return Literal(value, lang=lang)
+        case {"type": "literal", "value": str(value), "datatype": str(datatype)}:
+            _datatype = URIRef(datatype)
+            _datatype.n3()
+            return Literal(value, datatype=_datatype)
+        case {"type": "literal", "value": str(value)}:
+            return Literal(value)
+        case _:
+            raise ValueError(f"Invalid cursor term: {term}.")
+
+
+def decode_cursor(cursor: str) -> list[_TCursorTerm]:
+    """Decode an opaque cursor into RDF terms.
+
+    Cursors are client input; decoded terms are validated to be safely serializable as N3.
+    """
+    try:
+        terms = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Unable to decode cursor.") from e
+
+    if not isinstance(terms, list):
+        raise ValueError("Unable to decode cursor.")
+
+    try:
+        return [_decode_cursor_term(term) for term in terms]
+    except Exception as e:
+        raise ValueError("Invalid cursor.") from e
@@ -0,0 +1,230 @@
+"""Bindings frames: tabular bindings backends for rdfproxy.mapper."""
+
+import abc
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from itertools import chain
+from typing import Any, Self
+
+from rdfproxy.utils._types import MapperEngine, _TSPARQLBindingValue
+from rdfproxy.utils.utils import _SENTINEL
+
+
+class _BindingsFrame(abc.ABC):
+    """ABC for tabular representations of SPARQL bindings used in rdfproxy.mapper.
+
+    A bindings frame implements the table operations required for model construction,
+    i.e. row and group iteration, first-row lookup, reverse partitioning
+    and column aggregation. Missing (NA) values are None and NaN values.
+    """
+
+    @classmethod
+    @abc.abstractmethod
+    def from_bindings(
+        cls, bindings: Iterable[dict[str, _TSPARQLBindingValue]]
+    ) -> Self:  # pragma: no cover
+        """Construct a bindings frame from bindings."""
+        return NotImplemented
+
+    @property
+    @abc.abstractmethod
+    def empty(self) -> bool:  # pragma: no cover
+        """Indicate whether the frame has no rows or no columns."""
+        return NotImplemented
+
+    @abc.abstractmethod
+    def iter_rows(self) -> Iterator["_BindingsFrame"]:  # pragma: no cover
+        """Iterate over single-row frames.
+
+        Row frames need not be of the type of the frame, e.g. for row-oriented fast paths.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    def iter_groups(self, column: str) -> Iterator[Self]:  # pragma: no cover
+        """Iterate over frames grouped by the values of a column in first-seen order.
+
+        NA values form a single group.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    def get_first_value(self, column: str) -> Any:  # pragma: no cover
+        """Get the value of a column in the first row or _SENTINEL if the column does not exist."""
+        return NotImplemented
+
+    @abc.abstractmethod
+    def get_unique_values(self, column: str) -> list:  # pragma: no cover
+        """Get the unique non-NA values of a column in first-seen order."""
+        return NotImplemented
+
+    @abc.abstractmethod
+    def count_unique(self, column: str) -> int:  # pragma: no cover
+        """Count the unique values of a column including NA values."""
+        return NotImplemented
+
+    @abc.abstractmethod
+    def partition(self, column: str, value: Any) -> Self:  # pragma: no cover
+        """Get a frame of the rows with a given (or NA) value in a column.
+
+        Partitions are looked up from a group index per column
+        that is built once per frame (see _get_group_index).
+        """
+        return NotImplemented
+
+
+class _NAType:
+    """Type for the hash key of NA values in bindings frames."""
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return "NA"
+
+
+_NA = _NAType()
+
+
+def _is_na(value: Any) -> bool:
+    """Check if a value is None or NaN."""
+    return value is None or (isinstance(value, float | Decimal) and value != value)
+
+
+def _get_key(value: Any) -> Any:
+    """Get a hash key for a value that collapses NA values."""
+    return _NA if _is_na(value) else value
+
+
+def _get_group_index(values: Iterable[Any]) -> dict[Any, list[int]] | None:
+    """Get a mapping of value keys to row positions in first-seen order.
+
+    The group index is None if any value is unhashable.
+    """
+    group_index: dict[Any, list[int]] = {}
+
+    try:
+        for position, value in enumerate(values):
+            group_index.setdefault(_get_key(value), []).append(position)
+    except TypeError:
+        return None
+
+    return group_index
+
+
+class _PythonBindingsFrame(_BindingsFrame):
+    """Bindings frame based on plain lists of row tuples.
+
+    Row values are stored as tuples in column order; columns map column names
+    to tuple positions, so column lookups are a dict lookup and a tuple index.
+    Frames derived from a frame (rows, groups, partitions) share the column positions.
+
+    Columns are the union of binding keys in first-seen order.
+    Note that for bindings lacking a key of the column union,
+    the value is None (pandas would use NaN); SPARQLWrapper bindings
+    always hold all projected bindings.
+    """
+
+    def __init__(self, rows: list[tuple], columns: dict[str, int]) -> None:
+        self.rows = rows
+        self.columns = columns
+
+        self._group_indexes: dict[str, dict[Any, list[int]] | None] = {}
+        self._partitions: dict[str, dict[Any, Self]] = {}
+
+    def __repr__(self) -> str:
+        return "\n".join(str(dict(zip(self.columns, row))) for row in self.rows)
+
+    @classmethod
+    def from_bindings(cls, bindings: Iterable[dict[str, _TSPARQLBindingValue]]) -> Self:
+        _bindings = list(bindings)
+        columns = {
+            column: position
+            for position, column in enumerate(
+                dict.fromkeys(chain.from_iterable(_bindings))
+            )
+        }
+        rows = [
+            tuple(binding.get(column) for column in columns) for binding in _bindings
+        ]
+
+        return cls(rows=rows, columns=columns)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.rows and self.columns)
+
+    def iter_rows(self) -> Iterator[Self]:
+        for row in self.rows:
+            yield type(self)(rows=[row], columns=self.columns)
+
+    def iter_groups(self, column: str) -> Iterator[Self]:
+        position = self.columns[column]
+        groups: dict[Any, list[tuple]] = {}
+
+        for row in self.rows:
+            groups.setdefault(_get_key(row[position]), []).append(row)
+
+        for rows in groups.values():
+            yield type(self)(rows=rows, columns=self.columns)
+
+    def get_first_value(self, column: str) -> Any:
+        if (position := self.columns.get(column)) is None:
+            return _SENTINEL
+        return self.rows[0][position]
+
+    def get_unique_values(self, column: str) -> list:
+        position = self.columns[column]
+        values = (row[position] for row in self.rows)
+        return list(dict.fromkeys(value for value in values if not _is_na(value)))
+
+    def count_unique(self, column: str) -> int:
+        position = self.columns[column]
+        return len({_get_key(row[position]) for row in self.rows})
+
+    def partition(self, column: str, value: Any) -> Self:
+        position = self.columns[column]
+
+        if (group_index := self._get_group_index(column)) is not None:
+            key = _get_key(value)
+            partitions = self._partitions.setdefault(column, {})
+
+            if (partition := partitions.get(key)) is None:
+                partition = partitions[key] = type(self)(
+                    rows=[self.rows[i] for i in group_index.get(key, [])],
+                    columns=self.columns,
+                )
+
+            return partition
+
+        if _is_na(value):
+            rows = [row for row in self.rows if _is_na(row[position])]
+        else:
+            rows = [row for row in self.rows if row[position] == value]
+
+        return type(self)(rows=rows, columns=self.columns)
+
+    def _get_group_index(self, column: str) -> dict[Any, list[int]] | None:
+        """Get the cached group index of a column, see rdfproxy.utils.frames._get_group_index."""
+        if column not in self._group_indexes:
+            position = self.columns[column]
+            self._group_indexes[column] = _get_group_index(
+                row[position] for row in self.rows
+            )
+
+        return self._group_indexes[column]
+
+
+def get_bindings_frame_type(
+    engine: MapperEngine | str,
+) -> type[_BindingsFrame]:
+    """Get the bindings frame type for a mapper engine.
+
+    The pandas bindings frame is imported lazily, so pandas is only imported if used.
+    """
+    match MapperEngine(engine):
+        case MapperEngine.PANDAS:
+            from rdfproxy.utils.pandas_frames import _PandasBindingsFrame
+
+            return _PandasBindingsFrame
+        case MapperEngine.PYTHON:
+            return _PythonBindingsFrame
+        case _:  # pragma: no cover
+            assert False, "This should never happen."
@@ -1,5 +1,19 @@
+"""Functionality for rdfproxy.mapper."""
+
+from enum import Enum, auto
+from functools import cache
+from typing import Any, NamedTuple, get_args
+
 from pydantic import BaseModel
 from rdfproxy.utils._types import ModelBoolPredicate, _TModelBoolValue
+from rdfproxy.utils.type_utils import (
+    _is_list_pydantic_model_static_type,
+    _is_list_static_type,
+    _is_pydantic_model_static_type,
+    _is_pydantic_model_union_static_type,
+    _is_sparql_bound_field_type,
+)
+from rdfproxy.utils.utils import FieldsBindingsMap, _SENTINEL
 
 
 def default_model_bool_predicate(model: BaseModel) -> bool:
@@ -35,3 +49,128 @@ def get_model_bool_predicate(model: type[BaseModel] | BaseModel) -> ModelBoolPre
         )
 
     return model_bool_predicate
+
+
+def _get_value_key(value: Any) -> Any:
+    """Get a structural key for a model field value.
+
+    Keys compare equal if the values compare equal;
+    the key is unhashable if the value contains unhashable leaf values.
+    """
+    match value:
+        case BaseModel():
+            return get_model_key(value)
+        case list() | tuple():
+            return (type(value), tuple(map(_get_value_key, value)))
+        case set() | frozenset():
+            return frozenset(map(_get_value_key, value))
+        case dict():
+            return frozenset(
+                (key, _get_value_key(_value)) for key, _value in value.items()
+            )
+        case _:
+            return value
+
+
+def get_model_key(model: BaseModel) -> tuple:
+    """Get a structural key for a model instance.
+
+    Model keys allow hash-based lookup for Pydantic model instances,
+    which are not hashable unless frozen=True is specified.
+    The key reflects the values compared in BaseModel.__eq__.
+    """
+    return (
+        type(model),
+        _get_value_key(model.__dict__),
+        _get_value_key(model.__pydantic_extra__),
+    )
+
+
+class _FieldKind(Enum):
+    """Kinds of model fields for model construction in rdfproxy.mapper.
+
+    Kinds are determined in the precedence order of GroupedModelConstructor;
+    for ungrouped models, list kinds are constructed like scalars.
+    """
+
+    LIST_MODEL = auto()
+    LIST = auto()
+    MODEL = auto()
+    MODEL_UNION = auto()
+    SCALAR = auto()
+
+
+class _FieldDescriptor(NamedTuple):
+    name: str
+    binding: str
+    kind: _FieldKind
+    default: Any
+    nested_model: type[BaseModel] | None
+    sparql_bound: bool
+
+
+def _get_field_kind(annotation: Any) -> tuple[_FieldKind, type[BaseModel] | None]:
+    """Get the field kind and the nested model (if any) of a field annotation."""
+    if _is_list_pydantic_model_static_type(annotation):
+        nested_model, *_ = get_args(annotation)
+        return _FieldKind.LIST_MODEL, nested_model
+    if _is_list_static_type(annotation):
+        return _FieldKind.LIST, None
+    if _is_pydantic_model_static_type(annotation):
+        return _FieldKind.MODEL, annotation
+    if _is_pydantic_model_union_static_type(annotation):
+        nested_model = next(
+            filter(_is_pydantic_model_static_type, get_args(annotation))
+        )
+        return _FieldKind.MODEL_UNION, nested_model
+    return _FieldKind.SCALAR, None
+
+
+class _ModelDescriptor:
+    """Compiled model metadata for model construction in rdfproxy.mapper.
+
+    A _ModelDescriptor holds the alias map, field kinds, nested models,
+    the (de-aliased) group key and the model_bool predicate of a model class,
+    so that model metadata is not recomputed for every row/group.
+    Use get_model_descriptor for cached _ModelDescriptor instances.
+    """
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self.model = model
+        self.alias_map = FieldsBindingsMap(model=model)
+
+        _group_by = model.model_config.get("group_by", _SENTINEL)
+        self.grouped: bool = _group_by is not _SENTINEL
+        self.group_by: str | None = self.alias_map[_group_by] if self.grouped else None
+
+        self.enforce_grouping_consistency: bool = model.model_config.get(
+            "enforce_grouping_consistency", True
+        )
+        self.model_bool_predicate: ModelBoolPredicate = get_model_bool_predicate(model)
+
+        self.fields: tuple[_FieldDescriptor, ...] = tuple(
+            self._get_field_descriptor(
+                field_name, field_info.annotation, field_info.default
+            )
+            for field_name, field_info in model.model_fields.items()
+        )
+
+    def _get_field_descriptor(
+        self, field_name: str, annotation: Any, default: Any
+    ) -> _FieldDescriptor:
+        kind, nested_model = _get_field_kind(annotation)
+
+        return _FieldDescriptor(
+            name=field_name,
+            binding=self.alias_map[field_name],
+            kind=kind,
+            default=default,
+            nested_model=nested_model,
+            sparql_bound=_is_sparql_bound_field_type(annotation),
+        )
+
+
+@cache
+def get_model_descriptor(model: type[BaseModel]) -> _ModelDescriptor:
+    """Get the cached _ModelDescriptor for a model class."""
+    return _ModelDescriptor(model)
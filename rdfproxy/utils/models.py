@@ -3,8 +3,9 @@
 from enum import StrEnum
 from typing import Any, Generic
 
-from pydantic import BaseModel, Field, create_model, model_validator
+from pydantic import BaseModel, Field, create_model, field_validator, model_validator
 from rdfproxy.utils._types import _TModelInstance
+from rdfproxy.utils.cursor_utils import decode_cursor
 from rdfproxy.utils.utils import ModelSPARQLMap
 
 
@@ -16,13 +17,20 @@ class Page(BaseModel, Generic[_TModelInstance]):
 
     Also see https://docs.pydantic.dev/latest/concepts/models/#generic-models
     for Generic Pydantic models.
+
+    Fields total and pages are None if the count query is disabled,
+    see rdfproxy.CountPolicy.
+
+    With keyset pagination, next_cursor holds an opaque cursor for the next page
+    and is None for the last page, see rdfproxy.PaginationMode.
     """
 
     items: list[_TModelInstance]
     page: int
     size: int
-    total: int
-    pages: int
+    total: int | None = None
+    pages: int | None = None
+    next_cursor: str | None = None
 
 
 class QueryParameters(BaseModel):
@@ -37,6 +45,20 @@ class QueryParameters(BaseModel):
     order_by: str | None = Field(default=None)
     desc: bool | None = Field(default=None)
 
+    cursor: str | None = Field(default=None)
+
+    @field_validator("cursor")
+    @classmethod
+    def _check_cursor(cls, value: str | None) -> str | None:
+        """Validator for checking that a cursor can be decoded.
+
+        Cursors are opaque to clients and only applicable with keyset pagination;
+        the page field is ignored for keyset pagination.
+        """
+        if value is not None:
+            decode_cursor(value)
+        return value
+
     @model_validator(mode="after")
     @classmethod
     def _check_order_by_desc_dependency(cls, data: Any) -> Any:
@@ -0,0 +1,99 @@
+"""Bindings frame based on pandas DataFrames for rdfproxy.mapper."""
+
+from collections.abc import Iterable, Iterator
+from typing import Any, Self, cast
+
+import pandas as pd
+from pandas.api.typing import DataFrameGroupBy
+from rdfproxy.utils._types import _TSPARQLBindingValue
+from rdfproxy.utils.frames import (
+    _BindingsFrame,
+    _get_group_index,
+    _get_key,
+    _PythonBindingsFrame,
+)
+from rdfproxy.utils.utils import _SENTINEL
+
+
+class _PandasBindingsFrame(_BindingsFrame):
+    """Bindings frame based on pandas DataFrames.
+
+    This is the reference implementation for bindings frames.
+
+    Rows are iterated as single-row _PythonBindingsFrame objects holding the row tuples
+    of the DataFrame with precomputed column positions, which avoids DataFrame slicing
+    and pd.Series construction per row and field for ungrouped models.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+
+        self._group_indexes: dict[str, dict[Any, list[int]] | None] = {}
+        self._partitions: dict[str, dict[Any, Self]] = {}
+
+    def __repr__(self) -> str:
+        return str(self.df)
+
+    @classmethod
+    def from_bindings(cls, bindings: Iterable[dict[str, _TSPARQLBindingValue]]) -> Self:
+        return cls(pd.DataFrame(data=bindings, dtype=object))
+
+    @property
+    def empty(self) -> bool:
+        return self.df.empty
+
+    def iter_rows(self) -> Iterator[_BindingsFrame]:
+        columns = {column: position for position, column in enumerate(self.df.columns)}
+
+        for row in self.df.itertuples(index=False, name=None):
+            yield _PythonBindingsFrame(rows=[row], columns=columns)
+
+    def iter_groups(self, column: str) -> Iterator[Self]:
+        group_by_object: DataFrameGroupBy = self.df.groupby(
+            column, sort=False, dropna=False
+        )
+
+        for _, group_df in group_by_object:
+            yield type(self)(group_df)
+
+    def get_first_value(self, column: str) -> Any:
+        """Get the value of a column in the first row or _SENTINEL if the column does not exist.
+
+        Note: Here, pd.Series.get must not use a None default,
+        because None can be a legit value in the series.
+        """
+        return self.df.iloc[0].get(column, _SENTINEL)
+
+    def get_unique_values(self, column: str) -> list:
+        return list(dict.fromkeys(self.df[column].dropna()))
+
+    def count_unique(self, column: str) -> int:
+        return self.df[column].nunique(dropna=False)
+
+    def partition(self, column: str, value: Any) -> Self:
+        """Get a frame of the rows with a given (or NA) value in a column.
+
+        Partitions are looked up from a group index of the column;
+        for columns with unhashable values, partition falls back to mask/bool-indexing.
+        """
+        if (group_index := self._get_group_index(column)) is not None:
+            key = _get_key(value)
+            partitions = self._partitions.setdefault(column, {})
+
+            if (partition := partitions.get(key)) is None:
+                partition = partitions[key] = type(self)(
+                    self.df.iloc[group_index.get(key, [])]
+                )
+
+            return partition
+
+        mask = self.df[column].isna() if pd.isna(value) else self.df[column] == value
+
+        return type(self)(cast(pd.DataFrame, self.df[mask]))
+
+    def _get_group_index(self, column: str) -> dict[Any, list[int]] | None:
+        """Get the cached group index of a column, see rdfproxy.utils.frames._get_group_index."""
+        if column not in self._group_indexes:
+            self._group_indexes[column] = _get_group_index(self.df[column])
+
+        return self._group_indexes[column]
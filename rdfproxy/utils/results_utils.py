@@ -0,0 +1,363 @@
+"""Functionality for parsing SPARQL result sets."""
+
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+import re
+from typing import Any
+
+from rdflib import BNode, Literal, RDF, URIRef, Variable, XSD
+from rdflib.query import Result as SPARQLQueryResult
+from rdflib.term import Node, _toPythonMapping
+from rdfproxy.utils._types import _TSPARQLBindingValue
+
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+
+class LiteralConverter:
+    """Converter for casting literal lexical forms to Python values according to RDFLib.
+
+    LiteralConverter is semantically equivalent to Literal(value, datatype=datatype).toPython()
+    with the RDFProxy exception that xsd:gYear and xsd:gYearMonth literals are returned as rdflib.Literal.
+
+    Instead of constructing an rdflib.Literal per value, LiteralConverter dispatches
+    on the datatype to a converter function which is resolved against RDFLib's datatype mapping
+    once per datatype; rdflib.Literal construction is only used as fallback for
+    unknown datatypes, ill-typed values and the gYear/gYearMonth special case.
+
+    Converted values are cached in a bounded cache keyed on (value, datatype),
+    so lexical forms that repeat across a result set (e.g. the non-aggregated columns
+    of grouped results) get converted only once. LiteralConverter instances are meant
+    to be used per result set.
+    """
+
+    _literal_datatypes: frozenset[str] = frozenset(
+        map(str, (XSD.gYear, XSD.gYearMonth))
+    )
+    _uncached_datatypes: frozenset[str] = frozenset(
+        map(str, (RDF.XMLLiteral, RDF.HTML))
+    )
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+
+        self._cache: dict[tuple[str, str | None], _TSPARQLBindingValue] = {}
+        self._converters: dict[
+            str | None, tuple[Callable[[str], _TSPARQLBindingValue], bool]
+        ] = {}
+
+    def __call__(self, value: str, datatype: str | None) -> _TSPARQLBindingValue:
+        key = (value, datatype)
+
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        try:
+            converter, cacheable = self._converters[datatype]
+        except KeyError:
+            converter, cacheable = self._converters[datatype] = (
+                self._get_converter(datatype),
+                str(datatype) not in self._uncached_datatypes,
+            )
+
+        python_value = converter(value)
+
+        if cacheable and len(self._cache) < self.maxsize:
+            self._cache[key] = python_value
+
+        return python_value
+
+    @classmethod
+    def _get_converter(
+        cls, datatype: str | None
+    ) -> Callable[[str], _TSPARQLBindingValue]:
+        """Resolve a converter function for a datatype.
+
+        Note: Datatypes are compared as str, because rdflib.URIRef hashes differ from str hashes.
+        rdflib.term._toPythonMapping maps datatypes to converter functions;
+        a None converter denotes a 1-1 lexical-to-value mapping, an unmapped datatype
+        is unknown to RDFLib and gets represented as rdflib.Literal.
+        """
+        _datatype = None if datatype is None else URIRef(datatype)
+        is_literal_datatype: bool = str(datatype) in cls._literal_datatypes
+
+        def _to_literal(value: str) -> _TSPARQLBindingValue:
+            # call toPython in any case for validation
+            literal = Literal(value, datatype=_datatype)
+            literal_to_python = literal.toPython()
+
+            return literal if is_literal_datatype else literal_to_python
+
+        if is_literal_datatype or _datatype not in _toPythonMapping:
+            return _to_literal
+
+        if (conv_func := _toPythonMapping[_datatype]) is None:
+            return str
+
+        def _convert(value: str) -> _TSPARQLBindingValue:
+            try:
+                python_value = conv_func(value)
+            except Exception:
+                return _to_literal(value)
+
+            return _to_literal(value) if python_value is None else python_value
+
+        return _convert
+
+
+def get_binding_pairs(
+    binding: dict[str, dict[str, str]],
+    variables: Iterable[str],
+    convert_literal: Callable[[str, str | None], _TSPARQLBindingValue],
+) -> Iterator[tuple[str, _TSPARQLBindingValue]]:
+    """Generate key value pairs from a SPARQL JSON result binding.
+
+    The 'type' and 'datatype' fields of the JSON binding
+    are examined to cast values to Python types according to RDFLib.
+    Literals are cast with convert_literal, see LiteralConverter.
+    """
+    for var in variables:
+        if (binding_data := binding.get(var, None)) is None:
+            yield (var, None)
+            continue
+
+        match binding_data["type"]:
+            case "uri":
+                yield (var, URIRef(binding_data["value"]))
+            case "literal":
+                yield (
+                    var,
+                    convert_literal(
+                        binding_data["value"], binding_data.get("datatype", None)
+                    ),
+                )
+            case "bnode":
+                yield (var, BNode(binding_data["value"]))
+            case _:  # pragma: no cover
+                assert False, "This should never happen."
+
+
+def get_bindings_from_json_response(
+    json_response: dict[str, Any],
+) -> Iterator[dict[str, _TSPARQLBindingValue]]:
+    """Get flat dicts from a SPARQL SELECT JSON response."""
+    variables = json_response["head"]["vars"]
+    convert_literal = LiteralConverter()
+
+    for binding in json_response["results"]["bindings"]:
+        yield dict(get_binding_pairs(binding, variables, convert_literal))
+
+
+async def aget_bindings_from_json_stream(
+    chunks: AsyncIterable[bytes],
+) -> AsyncIterator[dict[str, _TSPARQLBindingValue]]:
+    """Get flat dicts from a SPARQL SELECT JSON response body streamed in chunks.
+
+    The body is parsed incrementally with ijson and bindings are yielded
+    as soon as a binding object is complete, so neither the response body
+    nor the decoded JSON document is held in memory at once.
+    Bindings that precede 'head' in the response are buffered until the variables are known.
+
+    This requires the optional ijson dependency, see get_bindings_from_json_response otherwise.
+    """
+    if ijson is None:  # pragma: no cover
+        raise ImportError("Streaming SPARQL JSON results requires ijson.")
+
+    events = ijson.sendable_list()
+    parser = ijson.parse_coro(events)
+
+    convert_literal = LiteralConverter()
+    variables: list[str] = []
+    head_complete: bool = False
+    pending: list[dict[str, dict[str, str]]] = []
+    builder: ijson.ObjectBuilder | None = None
+
+    async def _aiter_events() -> AsyncIterator[tuple[str, str, Any]]:
+        async for chunk in chunks:
+            parser.send(chunk)
+            for event in events:
+                yield event
+            events.clear()
+
+        parser.close()
+        for event in events:
+            yield event
+
+    async for prefix, event, value in _aiter_events():
+        if builder is not None:
+            builder.event(event, value)
+
+            if prefix == "results.bindings.item" and event == "end_map":
+                pending.append(builder.value)
+                builder = None
+        elif prefix == "results.bindings.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == "head.vars.item":
+            variables.append(value)
+        elif prefix == "head.vars" and event == "end_array":
+            head_complete = True
+
+        if head_complete and pending:
+            for binding in pending:
+                yield dict(get_binding_pairs(binding, variables, convert_literal))
+            pending.clear()
+
+    if pending:
+        raise ValueError("Unable to obtain 'head' of SPARQL JSON response.")
+
+
+def get_bindings_from_query_result(
+    result: SPARQLQueryResult,
+) -> Iterator[dict[str, _TSPARQLBindingValue]]:
+    """Get flat dicts from an rdflib SELECT query result.
+
+    The RDF terms of the result bindings are Python-cast directly
+    with the same semantics as get_binding_pairs for SPARQL JSON results,
+    i.e. without serializing the result to JSON and re-parsing the terms.
+    """
+    variables: list[Variable] = result.vars or []
+    convert_literal = LiteralConverter()
+
+    def _cast_term(term: Node | None) -> _TSPARQLBindingValue:
+        match term:
+            case None:
+                return None
+            case Literal():
+                return convert_literal(str(term), term.datatype)
+            case URIRef() | BNode():
+                return term
+            case _:  # pragma: no cover
+                assert False, "This should never happen."
+
+    # note: Result.bindings (unlike ResultRow iteration) retains empty solutions
+    for binding in result.bindings:
+        yield {str(var): _cast_term(binding.get(var)) for var in variables}
+
+
+_tsv_escape_pattern = re.compile(
+    r"\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))", flags=re.DOTALL
+)
+_tsv_echars = {
+    "t": "\t",
+    "b": "\b",
+    "n": "\n",
+    "r": "\r",
+    "f": "\f",
+    '"': '"',
+    "'": "'",
+    "\\": "\\",
+}
+
+_tsv_literal_pattern = re.compile(
+    r'^"(?P<value>(?:[^"\\]|\\.)*)"(?:@(?P<lang>[a-zA-Z0-9-]+)|\^\^<(?P<datatype>[^>]*)>)?$',
+    flags=re.DOTALL,
+)
+_tsv_abbreviated_literal_patterns: list[tuple[re.Pattern, str]] = [
+    (re.compile(r"^[+-]?\d+$"), str(XSD.integer)),
+    (re.compile(r"^[+-]?\d*\.\d+$"), str(XSD.decimal)),
+    (re.compile(r"^[+-]?(?:\d+\.?\d*|\.\d+)[eE][+-]?\d+$"), str(XSD.double)),
+    (re.compile(r"^(?:true|false)$"), str(XSD.boolean)),
+]
+
+
+def _unescape_tsv_string(value: str) -> str:
+    """Resolve ECHAR and UCHAR escape sequences of an N-Triples string or IRI."""
+
+    def _repl(match: re.Match) -> str:
+        u4, u8, echar = match.groups()
+
+        if (codepoint := u4 or u8) is not None:
+            return chr(int(codepoint, 16))
+        if echar in _tsv_echars:
+            return _tsv_echars[echar]
+
+        raise ValueError(f"Invalid escape sequence '\\{echar}' in TSV result term.")
+
+    return _tsv_escape_pattern.sub(_repl, value) if "\\" in value else value
+
+
+def parse_tsv_term(term: str) -> dict[str, str] | None:
+    """Parse an RDF term of a SPARQL TSV result into a SPARQL JSON binding dict.
+
+    SPARQL TSV results encode RDF terms in N-Triples/Turtle syntax,
+    including abbreviated numeric and boolean literals;
+    an empty term denotes an unbound variable.
+
+    Returning JSON binding dicts allows to share Python-casting with
+    the JSON result format, see get_binding_pairs.
+    """
+    if not term:
+        return None
+
+    if term.startswith("<") and term.endswith(">"):
+        return {"type": "uri", "value": _unescape_tsv_string(term[1:-1])}
+
+    if term.startswith("_:"):
+        return {"type": "bnode", "value": term[2:]}
+
+    if (match := _tsv_literal_pattern.match(term)) is not None:
+        binding: dict[str, str] = {
+            "type": "literal",
+            "value": _unescape_tsv_string(match.group("value")),
+        }
+
+        if (lang := match.group("lang")) is not None:
+            binding["xml:lang"] = lang
+        if (datatype := match.group("datatype")) is not None:
+            binding["datatype"] = _unescape_tsv_string(datatype)
+
+        return binding
+
+    for pattern, datatype in _tsv_abbreviated_literal_patterns:
+        if pattern.match(term):
+            return {"type": "literal", "value": term, "datatype": datatype}
+
+    raise ValueError(f"Unable to parse TSV result term '{term}'.")
+
+
+def get_bindings_from_tsv_response(
+    tsv_response: str,
+) -> Iterator[dict[str, _TSPARQLBindingValue]]:
+    """Get flat dicts from a SPARQL SELECT TSV response.
+
+    The header line determines the variables, result terms are parsed
+    into SPARQL JSON binding dicts (see parse_tsv_term),
+    so Python-casting is shared with the JSON result format.
+    """
+    lines = tsv_response.split("\n")
+
+    if lines and not lines[-1]:
+        lines.pop()
+
+    if not lines:
+        raise ValueError("SPARQL TSV result document does not define a header.")
+
+    header, *result_lines = (line.removesuffix("\r") for line in lines)
+    variables = [var.lstrip("?$") for var in header.split("\t") if var]
+    convert_literal = LiteralConverter()
+
+    for line in result_lines:
+        terms = line.split("\t")
+
+        if len(terms) != len(variables):
+            if not variables and not line:
+                yield {}
+                continue
+
+            raise ValueError(
+                f"SPARQL TSV result line has {len(terms)} terms, "
+                f"expected {len(variables)}."
+            )
+
+        binding = {
+            var: binding_data
+            for var, term in zip(variables, terms)
+            if (binding_data := parse_tsv_term(term)) is not None
+        }
+
+        yield dict(get_binding_pairs(binding, variables, convert_literal))
@@ -1,8 +1,12 @@
 """Functionality for dynamic SPARQL query modifcation."""
 
+from collections.abc import Iterator
+from functools import cached_property
 from itertools import chain
+import os
 import re
-from typing import overload
+import threading
+from typing import TYPE_CHECKING, overload
 
 from rdflib import Variable
 from rdflib.plugins.sparql.parser import parseQuery
@@ -10,23 +14,35 @@ from rdflib.plugins.sparql.parserutils import CompValue, ParseResults
 from rdfproxy.utils.exceptions import QueryConstructionException
 
 
-def replace_query_select_clause(query: str, repl: str) -> str:
-    """Replace the SELECT clause of a query with repl."""
-    pattern: re.Pattern = re.compile(
-        r"select\s+.*?(?=\s+where)", flags=re.IGNORECASE | re.DOTALL
-    )
+if TYPE_CHECKING:  # pragma: no cover
+    from rdfproxy.utils._types import ParsedSPARQL
 
-    if re.search(pattern=pattern, string=query) is None:
-        raise QueryConstructionException("Unable to obtain SELECT clause.")
 
-    modified_query = re.sub(
-        pattern=pattern,
-        repl=repl,
-        string=query,
-        count=1,
-    )
+_SPARQL_PARSER_LOCK = threading.RLock()
+"""Lock for serializing calls into RDFLib's SPARQL parser.
 
-    return modified_query
+RDFLib's parseQuery is based on pyparsing, which is not thread-safe;
+concurrent parses (e.g. rdflib.Graph.query calls in worker threads) can fail sporadically.
+"""
+
+# forked processes (e.g. SPARQLWrapper graph_workers) must not inherit a held lock
+os.register_at_fork(after_in_child=_SPARQL_PARSER_LOCK._at_fork_reinit)  # type: ignore
+
+
+def parse_query(query: str) -> ParseResults:
+    """Thread-safe wrapper for rdflib.plugins.sparql.parser.parseQuery."""
+    with _SPARQL_PARSER_LOCK:
+        return parseQuery(query)
+
+
+_SELECT_CLAUSE_PATTERN: re.Pattern = re.compile(
+    r"select\s+.*?(?=\s+where)", flags=re.IGNORECASE | re.DOTALL
+)
+
+
+_PREFIX_PATTERN: re.Pattern = re.compile(
+    r"PREFIX\s+\w*:\s?<[^>]+>\s*", flags=re.IGNORECASE
+)
 
 
 def remove_sparql_prefixes(query: str) -> str:
@@ -36,33 +52,28 @@ def remove_sparql_prefixes(query: str) -> str:
     Note that this is not generic, all prefixes are simply cut from the subquery
     and are not resolved against the outer query prefixes.
     """
-    prefix_pattern = re.compile(r"PREFIX\s+\w*:\s?<[^>]+>\s*", flags=re.IGNORECASE)
-    cleaned_query = re.sub(prefix_pattern, "", query).strip()
+    cleaned_query = re.sub(_PREFIX_PATTERN, "", query).strip()
     return cleaned_query
 
 
-def inject_into_query(
-    query: str, injectant: str, inject_into_pattern: bool = True
-) -> str:
-    """Inject some injectant (e.g. subquery or filter clause) into a query.
+def get_where_clause_span(query: str) -> tuple[int, int]:
+    """Get the span of the group graph pattern of the WHERE clause of a query.
 
-    If inject_into_pattern is True, the injectant will be wrapped in its own graph pattern.
+    The span starts after the opening brace and ends at the closing brace of the WHERE clause.
     """
-    if (tail := re.search(r"}[^}]*\Z", query)) is None:
-        raise QueryConstructionException(
-            "Unable to inject subquery."
-        )  # pragma: no cover
+    head = re.search(r"\bwhere\s*{", query, flags=re.IGNORECASE)
+    tail = re.search(r"}[^}]*\Z", query)
 
-    _tail_index: int = tail.start()
-    _injectant: str = f"{{{injectant}}}" if inject_into_pattern else injectant
+    if head is None or tail is None:
+        raise QueryConstructionException("Unable to obtain WHERE clause.")
 
-    injected_query: str = f"{query[:_tail_index]} {_injectant} {query[_tail_index:]}"
-    return injected_query
+    return head.end(), tail.start()
 
 
 def add_solution_modifier(
     query: str,
     *,
+    group_by: str | None = None,
     order_by: str | None = None,
     limit: int | None = None,
     offset: int | None = None,
@@ -70,6 +81,8 @@ def add_solution_modifier(
     """Add optional solution modifiers in SPARQL-conformant order to a query."""
     modifiers = []
 
+    if group_by is not None:
+        modifiers.append(f"group by {group_by}")
     if order_by is not None:
         modifiers.append(f"order by {order_by}")
     if limit is not None:
@@ -80,6 +93,68 @@ def add_solution_modifier(
     return f"{query} {' '.join(modifiers)}".strip()
 
 
+class QueryTemplate:
+    """Template for rendering SPARQL queries from the structured parts of a SELECT query.
+
+    The query is split once into the prologue (everything before the SELECT clause),
+    the SELECT clause, the WHERE clause head (up to the opening brace), the WHERE clause body
+    and the tail (the closing brace of the WHERE clause and anything after it).
+
+    QueryTemplate.render assembles queries from these parts, so constructing queries
+    does not require regex scans over the full query.
+    """
+
+    def __init__(self, query: str) -> None:
+        self.query = query
+
+        if (select_clause := re.search(_SELECT_CLAUSE_PATTERN, query)) is None:
+            raise QueryConstructionException("Unable to obtain SELECT clause.")
+
+        where_start, where_end = get_where_clause_span(query)
+
+        self.prologue: str = query[: select_clause.start()]
+        self.select_clause: str = select_clause.group()
+        self.where_head: str = query[select_clause.end() : where_start]
+        self.where_body: str = query[where_start:where_end]
+        self.tail: str = query[where_end:]
+
+    @cached_property
+    def unprefixed(self) -> "QueryTemplate":
+        """QueryTemplate for the query without prefix declarations, e.g. for subqueries."""
+        return QueryTemplate(remove_sparql_prefixes(self.query))
+
+    def get_select_clause(self, *variables: str) -> str:
+        """Get the SELECT clause with variables added to an explicit projection.
+
+        SELECT * queries already project all in-scope variables and are returned unchanged.
+        """
+        if not variables or "*" in self.select_clause:
+            return self.select_clause
+
+        projection = " ".join(f"?{variable}" for variable in variables)
+        return f"{self.select_clause} {projection}"
+
+    def render(
+        self,
+        *,
+        select_clause: str | None = None,
+        head_injectant: str | None = None,
+        tail_injectant: str | None = None,
+    ) -> str:
+        """Render a query from the template parts.
+
+        The SELECT clause is optionally replaced with select_clause,
+        injectants are inserted at the start/end of the WHERE clause.
+        """
+        head = "" if head_injectant is None else f" {head_injectant} "
+        tail = "" if tail_injectant is None else f" {tail_injectant} "
+
+        return (
+            f"{self.prologue}{select_clause or self.select_clause}{self.where_head}"
+            f"{head}{self.where_body}{tail}{self.tail}"
+        )
+
+
 @overload
 def _compvalue_to_dict(comp_value: dict | CompValue) -> dict: ...
 
@@ -101,19 +176,29 @@ def _compvalue_to_dict(comp_value: CompValue):
         return comp_value
 
 
-def get_query_projection(query: str) -> list[Variable]:
+def get_query_projection(query: "str | ParsedSPARQL") -> list[Variable]:
     """Parse a SPARQL SELECT query and extract the ordered bindings projection.
 
-    The first case handles explicit/literal binding projections.
+    For ParsedSPARQL objects, the cached projection is returned without reparsing the query.
+    """
+    if isinstance(query, str):
+        return get_parse_object_projection(parse_query(query)[1])
+    return query.projection
+
+
+def get_parse_object_projection(parse_object: CompValue) -> list[Variable]:
+    """Extract the ordered bindings projection from a SELECT query parse object.
+
+    The first case handles explicit/literal binding projections;
+    for projection aliases "(... AS ?x)", the alias variable is used.
     The second case handles implicit/* binding projections.
     The third case handles implicit/* binding projections with VALUES.
     """
-    _parse_result: CompValue = parseQuery(query)[1]
-    parsed_query: dict = _compvalue_to_dict(_parse_result)
+    parsed_query: dict = _compvalue_to_dict(parse_object)
 
     match parsed_query:
         case {"projection": projection}:
-            return [i["var"] for i in projection]
+            return [i["var"] if "var" in i else i["evar"] for i in projection]
         case {"where": {"part": [{"triples": triples}]}}:
             projection = dict.fromkeys(
                 i for i in chain.from_iterable(triples) if isinstance(i, Variable)
@@ -123,3 +208,57 @@ def get_query_projection(query: str) -> list[Variable]:
             return var
         case _:  # pragma: no cover
             raise Exception("Unable to obtain query projection.")
+
+
+def _get_variables(value: object) -> Iterator[Variable]:
+    """Recursively get the variables of a parse object value."""
+    match value:
+        case Variable():
+            yield value
+        case dict():
+            for item in value.values():
+                yield from _get_variables(item)
+        case list() | ParseResults():
+            for item in value:
+                yield from _get_variables(item)
+
+
+def get_parse_object_where_variables(parse_object: CompValue) -> set[Variable]:
+    """Extract the variables occurring in the WHERE clause of a query.
+
+    Unlike get_parse_object_pattern_variables, this includes variables
+    that are possibly unbound (e.g. bound by BIND, OPTIONAL or UNION),
+    but excludes projection aliases of the SELECT clause.
+    """
+    return set(_get_variables(parse_object["where"]))
+
+
+def get_parse_object_pattern_variables(parse_object: CompValue) -> set[Variable]:
+    """Extract the variables bound in every solution of the WHERE clause of a query.
+
+    These are the variables of the triple patterns of the WHERE clause
+    and the variables of VALUES clauses without UNDEF values; variables
+    bound by BIND, OPTIONAL, UNION or subqueries are not considered.
+    """
+    variables: set[Variable] = set()
+    where: CompValue = parse_object["where"]
+
+    for part in where["part"] if "part" in where else []:
+        match part.name:
+            case "TriplesBlock":
+                variables.update(_get_variables(part["triples"]))
+            case "InlineData":
+                values_variables: list[Variable] = part["var"]
+                rows = (
+                    part["value"]
+                    if len(values_variables) > 1
+                    else [[value] for value in part["value"]]
+                )
+
+                variables.update(
+                    variable
+                    for index, variable in enumerate(values_variables)
+                    if all(row[index] != "UNDEF" for row in rows)
+                )
+
+    return variables
@@ -4,7 +4,8 @@ import types
 import typing
 from typing import Annotated, Any, TypeGuard, get_args, get_origin
 
-from pydantic import BaseModel
+from pydantic import AnyUrl, BaseModel
+from rdflib import URIRef
 from rdfproxy.utils._types import _TSPARQLBoundField
 
 
@@ -41,6 +42,23 @@ def _is_pydantic_model_union_static_type(
     return is_union_type and has_any_model
 
 
+def _is_iri_static_type(obj: Any) -> bool:
+    """Check if object is an IRI type.
+
+    IRI types are URIRef and pydantic.AnyUrl subtypes
+    or union types of IRI types and None.
+    """
+    origin: type | None = get_origin(obj)
+
+    if origin in (types.UnionType, typing.Union):
+        args = [arg for arg in get_args(obj) if arg is not types.NoneType]
+        return bool(args) and all(_is_iri_static_type(arg) for arg in args)
+    if origin is Annotated:
+        return _is_iri_static_type(get_args(obj)[0])
+
+    return isinstance(obj, type) and issubclass(obj, URIRef | AnyUrl)
+
+
 def _is_sparql_bound_field_type(
     value: type | None,
 ) -> TypeGuard[_TSPARQLBoundField]:
@@ -2,10 +2,10 @@
 
 from collections import UserDict
 from collections.abc import Callable, Hashable, Iterator
-from functools import partial
+from functools import cache, partial
 from typing import Annotated, Any, Generic, NoReturn, Self, TypeVar, get_args
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, PydanticUserError, TypeAdapter, ValidationError
 from pydantic.fields import FieldInfo
 from rdfproxy.utils._types import SPARQLBinding, _TModelInstance
 from rdfproxy.utils.type_utils import (
@@ -187,9 +187,29 @@ class QueryConstructorComponent:
         return query
 
 
+@cache
+def _get_field_type_adapter(model: type[BaseModel], field: str) -> TypeAdapter:
+    """Get a cached TypeAdapter for a single model field.
+
+    The adapter validates against the field annotation, field constraints and
+    the model config. Note that a model config cannot be passed to TypeAdapters
+    of model (or dataclass, TypedDict) types; those use their own config.
+    """
+    field_info = model.model_fields[field]
+    field_type = Annotated[field_info.annotation, field_info]
+
+    try:
+        return TypeAdapter(field_type, config=model.model_config)
+    except PydanticUserError:
+        return TypeAdapter(field_type)
+
+
 def validate_model_field(model: type[BaseModel], field: str, value: Any) -> Any:
     """Validate value for a single field given a model.
 
+    Validation runs against a cached per-field TypeAdapter and does not instantiate the model,
+    so field and model validators only apply once the model is instantiated.
+
     Note: Using a TypeVar for value is not possible here,
     because Pydantic might coerce values (if not not in Strict Mode).
     """
@@ -198,11 +218,15 @@ def validate_model_field(model: type[BaseModel], field: str, value: Any) -> Any:
         raise ValueError(f"'{field}' does not denote a field of model '{model}'.")
 
     try:
-        model(**{field: value})
+        _get_field_type_adapter(model, field).validate_python(value)
     except ValidationError as e:
-        for error in e.errors():
-            if field in error["loc"]:
-                raise ValidationError.from_exception_data(model.__name__, [error])
+        raise ValidationError.from_exception_data(
+            model.__name__,
+            [
+                {**error, "loc": (field, *error["loc"])}  # type: ignore[typeddict-item]
+                for error in e.errors()
+            ],
+        )
 
     return value
 
@@ -0,0 +1,31 @@
+"""Pytest fixture definitions for SPARQLModelAdapter tests."""
+
+from collections.abc import Callable
+
+import pytest
+from rdfproxy import SPARQLModelAdapter
+
+
+@pytest.fixture
+def queries() -> list[str]:
+    """Fixture for collecting the queries recorded with record_queries."""
+    return []
+
+
+@pytest.fixture
+def record_queries(
+    monkeypatch, queries
+) -> Callable[[SPARQLModelAdapter], SPARQLModelAdapter]:
+    """Fixture for recording the queries run by the SPARQLWrapper of an adapter in queries."""
+
+    def _record_queries(adapter: SPARQLModelAdapter) -> SPARQLModelAdapter:
+        _aquery = adapter.sparqlwrapper._aquery
+
+        async def _recording_aquery(query: str):
+            queries.append(query)
+            return await _aquery(query)
+
+        monkeypatch.setattr(adapter.sparqlwrapper, "_aquery", _recording_aquery)
+        return adapter
+
+    return _record_queries
@@ -0,0 +1,68 @@
+"""Tests for the coroutine API of rdfproxy.SPARQLModelAdapter."""
+
+import asyncio
+
+from pydantic import BaseModel
+import pytest
+from rdfproxy import ConfigDict, QueryParameters, SPARQLModelAdapter
+from rdfproxy.utils.exceptions import NoResultsFound
+
+
+class Child(BaseModel):
+    name: str
+
+
+class Parent(BaseModel):
+    model_config = ConfigDict(group_by="parent")
+
+    parent: str
+    children: list[Child]
+
+
+query = """
+select ?parent ?name
+where {
+    values (?parent ?name) {
+        ('x' 'a')
+        ('x' 'b')
+        ('y' 'c')
+        ('z' 'd')
+    }
+}
+"""
+
+
+@pytest.mark.parametrize(
+    "query_parameters",
+    [QueryParameters(), QueryParameters(page=2, size=1), QueryParameters(size=2)],
+)
+def test_adapter_aget_page(target, query_parameters):
+    """Check that aget_page produces the same Page objects as get_page."""
+    adapter = SPARQLModelAdapter(target=target, query=query, model=Parent)
+
+    async def _aget_page():
+        return await adapter.aget_page(query_parameters)
+
+    assert asyncio.run(_aget_page()) == adapter.get_page(query_parameters)
+
+
+def test_adapter_aget_item(target):
+    """Check concurrent aget_item calls on a single event loop."""
+    adapter = SPARQLModelAdapter(target=target, query=query, model=Parent)
+
+    async def _aget_items():
+        return await asyncio.gather(*(adapter.aget_item(parent=p) for p in "xyz"))
+
+    x, y, z = asyncio.run(_aget_items())
+
+    assert x == adapter.get_item(parent="x")
+    assert x.children == [Child(name="a"), Child(name="b")]
+    assert y.children == [Child(name="c")]
+    assert z.children == [Child(name="d")]
+
+
+def test_adapter_aget_item_fail(target):
+    adapter = SPARQLModelAdapter(target=target, query=query, model=Parent)
+
+    with pytest.raises(NoResultsFound):
+        asyncio.run(adapter.aget_item(parent="dne"))
@@ -0,0 +1,121 @@
+"""Tests for the count policy of rdfproxy.SPARQLModelAdapter.get_page."""
+
+import asyncio
+
+import httpx
+from pydantic import BaseModel
+import pytest
+from rdfproxy import CountPolicy, Page, QueryParameters, SPARQLModelAdapter
+from rdfproxy.sparqlwrapper import SPARQLWrapper
+
+
+target = "https://test.endpoint/sparql"
+
+query = "select ?x where {?x ?p ?o}"
+
+
+class Model(BaseModel):
+    x: str
+
+
+@pytest.fixture
+def requests() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+def sparql_wrapper(requests) -> SPARQLWrapper:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+
+        if b"count" in request.content:
+            return httpx.Response(
+                200,
+                json={
+                    "head": {"vars": ["cnt"]},
+                    "results": {
+                        "bindings": [{"cnt": {"type": "literal", "value": "3"}}]
+                    },
+                },
+            )
+
+        return httpx.Response(
+            200,
+            json={
+                "head": {"vars": ["x"]},
+                "results": {"bindings": [{"x": {"type": "uri", "value": "urn:x"}}]},
+            },
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return SPARQLWrapper(target=target, client=client)
+
+
+def count_requests(requests: list[httpx.Request]) -> int:
+    return sum(b"count" in request.content for request in requests)
+
+
+def test_count_policy_always(sparql_wrapper, requests):
+    adapter = SPARQLModelAdapter(target=sparql_wrapper, query=query, model=Model)
+
+    for page in (1, 2):
+        assert adapter.get_page(QueryParameters(page=page, size=2)) == Page(
+            items=[Model(x="urn:x")], page=page, size=2, total=3, pages=2
+        )
+
+    assert count_requests(requests) == 2
+
+
+def test_count_policy_cached(sparql_wrapper, requests):
+    adapter = SPARQLModelAdapter(
+        target=sparql_wrapper, query=query, model=Model, count_policy="cached"
+    )
+
+    for page in (1, 2):
+        assert adapter.get_page(QueryParameters(page=page, size=2)) == Page(
+            items=[Model(x="urn:x")], page=page, size=2, total=3, pages=2
+        )
+
+    asyncio.run(adapter.aget_page(QueryParameters(page=3, size=1)))
+
+    assert count_requests(requests) == 1
+    assert len(requests) == 4
+
+
+def test_count_policy_cached_ttl(sparql_wrapper, requests, monkeypatch):
+    adapter = SPARQLModelAdapter(
+        target=sparql_wrapper,
+        query=query,
+        model=Model,
+        count_policy=CountPolicy.CACHED,
+        count_ttl=10,
+    )
+
+    adapter.get_page()
+    monkeypatch.setattr("rdfproxy.cache.time.monotonic", lambda: float("inf"))
+    adapter.get_page()
+
+    assert count_requests(requests) == 2
+
+
+def test_count_policy_disabled(sparql_wrapper, requests):
+    adapter = SPARQLModelAdapter(
+        target=sparql_wrapper,
+        query=query,
+        model=Model,
+        count_policy=CountPolicy.DISABLED,
+    )
+
+    page = adapter.get_page()
+    assert page == asyncio.run(adapter.aget_page())
+    assert page == Page(items=[Model(x="urn:x")], page=1, size=100)
+    assert page.total is None and page.pages is None
+
+    assert count_requests(requests) == 0
+
+
+def test_count_policy_invalid():
+    with pytest.raises(ValueError):
+        SPARQLModelAdapter(
+            target=target, query=query, model=Model, count_policy="sometimes"
+        )
@@ -0,0 +1,209 @@
+"""Tests for SPARQLModelAdapter.get_items batch item retrieval."""
+
+import asyncio
+from typing import Annotated
+
+from pydantic import AnyUrl, BaseModel
+import pytest
+from rdflib import XSD
+from rdfproxy import ConfigDict, ItemLookup, SPARQLBinding, SPARQLModelAdapter
+from rdfproxy.utils.exceptions import (
+    MultipleResultsFound,
+    NoResultsFound,
+    UnprojectedKeyBindingException,
+)
+
+
+class SimpleModel(BaseModel):
+    x: int
+    y: Annotated[int, SPARQLBinding("y_alias")]
+
+
+class GroupedModel(BaseModel):
+    model_config = ConfigDict(group_by="p")
+
+    p: int
+    q: list[int]
+
+
+class IRIModel(BaseModel):
+    s: AnyUrl
+    label: str
+
+
+simple_model_query = """
+select * where {
+    values (?x ?y_alias) {
+        (1 2)
+        (3 4)
+        (5 6)
+        (5 7)
+    }
+}
+"""
+
+grouped_model_query = """
+select * where {
+    values (?p ?q) {
+        (1 2)
+        (1 3)
+        (2 2)
+    }
+}
+"""
+
+iri_model_query = """
+select * where {
+    values (?s ?label) {
+        (<https://test.uri/a> 'a')
+        (<https://test.uri/b> 'b')
+    }
+}
+"""
+
+
+def test_adapter_get_items(target):
+    adapter = SPARQLModelAdapter(
+        target=target, query=simple_model_query, model=SimpleModel
+    )
+
+    results = adapter.get_items(x=[1, 3, 0, 5, "3"])
+
+    assert list(results) == [1, 3, 0, 5, "3"]
+    assert results[1] == SimpleModel(x=1, y=2)
+    assert results[3] == results["3"] == SimpleModel(x=3, y=4)
+    assert isinstance(results[0], NoResultsFound)
+    assert isinstance(results[5], MultipleResultsFound)
+
+
+def test_adapter_get_items_grouped(target):
+    adapter = SPARQLModelAdapter(
+        target=target, query=grouped_model_query, model=GroupedModel
+    )
+
+    assert adapter.get_items(p=(1, 2)) == {
+        1: GroupedModel(p=1, q=[2, 3]),
+        2: GroupedModel(p=2, q=[2]),
+    }
+
+
+def test_adapter_get_items_xsd_type(target):
+    adapter = SPARQLModelAdapter(
+        target=target, query=simple_model_query, model=SimpleModel
+    )
+
+    results = adapter.get_items(x=["01", 3], xsd_type=XSD.integer)
+
+    assert results == {"01": SimpleModel(x=1, y=2), 3: SimpleModel(x=3, y=4)}
+
+
+def test_adapter_get_items_iri(target):
+    adapter = SPARQLModelAdapter(target=target, query=iri_model_query, model=IRIModel)
+
+    results = adapter.get_items(s=["https://test.uri/a", "https://test.uri/c"])
+
+    assert results["https://test.uri/a"].label == "a"
+    assert isinstance(results["https://test.uri/c"], NoResultsFound)
+
+
+def test_adapter_get_items_consistent_with_get_item(target):
+    adapter = SPARQLModelAdapter(
+        target=target, query=simple_model_query, model=SimpleModel
+    )
+
+    assert adapter.get_items(y=[2, 4]) == {
+        2: adapter.get_item(y=2),
+        4: adapter.get_item(y=4),
+    }
+
+
+def test_adapter_get_items_empty():
+    adapter = SPARQLModelAdapter(
+        target="https://test.endpoint/sparql",
+        query=simple_model_query,
+        model=SimpleModel,
+    )
+
+    assert adapter.get_items(x=[]) == {}
+
+
+def test_adapter_aget_items(target):
+    adapter = SPARQLModelAdapter(
+        target=target, query=simple_model_query, model=SimpleModel
+    )
+
+    assert asyncio.run(adapter.aget_items(x=[1, 3])) == adapter.get_items(x=[1, 3])
+
+
+@pytest.mark.parametrize(
+    ["key", "exception"],
+    [
+        ({"x": 1}, TypeError),
+        ({"x": "1"}, TypeError),
+        ({"x": [1], "y": [2]}, ValueError),
+        ({"dne": [1]}, KeyError),
+    ],
+)
+def test_adapter_get_items_fail(target, key, exception):
+    adapter = SPARQLModelAdapter(
+        target=target, query=simple_model_query, model=SimpleModel
+    )
+
+    with pytest.raises(exception):
+        adapter.get_items(**key)
+
+
+def test_adapter_get_items_unprojected_key_fail(target):
+    adapter = SPARQLModelAdapter(
+        target=target, query="select ?a ?b where {?a ?b ?x}", model=SimpleModel
+    )
+
+    with pytest.raises(UnprojectedKeyBindingException):
+        adapter.get_items(x=[1])
+
+
+@pytest.mark.parametrize("item_lookup", [ItemLookup.FILTER, ItemLookup.VALUES])
+def test_adapter_get_item_iri(target, item_lookup):
+    """Check IRI key lookups against get_items."""
+    adapter = SPARQLModelAdapter(
+        target=target, query=iri_model_query, model=IRIModel, item_lookup=item_lookup
+    )
+
+    item = adapter.get_item(s="https://test.uri/b")
+
+    assert item.label == "b"
+    assert adapter.get_items(s=["https://test.uri/b"]) == {"https://test.uri/b": item}
+
+    with pytest.raises(NoResultsFound):
+        adapter.get_item(s="https://test.uri/c")
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        """
+        select ?x ?y_alias where {
+            values ?y_alias { 2 4 }
+            bind (?y_alias - 1 as ?x)
+        }
+        """,
+        """
+        select ?x ?y_alias where {
+            values ?y_alias { 2 4 6 }
+            optional { values (?x ?y_alias) { (1 2) (3 4) } }
+        }
+        """,
+    ],
+)
+def test_adapter_get_items_values_lookup_unbound_key(target, query):
+    """Check that VALUES lookups fall back to FILTER for keys bound by BIND/OPTIONAL."""
+    adapter = SPARQLModelAdapter(
+        target=target, query=query, model=SimpleModel, item_lookup="values"
+    )
+
+    assert adapter.get_item(x=1, xsd_type=XSD.integer) == SimpleModel(x=1, y=2)
+
+    results = adapter.get_items(x=[3, 5], xsd_type=XSD.integer)
+
+    assert results[3] == SimpleModel(x=3, y=4)
+    assert isinstance(results[5], NoResultsFound)
@@ -0,0 +1,127 @@
+"""Tests for batching of concurrent SPARQLModelAdapter.get_item calls."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import BaseModel
+import pytest
+from rdflib import Graph, XSD
+from rdfproxy import SPARQLModelAdapter
+from rdfproxy.utils.exceptions import MultipleResultsFound, NoResultsFound
+
+
+class Model(BaseModel):
+    x: int
+    y: int
+
+
+query = """
+select * where {
+    values (?x ?y) {
+        (1 2)
+        (3 4)
+        (5 6)
+        (5 7)
+    }
+}
+"""
+
+
+@pytest.fixture
+def adapter(record_queries) -> SPARQLModelAdapter:
+    return record_queries(
+        SPARQLModelAdapter(
+            target=Graph(), query=query, model=Model, item_batch_window=0.01
+        )
+    )
+
+
+def test_aget_item_batching(adapter, queries):
+    """Check that concurrent aget_item calls are resolved with a single query."""
+
+    async def _aget_items():
+        return await asyncio.gather(
+            *(adapter.aget_item(x=x) for x in (1, 3, 0, 5, 1)), return_exceptions=True
+        )
+
+    one, three, zero, five, one_again = asyncio.run(_aget_items())
+
+    assert len(queries) == 1
+    assert one == one_again == Model(x=1, y=2)
+    assert three == Model(x=3, y=4)
+    assert isinstance(zero, NoResultsFound)
+    assert isinstance(five, MultipleResultsFound)
+
+
+def test_aget_item_batching_batch_keys(adapter, queries):
+    """Check that batches are separated by key field and xsd_type/lang_tag."""
+
+    async def _aget_items():
+        return await asyncio.gather(
+            adapter.aget_item(x=1),
+            adapter.aget_item(y=4),
+            adapter.aget_item(x=5, xsd_type=XSD.integer),
+            return_exceptions=True,
+        )
+
+    one, three, five = asyncio.run(_aget_items())
+
+    assert len(queries) == 3
+    assert one == Model(x=1, y=2)
+    assert three == Model(x=3, y=4)
+    assert isinstance(five, MultipleResultsFound)
+
+
+def test_get_item_batching_threads(adapter, queries):
+    """Check that get_item calls from several threads are batched."""
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(lambda x: adapter.get_item(x=x), (1, 3, 1)))
+
+    assert results == [Model(x=1, y=2), Model(x=3, y=4), Model(x=1, y=2)]
+    assert 1 <= len(queries) <= 2
+
+    with pytest.raises(NoResultsFound):
+        adapter.get_item(x=0)
+
+    adapter.close()
+
+
+def test_aget_item_batching_cancelled_request(adapter, queries):
+    """Check that cancelling a request does not affect the other requests of a batch."""
+
+    async def _aget_items():
+        cancelled = asyncio.create_task(adapter.aget_item(x=1))
+        pending = asyncio.create_task(adapter.aget_item(x=3))
+
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        return await asyncio.wait_for(pending, timeout=5), cancelled.cancelled()
+
+    three, cancelled = asyncio.run(_aget_items())
+
+    assert cancelled
+    assert three == Model(x=3, y=4)
+    assert len(queries) == 1
+
+
+@pytest.mark.parametrize("delay", [0, 0.001])
+def test_aget_item_batching_cancelled_dispatch(adapter, queries, delay):
+    """Check that the requests of a cancelled batch dispatch are cancelled."""
+
+    async def _aget_items():
+        pending = asyncio.create_task(adapter.aget_item(x=1))
+        await asyncio.sleep(delay)
+
+        for task in adapter._item_batch_tasks:
+            task.cancel()
+
+        await asyncio.wait([pending], timeout=5)
+
+        return await asyncio.wait_for(adapter.aget_item(x=3), timeout=5), pending
+
+    three, pending = asyncio.run(_aget_items())
+
+    assert pending.cancelled()
+    assert three == Model(x=3, y=4)
+    assert len(queries) == 1
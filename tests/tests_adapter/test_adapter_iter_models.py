@@ -0,0 +1,154 @@
+"""Tests for SPARQLModelAdapter.iter_models and SPARQLModelAdapter.aiter_models."""
+
+import asyncio
+from itertools import islice
+
+from pydantic import BaseModel
+import pytest
+from rdflib import Graph
+from rdfproxy import ConfigDict, PaginationMode, QueryParameters, SPARQLModelAdapter
+
+
+class Child(BaseModel):
+    name: str
+
+
+class Parent(BaseModel):
+    model_config = ConfigDict(group_by="parent")
+
+    parent: str
+    children: list[Child]
+
+
+class Row(BaseModel):
+    parent: str
+    name: str
+
+
+query = """
+select ?parent ?name
+where {
+    values (?parent ?name) {
+        ('x' 'a')
+        ('x' 'b')
+        ('y' 'c')
+        ('z' 'd')
+        ('z' 'e')
+        ('z' 'f')
+        ('w' 'g')
+    }
+}
+"""
+
+
+@pytest.fixture
+def adapter_factory(record_queries):
+    def _adapter_factory(**kwargs) -> SPARQLModelAdapter:
+        return record_queries(SPARQLModelAdapter(target=Graph(), query=query, **kwargs))
+
+    return _adapter_factory
+
+
+@pytest.mark.parametrize("model", [Parent, Row])
+@pytest.mark.parametrize("pagination", [PaginationMode.OFFSET, PaginationMode.KEYSET])
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 100])
+def test_iter_models(adapter_factory, queries, model, pagination, size):
+    """Check that iter_models yields all models without count queries."""
+    adapter = adapter_factory(model=model, pagination=pagination)
+
+    models = list(adapter.iter_models(QueryParameters(size=size, order_by="parent")))
+    expected = adapter.get_page(QueryParameters(size=100, order_by="parent")).items
+
+    assert models == expected
+    assert not any("count" in query for query in queries[:-2])
+
+
+def test_iter_models_groups_not_split(adapter_factory, queries):
+    adapter = adapter_factory(model=Parent)
+
+    models = list(adapter.iter_models(QueryParameters(size=1)))
+
+    assert [len(model.children) for model in models] == [1, 2, 1, 3]
+    assert len(queries) == 5
+
+
+def test_iter_models_lazy(adapter_factory, queries):
+    adapter = adapter_factory(model=Row)
+
+    iterator = adapter.iter_models(QueryParameters(size=2))
+    assert queries == []
+
+    assert len(list(islice(iterator, 3))) == 3
+    assert len(queries) == 2
+
+
+def test_iter_models_start_page(adapter_factory):
+    adapter = adapter_factory(model=Parent)
+
+    models = list(adapter.iter_models(QueryParameters(page=2, size=2)))
+
+    assert [model.parent for model in models] == ["y", "z"]
+
+
+@pytest.mark.parametrize("model", [Parent, Row])
+@pytest.mark.parametrize("concurrency", [1, 2, 3, 10])
+@pytest.mark.parametrize("size", [1, 2, 3, 100])
+def test_iter_models_concurrency(adapter_factory, model, concurrency, size):
+    """Check that concurrent chunk queries still yield models in page order."""
+    adapter = adapter_factory(model=model)
+    query_parameters = QueryParameters(size=size, order_by="parent")
+
+    models = list(adapter.iter_models(query_parameters, concurrency=concurrency))
+    expected = adapter.get_page(QueryParameters(size=100, order_by="parent")).items
+
+    assert models == expected
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_aiter_models(adapter_factory, concurrency):
+    adapter = adapter_factory(model=Parent)
+    query_parameters = QueryParameters(size=1, order_by="parent")
+
+    async def _aiter_models():
+        return [
+            model
+            async for model in adapter.aiter_models(
+                query_parameters, concurrency=concurrency
+            )
+        ]
+
+    assert asyncio.run(_aiter_models()) == list(adapter.iter_models(query_parameters))
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 4])
+def test_iter_models_in_flight_limit(monkeypatch, concurrency):
+    """Check that at most concurrency chunk queries are in flight at once."""
+    adapter = SPARQLModelAdapter(target=Graph(), query=query, model=Row)
+    _aquery = adapter.sparqlwrapper._aquery
+    in_flight, max_in_flight = 0, 0
+
+    async def _slow_aquery(query: str):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return await _aquery(query)
+
+    monkeypatch.setattr(adapter.sparqlwrapper, "_aquery", _slow_aquery)
+
+    models = list(adapter.iter_models(QueryParameters(size=1), concurrency=concurrency))
+
+    assert len(models) == 7
+    assert max_in_flight == concurrency
+
+
+def test_iter_models_concurrency_fail(adapter_factory):
+    offset_adapter = adapter_factory(model=Row)
+    keyset_adapter = adapter_factory(model=Row, pagination=PaginationMode.KEYSET)
+
+    with pytest.raises(ValueError):
+        list(offset_adapter.iter_models(concurrency=0))
+
+    with pytest.raises(ValueError):
+        list(keyset_adapter.iter_models(concurrency=2))
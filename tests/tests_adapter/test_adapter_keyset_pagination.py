@@ -0,0 +1,265 @@
+"""Tests for keyset pagination with rdfproxy.SPARQLModelAdapter."""
+
+from itertools import product
+from typing import Annotated
+
+from pydantic import BaseModel, ValidationError
+import pytest
+from rdflib import Graph
+from rdfproxy import (
+    ConfigDict,
+    PaginationMode,
+    QueryParameters,
+    SPARQLBinding,
+    SPARQLModelAdapter,
+)
+from rdfproxy.utils.exceptions import QueryConstructionException
+
+
+query = """
+select ?parent ?child ?name ?label
+where {
+    values (?parent ?child ?name ?label) {
+        ('x' 'c' 'foo' 'l1')
+        ('y' 'd' UNDEF 'l0')
+        ('y' 'e' 'bar' 'l0')
+        ('z' UNDEF UNDEF 'l3')
+        ('w' 'a' 'zzz' 'l1')
+        ('v' 'b' 'aaa' 'l2')
+    }
+}
+"""
+
+
+class Child(BaseModel):
+    child: str | None
+    name: str | None
+
+
+class Parent(BaseModel):
+    model_config = ConfigDict(group_by="parent")
+
+    parent: str
+    label: str
+    children: list[Child]
+
+
+class Row(BaseModel):
+    parent: str
+    child: str | None
+    name: str | None
+    label: str
+
+
+orderings = [(None, None), ("parent", True), ("label", False), ("label", True)]
+row_orderings = [*orderings, ("name", False), ("name", True), ("child", False)]
+
+
+def get_keyset_items(adapter: SPARQLModelAdapter, **query_parameters) -> list:
+    """Page through an adapter following next_cursor."""
+    items, cursor = [], None
+
+    while True:
+        page = adapter.get_page(QueryParameters(cursor=cursor, **query_parameters))
+        items.extend(page.items)
+
+        if (cursor := page.next_cursor) is None:
+            return items
+
+
+@pytest.mark.parametrize(
+    ["model", "ordering", "size"],
+    [
+        *((Parent, ordering, size) for ordering, size in product(orderings, (2, 5))),
+        *((Row, ordering, size) for ordering, size in product(row_orderings, (2,))),
+    ],
+)
+def test_keyset_pagination(model, ordering, size):
+    """Check that paging with cursors yields all items in order exactly once."""
+    order_by, desc = ordering
+    graph = Graph()
+
+    keyset_adapter = SPARQLModelAdapter(
+        target=graph, query=query, model=model, pagination=PaginationMode.KEYSET
+    )
+    offset_adapter = SPARQLModelAdapter(target=graph, query=query, model=model)
+
+    keyset_items = get_keyset_items(
+        keyset_adapter, size=size, order_by=order_by, desc=desc
+    )
+    offset_items = offset_adapter.get_page(
+        QueryParameters(size=100, order_by=order_by, desc=desc)
+    ).items
+
+    assert len(keyset_items) == len(offset_items)
+    assert sorted(map(repr, keyset_items)) == sorted(map(repr, offset_items))
+
+    if order_by is not None:
+        keys = [getattr(item, order_by) for item in keyset_items]
+        assert keys == sorted(
+            keys, key=lambda key: (key is not None, key), reverse=desc
+        )
+
+
+def test_keyset_pagination_iri_keys():
+    iri_query = """
+    select ?s ?o where {
+        values (?s ?o) {
+            (<urn:c> 1) (<urn:a> 2) (<urn:b> 3) (<urn:a> 1)
+        }
+    }
+    """
+
+    class Model(BaseModel):
+        s: str
+        o: int
+
+    adapter = SPARQLModelAdapter(
+        target=Graph(), query=iri_query, model=Model, pagination="keyset"
+    )
+
+    assert get_keyset_items(adapter, size=1) == [
+        Model(s="urn:a", o=1),
+        Model(s="urn:a", o=2),
+        Model(s="urn:b", o=3),
+        Model(s="urn:c", o=1),
+    ]
+
+
+lang_query = """
+select ?label ?id where {
+    values (?label ?id) {
+        ("beta"@en 2) ("alpha"@en 1) ("delta"@en 4) ("alpha"@en 5) ("gamma"@en 3)
+    }
+}
+"""
+
+
+class LangRow(BaseModel):
+    label: str
+    id: int
+
+
+class LangGroup(BaseModel):
+    model_config = ConfigDict(group_by="label")
+
+    label: str
+    ids: Annotated[list[int], SPARQLBinding("id")]
+
+
+@pytest.mark.parametrize("model", [LangRow, LangGroup])
+@pytest.mark.parametrize("ordering", [(None, None), ("label", False), ("label", True)])
+def test_keyset_pagination_lang_tagged_keys(model, ordering):
+    """Check that cursors retain language tags of key values."""
+    order_by, desc = ordering
+    graph = Graph()
+
+    keyset_adapter = SPARQLModelAdapter(
+        target=graph, query=lang_query, model=model, pagination="keyset"
+    )
+    offset_adapter = SPARQLModelAdapter(target=graph, query=lang_query, model=model)
+
+    query_parameters = QueryParameters(size=2, order_by=order_by, desc=desc)
+
+    keyset_items = list(keyset_adapter.iter_models(query_parameters))
+    offset_items = offset_adapter.get_page(
+        QueryParameters(size=100, order_by=order_by, desc=desc)
+    ).items
+
+    assert len(keyset_items) == len(offset_items)
+    assert sorted(map(repr, keyset_items)) == sorted(map(repr, offset_items))
+
+
+def test_keyset_pagination_next_cursor():
+    adapter = SPARQLModelAdapter(
+        target=Graph(), query=query, model=Parent, pagination="keyset"
+    )
+
+    assert adapter.get_page(QueryParameters(size=5)).next_cursor is not None
+    assert adapter.get_page(QueryParameters(size=6)).next_cursor is None
+
+
+def test_offset_pagination_cursor_fail():
+    adapter = SPARQLModelAdapter(target=Graph(), query=query, model=Parent)
+    cursor = (
+        SPARQLModelAdapter(
+            target=Graph(), query=query, model=Parent, pagination="keyset"
+        )
+        .get_page(QueryParameters(size=1))
+        .next_cursor
+    )
+
+    assert adapter.get_page(QueryParameters(size=1)).next_cursor is None
+
+    with pytest.raises(ValueError):
+        adapter.get_page(QueryParameters(size=1, cursor=cursor))
+
+
+def test_keyset_pagination_cursor_mismatch_fail():
+    adapter = SPARQLModelAdapter(
+        target=Graph(), query=query, model=Parent, pagination="keyset"
+    )
+    cursor = adapter.get_page(QueryParameters(size=1, order_by="label")).next_cursor
+
+    with pytest.raises(ValueError):
+        adapter.get_page(QueryParameters(size=1, cursor=cursor))
+
+
+alias_query = """
+select ?parent ?child ?name (str(?label) as ?alias_label)
+where {
+    values (?parent ?child ?name ?label) {
+        ('x' 'c' 'foo' 'l1')
+        ('y' 'd' UNDEF 'l0')
+    }
+}
+"""
+
+
+class AliasChild(BaseModel):
+    child: str | None
+    name: str | None
+
+
+class AliasParent(BaseModel):
+    model_config = ConfigDict(group_by="parent")
+
+    parent: str
+    label: Annotated[str, SPARQLBinding("alias_label")]
+    children: list[AliasChild]
+
+
+class AliasRow(BaseModel):
+    parent: str
+    child: str | None
+    name: str | None
+    label: Annotated[str, SPARQLBinding("alias_label")]
+
+
+@pytest.mark.parametrize(
+    ["model", "order_by"],
+    [(AliasRow, None), (AliasRow, "parent"), (AliasParent, "label")],
+)
+def test_keyset_pagination_alias_key_fail(model, order_by):
+    """Check that keyset keys bound by a projection alias (... AS ?x) fail."""
+    adapter = SPARQLModelAdapter(
+        target=Graph(), query=alias_query, model=model, pagination="keyset"
+    )
+
+    with pytest.raises(QueryConstructionException):
+        adapter.get_page(QueryParameters(size=1, order_by=order_by))
+
+
+def test_keyset_pagination_alias_no_key():
+    """Check that projection aliases that are not keyset keys are allowed."""
+    adapter = SPARQLModelAdapter(
+        target=Graph(), query=alias_query, model=AliasParent, pagination="keyset"
+    )
+
+    page = adapter.get_page(QueryParameters(size=1))
+    assert [item.label for item in page.items] == ["l1"]
+
+
+def test_query_parameters_invalid_cursor():
+    with pytest.raises(ValidationError):
+        QueryParameters(cursor="not a cursor")
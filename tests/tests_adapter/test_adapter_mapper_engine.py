@@ -0,0 +1,88 @@
+"""Tests for the mapper engines of rdfproxy.SPARQLModelAdapter."""
+
+import subprocess
+import sys
+from typing import Annotated
+
+from pydantic import BaseModel
+import pytest
+from rdflib import Graph
+from rdfproxy import (
+    ConfigDict,
+    MapperEngine,
+    QueryParameters,
+    SPARQLBinding,
+    SPARQLModelAdapter,
+)
+
+
+class Child(BaseModel):
+    name: str | None
+
+
+class Parent(BaseModel):
+    model_config = ConfigDict(group_by="parent")
+
+    parent: str
+    children: list[Child]
+    names: Annotated[list[str], SPARQLBinding("name")]
+
+
+class Row(BaseModel):
+    parent: str
+    name: str | None
+
+
+query = """
+select ?parent ?name
+where {
+    values (?parent ?name) {
+        ('x' 'a')
+        ('x' 'b')
+        ('y' 'c')
+        ('z' UNDEF)
+    }
+}
+"""
+
+
+@pytest.mark.parametrize("model", [Parent, Row])
+@pytest.mark.parametrize(
+    "query_parameters", [QueryParameters(), QueryParameters(size=1)]
+)
+def test_adapter_mapper_engines(model, query_parameters):
+    """Check that all mapper engines produce the same models."""
+    pages = [
+        SPARQLModelAdapter(
+            target=Graph(), query=query, model=model, mapper_engine=engine
+        ).get_page(query_parameters)
+        for engine in MapperEngine
+    ]
+
+    assert all(page == pages[0] for page in pages)
+
+
+def test_adapter_mapper_engine_python_no_pandas():
+    """Check that the python mapper engine does not import pandas."""
+    code = f"""
+import sys
+from pydantic import BaseModel
+from rdflib import Graph
+from rdfproxy import SPARQLModelAdapter
+
+class Row(BaseModel):
+    parent: str
+    name: str | None
+
+adapter = SPARQLModelAdapter(
+    target=Graph(), query={query!r}, model=Row, mapper_engine="python"
+)
+assert len(adapter.get_page().items) == 4
+assert "pandas" not in sys.modules
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_adapter_mapper_engine_fail():
+    with pytest.raises(ValueError):
+        SPARQLModelAdapter(target=Graph(), query=query, model=Row, mapper_engine="dne")
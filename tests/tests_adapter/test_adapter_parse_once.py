@@ -0,0 +1,54 @@
+"""Tests for reusing the parsed query of rdfproxy.SPARQLModelAdapter."""
+
+from pydantic import BaseModel
+import pytest
+from rdflib import Graph
+from rdfproxy import ItemLookup, PaginationMode, QueryParameters, SPARQLModelAdapter
+import rdfproxy.utils.sparql_utils
+
+
+class Model(BaseModel):
+    x: int
+    y: str
+
+
+query = """
+select ?x ?y
+where {
+    values (?x ?y) {
+        (1 'a')
+        (2 'b')
+    }
+}
+"""
+
+
+@pytest.mark.parametrize("item_lookup", [ItemLookup.FILTER, ItemLookup.VALUES])
+@pytest.mark.parametrize("pagination", [PaginationMode.OFFSET, PaginationMode.KEYSET])
+def test_adapter_parse_once(monkeypatch, pagination, item_lookup):
+    """Check that the query is parsed only once at adapter initialization."""
+    parse_calls: list[str] = []
+    _parse_query = rdfproxy.utils.sparql_utils.parseQuery
+
+    def _recording_parse_query(query: str):
+        parse_calls.append(query)
+        return _parse_query(query)
+
+    monkeypatch.setattr(
+        rdfproxy.utils.sparql_utils, "parseQuery", _recording_parse_query
+    )
+
+    adapter = SPARQLModelAdapter(
+        target=Graph(),
+        query=query,
+        model=Model,
+        pagination=pagination,
+        item_lookup=item_lookup,
+    )
+    assert len(parse_calls) == 1
+
+    adapter.get_page(QueryParameters(size=1))
+    adapter.get_item(x=1)
+    adapter.get_items(x=[1, 2])
+
+    assert len(parse_calls) == 1
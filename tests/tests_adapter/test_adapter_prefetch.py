@@ -0,0 +1,191 @@
+"""Tests for speculative next page prefetching of rdfproxy.SPARQLModelAdapter."""
+
+import asyncio
+import concurrent.futures
+
+from pydantic import BaseModel
+import pytest
+from rdflib import Graph
+from rdfproxy import (
+    ConfigDict,
+    CountPolicy,
+    PaginationMode,
+    QueryParameters,
+    SPARQLModelAdapter,
+)
+
+
+class Child(BaseModel):
+    name: str
+
+
+class Parent(BaseModel):
+    model_config = ConfigDict(group_by="parent")
+
+    parent: str
+    children: list[Child]
+
+
+class Row(BaseModel):
+    parent: str
+    name: str
+
+
+query = """
+select ?parent ?name
+where {
+    values (?parent ?name) {
+        ('x' 'a')
+        ('x' 'b')
+        ('y' 'c')
+        ('z' 'd')
+        ('w' 'e')
+    }
+}
+"""
+
+
+@pytest.fixture
+def adapter_factory(record_queries):
+    def _adapter_factory(**kwargs) -> SPARQLModelAdapter:
+        return record_queries(SPARQLModelAdapter(target=Graph(), query=query, **kwargs))
+
+    return _adapter_factory
+
+
+def wait_for_prefetches(adapter: SPARQLModelAdapter) -> None:
+    concurrent.futures.wait(list(adapter._prefetches.values()))
+
+
+@pytest.mark.parametrize("model", [Parent, Row])
+@pytest.mark.parametrize("pagination", [PaginationMode.OFFSET, PaginationMode.KEYSET])
+def test_adapter_prefetch_pages(adapter_factory, queries, model, pagination):
+    """Check that consecutive pages are served from prefetched items queries."""
+    adapter = adapter_factory(
+        model=model,
+        pagination=pagination,
+        count_policy=CountPolicy.DISABLED,
+        prefetch_pages=1,
+    )
+    reference_adapter = SPARQLModelAdapter(
+        target=Graph(), query=query, model=model, pagination=pagination
+    )
+
+    query_parameters = QueryParameters(size=2, order_by="parent")
+    pages = []
+
+    while True:
+        page = adapter.get_page(query_parameters)
+        pages.append(page)
+        wait_for_prefetches(adapter)
+
+        if page.next_cursor is None and len(page.items) < query_parameters.size:
+            break
+
+        query_parameters = adapter._get_next_chunk_parameters(
+            query_parameters, page.next_cursor
+        )
+
+    reference_query_parameters = QueryParameters(size=100, order_by="parent")
+    assert [item for page in pages for item in page.items] == (
+        reference_adapter.get_page(reference_query_parameters).items
+    )
+    assert len(queries) == len(pages)
+
+
+def test_adapter_prefetch_last_page(adapter_factory, queries):
+    adapter = adapter_factory(model=Row, prefetch_pages=1)
+
+    adapter.get_page(QueryParameters(page=3, size=2))
+    adapter.get_page(QueryParameters(size=5))
+
+    assert not adapter._prefetches
+    assert len(queries) == 4
+
+
+def test_adapter_prefetch_count_query(adapter_factory, queries):
+    """Check that count queries are run according to count_policy for prefetched pages."""
+    adapter = adapter_factory(model=Row, prefetch_pages=1)
+
+    adapter.get_page(QueryParameters(size=2))
+    wait_for_prefetches(adapter)
+    page = adapter.get_page(QueryParameters(page=2, size=2))
+    wait_for_prefetches(adapter)
+
+    assert (page.total, page.pages) == (5, 3)
+    assert sum("count" in query for query in queries) == 2
+    assert len(queries) == 5
+
+
+def test_adapter_prefetch_limit(monkeypatch):
+    """Check that at most prefetch_pages prefetches are in flight at once."""
+    adapter = SPARQLModelAdapter(
+        target=Graph(),
+        query=query,
+        model=Row,
+        count_policy=CountPolicy.DISABLED,
+        prefetch_pages=1,
+    )
+
+    async def _pending_aprefetch(items_query: str):
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(adapter, "_aprefetch", _pending_aprefetch)
+
+    adapter.get_page(QueryParameters(page=1, size=1))
+    adapter.get_page(QueryParameters(page=3, size=1))
+
+    assert len(adapter._prefetches) == 1
+    assert "offset 1" in next(iter(adapter._prefetches)).lower()
+
+    adapter.close()
+    assert not adapter._prefetches
+
+
+def test_adapter_aget_page_prefetch(adapter_factory, queries):
+    """Check that aget_page prefetches run as tasks on the caller's event loop."""
+    adapter = adapter_factory(
+        model=Parent, count_policy=CountPolicy.DISABLED, prefetch_pages=1
+    )
+
+    async def _aget_pages():
+        page_1 = await adapter.aget_page(QueryParameters(page=1, size=1))
+        (prefetch,) = adapter._prefetches.values()
+
+        assert isinstance(prefetch, asyncio.Task)
+        assert prefetch.get_loop() is asyncio.get_running_loop()
+
+        page_2 = await adapter.aget_page(QueryParameters(page=2, size=1))
+        await asyncio.wait(list(adapter._prefetches.values()))
+
+        return page_1, page_2
+
+    page_1, page_2 = asyncio.run(_aget_pages())
+
+    assert [page_1.items[0].parent, page_2.items[0].parent] == ["w", "x"]
+    assert len(queries) == 3
+    assert not adapter._prefetches
+
+
+def test_adapter_aget_page_prefetch_aclose(adapter_factory, queries):
+    """Check that SPARQLModelAdapter.aclose cancels pending aget_page prefetches."""
+    adapter = adapter_factory(
+        model=Parent, count_policy=CountPolicy.DISABLED, prefetch_pages=1
+    )
+
+    async def _aget_page():
+        await adapter.aget_page(QueryParameters(page=1, size=1))
+        (prefetch,) = adapter._prefetches.values()
+
+        await adapter.aclose()
+        await asyncio.wait([prefetch])
+
+        return prefetch
+
+    assert asyncio.run(_aget_page()).cancelled()
+    assert not adapter._prefetches
+
+
+def test_adapter_prefetch_pages_fail():
+    with pytest.raises(ValueError):
+        SPARQLModelAdapter(target=Graph(), query=query, model=Row, prefetch_pages=0)
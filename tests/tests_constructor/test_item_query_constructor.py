@@ -2,11 +2,11 @@
 
 from typing import Annotated, Any, Generic, NamedTuple
 
-from pydantic import BaseModel
+from pydantic import AnyUrl, BaseModel
 import pytest
 from rdflib import XSD
 from rdfproxy.constructor import _ItemQueryConstructor
-from rdfproxy.utils._types import SPARQLBinding, _TModelInstance
+from rdfproxy.utils._types import ItemLookup, SPARQLBinding, _TModelInstance
 
 
 class ConstructorParameters(NamedTuple, Generic[_TModelInstance]):
@@ -19,12 +19,19 @@ class ConstructorParameters(NamedTuple, Generic[_TModelInstance]):
 
     expected: str
 
+    lookup: ItemLookup = ItemLookup.FILTER
+
 
 class Model(BaseModel):
     x: int
     y: Annotated[int, SPARQLBinding("y_alias")]
 
 
+class IRIModel(BaseModel):
+    s: AnyUrl
+    t: Annotated[AnyUrl | None, SPARQLBinding("t_alias")]
+
+
 constructor_parameters = [
     ConstructorParameters(
         key={"x": 1},
@@ -58,6 +65,95 @@ constructor_parameters = [
         model=Model,
         expected='select * where {?x <urn:p> ?y filter (?x = "1"@en) }',
     ),
+    ConstructorParameters(
+        key={"s": "https://test.uri/"},
+        xsd_type=None,
+        lang_tag=None,
+        query="select * where {?s <urn:p> ?y}",
+        model=IRIModel,
+        expected='select * where {?s <urn:p> ?y filter (str(?s) = "https://test.uri/") }',
+    ),
+    ConstructorParameters(
+        key={"x": 1},
+        xsd_type=XSD.integer,
+        lang_tag=None,
+        query="select * where {?x <urn:p> ?y}",
+        model=Model,
+        expected=f'select * where {{ values ?x {{ "1"^^<{XSD.integer}> }} ?x <urn:p> ?y}}',
+        lookup=ItemLookup.VALUES,
+    ),
+    ConstructorParameters(
+        key={"x": 1},
+        xsd_type=None,
+        lang_tag="en",
+        query="select * where {?x <urn:p> ?y}",
+        model=Model,
+        expected='select * where { values ?x { "1"@en } ?x <urn:p> ?y}',
+        lookup=ItemLookup.VALUES,
+    ),
+    ConstructorParameters(
+        key={"x": "01"},
+        xsd_type=XSD.integer,
+        lang_tag=None,
+        query="select * where {?x <urn:p> ?y}",
+        model=Model,
+        expected=f'select * where {{ values ?x {{ "1"^^<{XSD.integer}> }} ?x <urn:p> ?y}}',
+        lookup=ItemLookup.VALUES,
+    ),
+    ConstructorParameters(
+        key={"s": "https://test.uri/"},
+        xsd_type=None,
+        lang_tag=None,
+        query="select * where {?s <urn:p> ?y}",
+        model=IRIModel,
+        expected="select * where { values ?s { <https://test.uri/> } ?s <urn:p> ?y}",
+        lookup=ItemLookup.VALUES,
+    ),
+    ConstructorParameters(
+        key={"t": "https://test.uri/"},
+        xsd_type=None,
+        lang_tag=None,
+        query="select * where {?s <urn:p> ?t_alias}",
+        model=IRIModel,
+        expected="select * where { values ?t_alias { <https://test.uri/> } ?s <urn:p> ?t_alias}",
+        lookup=ItemLookup.VALUES,
+    ),
+    ConstructorParameters(
+        key={"s": "not an IRI"},
+        xsd_type=None,
+        lang_tag=None,
+        query="select * where {?s <urn:p> ?y}",
+        model=IRIModel,
+        expected='select * where {?s <urn:p> ?y filter (str(?s) = "not an IRI") }',
+        lookup=ItemLookup.VALUES,
+    ),
+    ConstructorParameters(
+        key={"x": 1},
+        xsd_type=XSD.integer,
+        lang_tag=None,
+        query='select * where {?s <urn:p> ?y bind ("1" as ?x)}',
+        model=Model,
+        expected=f'select * where {{?s <urn:p> ?y bind ("1" as ?x) filter (?x = "1"^^<{XSD.integer}>) }}',
+        lookup=ItemLookup.VALUES,
+    ),
+    ConstructorParameters(
+        key={"x": 1},
+        xsd_type=None,
+        lang_tag="en",
+        query="select * where {?s <urn:p> ?y optional {?s <urn:q> ?x}}",
+        model=Model,
+        expected='select * where {?s <urn:p> ?y optional {?s <urn:q> ?x} filter (?x = "1"@en) }',
+        lookup=ItemLookup.VALUES,
+    ),
+    ConstructorParameters(
+        key={"t": "https://test.uri/"},
+        xsd_type=None,
+        lang_tag=None,
+        query="select * where {?s <urn:p> ?y optional {?s <urn:q> ?t_alias}}",
+        model=IRIModel,
+        expected='select * where {?s <urn:p> ?y optional {?s <urn:q> ?t_alias} filter (str(?t_alias) = "https://test.uri/") }',
+        lookup=ItemLookup.VALUES,
+    ),
 ]
 
 
@@ -69,6 +165,7 @@ def test_item_query_constructor(params):
         lang_tag=params.lang_tag,
         query=params.query,
         model=params.model,
+        lookup=params.lookup,
     )
 
     item_query = constructor.get_item_query()
@@ -0,0 +1,137 @@
+"""Basic tests for the _ItemsQueryConstructor class."""
+
+from typing import Annotated
+
+from pydantic import AnyUrl, BaseModel
+import pytest
+from rdflib import XSD
+from rdfproxy.constructor import _ItemsQueryConstructor
+from rdfproxy.utils._types import ItemLookup, SPARQLBinding
+
+
+class Model(BaseModel):
+    x: int
+    y: Annotated[int, SPARQLBinding("y_alias")]
+    s: AnyUrl
+
+
+query = "select * where {?x <urn:p> ?y}"
+
+
+@pytest.mark.parametrize(
+    ["key", "xsd_type", "lang_tag", "expected"],
+    [
+        (
+            {"x": [1, 2]},
+            None,
+            None,
+            'select * where {?x <urn:p> ?y filter (str(?x) in ("1", "2")) }',
+        ),
+        (
+            {"y": [1]},
+            None,
+            None,
+            'select * where {?x <urn:p> ?y filter (str(?y_alias) in ("1")) }',
+        ),
+        (
+            {"x": [1, 2]},
+            XSD.integer,
+            None,
+            f'select * where {{?x <urn:p> ?y filter (?x in ("1"^^<{XSD.integer}>, "2"^^<{XSD.integer}>)) }}',
+        ),
+        (
+            {"x": ["a", 'b"']},
+            None,
+            "en",
+            'select * where {?x <urn:p> ?y filter (?x in ("a"@en, "b\\""@en)) }',
+        ),
+        (
+            {"s": ["urn:a", "urn:b"]},
+            None,
+            None,
+            'select * where {?x <urn:p> ?y filter (str(?s) in ("urn:a", "urn:b")) }',
+        ),
+    ],
+)
+def test_items_query_constructor(key, xsd_type, lang_tag, expected):
+    constructor = _ItemsQueryConstructor(
+        key=key, xsd_type=xsd_type, lang_tag=lang_tag, query=query, model=Model
+    )
+
+    assert constructor.get_items_query() == expected
+
+
+@pytest.mark.parametrize(
+    ["key", "xsd_type", "lang_tag", "query", "expected"],
+    [
+        (
+            {"x": [1, 2]},
+            XSD.integer,
+            None,
+            query,
+            f'select * where {{ values ?x {{ "1"^^<{XSD.integer}> "2"^^<{XSD.integer}> }} ?x <urn:p> ?y}}',
+        ),
+        (
+            {"x": ["a", 'b"']},
+            None,
+            "en",
+            query,
+            'select * where { values ?x { "a"@en "b\\""@en } ?x <urn:p> ?y}',
+        ),
+        (
+            {"s": ["urn:a", "urn:b"]},
+            None,
+            None,
+            "select * where {?s <urn:p> ?y}",
+            "select * where { values ?s { <urn:a> <urn:b> } ?s <urn:p> ?y}",
+        ),
+        (
+            {"s": ["urn:a", "not an IRI"]},
+            None,
+            None,
+            "select * where {?s <urn:p> ?y}",
+            'select * where {?s <urn:p> ?y filter (str(?s) in ("urn:a", "not an IRI")) }',
+        ),
+        (
+            {"s": ["urn:a", "urn:b"]},
+            None,
+            None,
+            query,
+            'select * where {?x <urn:p> ?y filter (str(?s) in ("urn:a", "urn:b")) }',
+        ),
+        (
+            {"x": [1, 2]},
+            XSD.integer,
+            None,
+            "select * where {?s <urn:p> ?y bind (1 as ?x)}",
+            f'select * where {{?s <urn:p> ?y bind (1 as ?x) filter (?x in ("1"^^<{XSD.integer}>, "2"^^<{XSD.integer}>)) }}',
+        ),
+        (
+            {"x": ["a"]},
+            None,
+            "en",
+            "select * where {?s <urn:p> ?y optional {?s <urn:q> ?x}}",
+            'select * where {?s <urn:p> ?y optional {?s <urn:q> ?x} filter (?x in ("a"@en)) }',
+        ),
+    ],
+)
+def test_items_query_constructor_values(key, xsd_type, lang_tag, query, expected):
+    constructor = _ItemsQueryConstructor(
+        key=key,
+        xsd_type=xsd_type,
+        lang_tag=lang_tag,
+        query=query,
+        model=Model,
+        lookup=ItemLookup.VALUES,
+    )
+
+    assert constructor.get_items_query() == expected
+
+
+def test_items_query_constructor_fail():
+    constructor = _ItemsQueryConstructor(
+        key={"x": [1]}, xsd_type=XSD.integer, lang_tag="en", query=query, model=Model
+    )
+
+    with pytest.raises(ValueError):
+        constructor.get_items_query()
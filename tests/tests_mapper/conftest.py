@@ -0,0 +1,18 @@
+"""Pytest fixture definitions for rdfproxy.mapper tests."""
+
+import pytest
+from rdfproxy import MapperEngine
+from rdfproxy.mapper import _ModelBindingsMapper
+
+
+@pytest.fixture(autouse=True, params=list(MapperEngine))
+def mapper_engine(request, monkeypatch) -> MapperEngine:
+    """Autouse fixture for running all mapper tests against all mapper engines."""
+    engine: MapperEngine = request.param
+    _init = _ModelBindingsMapper.__init__
+
+    def _engine_init(self, model, bindings, engine=engine):
+        _init(self, model=model, bindings=bindings, engine=engine)
+
+    monkeypatch.setattr(_ModelBindingsMapper, "__init__", _engine_init)
+    return engine
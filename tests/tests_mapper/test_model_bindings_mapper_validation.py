@@ -0,0 +1,63 @@
+"""Tests for model validation in rdfproxy.mapper._ModelBindingsMapper."""
+
+from collections import Counter
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+import pytest
+from rdfproxy.mapper import _ModelBindingsMapper
+
+
+validations: Counter = Counter()
+
+
+class Child(BaseModel):
+    name: str
+
+    @field_validator("name")
+    @classmethod
+    def _count_name(cls, value):
+        validations["child"] += 1
+        return value
+
+
+class Parent(BaseModel):
+    model_config = ConfigDict(group_by="parent")
+
+    parent: str
+    age: int = Field(ge=0)
+    children: list[Child]
+
+    @field_validator("parent")
+    @classmethod
+    def _count_parent(cls, value):
+        validations["parent"] += 1
+        return value
+
+
+bindings = [
+    {"parent": "x", "age": 1, "name": "a"},
+    {"parent": "x", "age": 1, "name": "b"},
+    {"parent": "y", "age": 2, "name": "c"},
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_validations():
+    validations.clear()
+
+
+def test_model_bindings_mapper_validate_once():
+    """Check that every model instance is validated exactly once."""
+    models = _ModelBindingsMapper(Parent, bindings).get_models()
+
+    assert [model.parent for model in models] == ["x", "y"]
+    assert validations == {"parent": 2, "child": 3}
+
+
+def test_model_bindings_mapper_validation_error():
+    invalid_bindings = [{**binding, "age": -1} for binding in bindings]
+
+    with pytest.raises(ValidationError) as e:
+        _ModelBindingsMapper(Parent, invalid_bindings).get_models()
+
+    assert [error["loc"] for error in e.value.errors()] == [("age",)]
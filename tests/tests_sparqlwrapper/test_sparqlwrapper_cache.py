@@ -0,0 +1,96 @@
+"""Tests for rdfproxy.SPARQLWrapper result caching."""
+
+import threading
+
+import httpx
+from rdflib import Graph, URIRef
+from rdfproxy.cache import MemoryCache, SQLiteCache
+from rdfproxy.sparqlwrapper import SPARQLWrapper
+
+
+target = "https://test.endpoint/sparql"
+
+
+def test_sparqlwrapper_cache():
+    """Check that cache hits skip requests against the target."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "head": {"vars": ["x"]},
+                "results": {"bindings": [{"x": {"type": "uri", "value": "urn:x"}}]},
+            },
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sparql_wrapper = SPARQLWrapper(target=target, client=client, cache=MemoryCache())
+
+    for _ in range(3):
+        result, *_ = sparql_wrapper.queries("select * where {?x ?p ?o}")
+        assert list(result) == [{"x": URIRef("urn:x")}]
+
+    assert len(requests) == 1
+
+    sparql_wrapper.queries("select * where {?x ?p ?o} limit 1")
+    assert len(requests) == 2
+
+
+def test_sparqlwrapper_cache_graph_targets():
+    """Check that cache keys discriminate Graph targets."""
+    cache = MemoryCache()
+    graph_1, graph_2 = Graph(), Graph()
+    graph_2.add((URIRef("urn:s"), URIRef("urn:p"), URIRef("urn:o")))
+
+    query = "select (count(*) as ?cnt) where {?s ?p ?o}"
+
+    (result_1, *_), *_ = SPARQLWrapper(target=graph_1, cache=cache).queries(query)
+    (result_2, *_), *_ = SPARQLWrapper(target=graph_2, cache=cache).queries(query)
+
+    assert result_1 == {"cnt": 0}
+    assert result_2 == {"cnt": 1}
+
+
+def test_sparqlwrapper_cache_graph_targets_identifier():
+    """Check that cache keys discriminate Graph targets with the same identifier."""
+    cache = MemoryCache()
+    graph_1, graph_2 = Graph(identifier="urn:graph"), Graph(identifier="urn:graph")
+    graph_2.add((URIRef("urn:s"), URIRef("urn:p"), URIRef("urn:o")))
+
+    query = "select (count(*) as ?cnt) where {?s ?p ?o}"
+
+    (result_1, *_), *_ = SPARQLWrapper(target=graph_1, cache=cache).queries(query)
+    (result_2, *_), *_ = SPARQLWrapper(target=graph_2, cache=cache).queries(query)
+
+    assert result_1 == {"cnt": 0}
+    assert result_2 == {"cnt": 1}
+
+
+def test_sparqlwrapper_cache_off_event_loop(tmp_path):
+    """Check that blocking cache backends are not accessed on the event loop thread."""
+    cache_threads: set[int] = set()
+
+    class _SQLiteCache(SQLiteCache):
+        def get(self, key):
+            cache_threads.add(threading.get_ident())
+            return super().get(key)
+
+        def set(self, key, value):
+            cache_threads.add(threading.get_ident())
+            super().set(key, value)
+
+    sparql_wrapper = SPARQLWrapper(
+        target=Graph(), cache=_SQLiteCache(path=str(tmp_path / "cache.sqlite"))
+    )
+
+    async def _aqueries_loop_thread():
+        result, *_ = await sparql_wrapper.aqueries("select * where {?s ?p ?o}")
+        return list(result), threading.get_ident()
+
+    for _ in range(2):
+        result, loop_thread = sparql_wrapper.run(_aqueries_loop_thread())
+        assert result == []
+
+    assert cache_threads and loop_thread not in cache_threads
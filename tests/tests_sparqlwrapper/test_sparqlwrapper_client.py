@@ -0,0 +1,214 @@
+"""Tests for the pooled httpx.AsyncClient of rdfproxy.SPARQLWrapper."""
+
+import gc
+import threading
+
+from pydantic import BaseModel
+import httpx
+from rdflib import Graph, URIRef
+from rdfproxy import SPARQLModelAdapter
+from rdfproxy.sparqlwrapper import SPARQLWrapper
+
+
+target = "https://test.endpoint/sparql"
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if b"count" in request.content:
+        return httpx.Response(
+            200,
+            json={
+                "head": {"vars": ["cnt"]},
+                "results": {"bindings": [{"cnt": {"type": "literal", "value": "1"}}]},
+            },
+        )
+
+    return httpx.Response(
+        200,
+        json={
+            "head": {"vars": ["x"]},
+            "results": {"bindings": [{"x": {"type": "uri", "value": "urn:x"}}]},
+        },
+    )
+
+
+class Model(BaseModel):
+    x: str
+
+
+def test_sparqlwrapper_reuses_client(monkeypatch):
+    """Check that subsequent synchronous calls use the same pooled client."""
+    clients: list[httpx.AsyncClient] = []
+    _AsyncClient = httpx.AsyncClient
+
+    def _client_factory(**kwargs):
+        client = _AsyncClient(transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr("rdfproxy.sparqlwrapper.httpx.AsyncClient", _client_factory)
+
+    with SPARQLWrapper(target=target) as sparql_wrapper:
+        for _ in range(3):
+            result, *_ = sparql_wrapper.queries("select * where {?x ?p ?o}")
+            assert list(result) == [{"x": URIRef("urn:x")}]
+
+    assert len(clients) == 1
+    assert clients[0].is_closed
+
+
+def test_sparqlwrapper_client_limits():
+    """Check that the pool configuration is passed to the client."""
+    limits = httpx.Limits(max_connections=5, keepalive_expiry=30)
+    sparql_wrapper = SPARQLWrapper(target=target, limits=limits, timeout=10)
+
+    async def _get_client():
+        return sparql_wrapper._get_client()
+
+    client = sparql_wrapper.run(_get_client())
+
+    assert client.timeout == httpx.Timeout(10)
+    assert client._transport._pool._max_connections == 5
+    assert client._transport._pool._keepalive_expiry == 30
+
+    sparql_wrapper.close()
+    assert client.is_closed
+
+
+def test_sparqlwrapper_external_client_not_closed():
+    """Check that a client passed to SPARQLWrapper is used but not closed."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sparql_wrapper = SPARQLWrapper(target=target, client=client)
+
+    result, *_ = sparql_wrapper.queries("select * where {?x ?p ?o}")
+    assert list(result) == [{"x": URIRef("urn:x")}]
+
+    sparql_wrapper.close()
+    assert not client.is_closed
+
+
+def test_adapters_share_sparqlwrapper():
+    """Check that SPARQLModelAdapters can share a SPARQLWrapper instance."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sparql_wrapper = SPARQLWrapper(target=target, client=client)
+
+    adapters = [
+        SPARQLModelAdapter(
+            target=sparql_wrapper, query="select * where {?x ?p ?o}", model=Model
+        )
+        for _ in range(2)
+    ]
+
+    for adapter in adapters:
+        assert adapter.sparqlwrapper is sparql_wrapper
+        assert adapter.get_page().items == [Model(x="urn:x")]
+
+
+def test_adapter_close_shared_sparqlwrapper(monkeypatch):
+    """Check that closing an adapter does not close a SPARQLWrapper shared with other adapters."""
+    clients: list[httpx.AsyncClient] = []
+    _AsyncClient = httpx.AsyncClient
+
+    def _client_factory(**kwargs):
+        client = _AsyncClient(transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr("rdfproxy.sparqlwrapper.httpx.AsyncClient", _client_factory)
+
+    sparql_wrapper = SPARQLWrapper(target=target)
+    adapter_1, adapter_2 = (
+        SPARQLModelAdapter(
+            target=sparql_wrapper, query="select * where {?x ?p ?o}", model=Model
+        )
+        for _ in range(2)
+    )
+
+    assert adapter_1.get_page().items == [Model(x="urn:x")]
+    adapter_1.close()
+
+    (client,) = clients
+    assert not client.is_closed
+    assert adapter_2.get_page().items == [Model(x="urn:x")]
+    assert len(clients) == 1
+
+    sparql_wrapper.close()
+    assert client.is_closed
+
+
+def test_adapter_close_own_sparqlwrapper(monkeypatch):
+    """Check that closing an adapter closes the SPARQLWrapper created by the adapter."""
+    clients: list[httpx.AsyncClient] = []
+    _AsyncClient = httpx.AsyncClient
+
+    def _client_factory(**kwargs):
+        client = _AsyncClient(transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr("rdfproxy.sparqlwrapper.httpx.AsyncClient", _client_factory)
+
+    adapter = SPARQLModelAdapter(
+        target=target, query="select * where {?x ?p ?o}", model=Model
+    )
+    adapter.get_page()
+    adapter.close()
+
+    (client,) = clients
+    assert client.is_closed
+
+
+def _get_thread_count() -> int:
+    """Count threads except workers of the (bounded) default executor of event loops."""
+    return sum(
+        not thread.name.startswith("asyncio_") for thread in threading.enumerate()
+    )
+
+
+def test_dropped_adapters_release_threads():
+    """Check that adapters which are not closed do not leave threads behind."""
+
+    def _get_page() -> None:
+        adapter = SPARQLModelAdapter(
+            target=Graph(), query="select * where {?x ?p ?o}", model=Model
+        )
+        adapter.get_page()
+
+    _get_page()
+    gc.collect()
+    baseline = _get_thread_count()
+
+    for _ in range(50):
+        _get_page()
+
+    gc.collect()
+    assert _get_thread_count() <= baseline
+
+
+def test_dropped_sparqlwrapper_closes_client(monkeypatch):
+    """Check that the pooled client of a garbage-collected SPARQLWrapper is closed."""
+    clients: list[httpx.AsyncClient] = []
+    _AsyncClient = httpx.AsyncClient
+
+    def _client_factory(**kwargs):
+        client = _AsyncClient(transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr("rdfproxy.sparqlwrapper.httpx.AsyncClient", _client_factory)
+
+    sparql_wrapper = SPARQLWrapper(target=target)
+    sparql_wrapper.queries("select * where {?x ?p ?o}")
+
+    del sparql_wrapper
+    gc.collect()
+
+    async def _noop() -> None:
+        pass
+
+    # closing is scheduled on the shared loop, run a coroutine after it
+    SPARQLWrapper(target=target).run(_noop())
+    SPARQLWrapper(target=target).run(_noop())
+
+    (client,) = clients
+    assert client.is_closed
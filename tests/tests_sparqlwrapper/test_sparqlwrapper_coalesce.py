@@ -0,0 +1,93 @@
+"""Tests for single-flight coalescing of identical rdfproxy.SPARQLWrapper queries."""
+
+import asyncio
+
+import httpx
+import pytest
+from rdflib import URIRef
+from rdfproxy.sparqlwrapper import SPARQLWrapper
+
+
+target = "https://test.endpoint/sparql"
+
+
+@pytest.fixture
+def requests() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+def client(requests) -> httpx.AsyncClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.05)
+
+        if b"fail" in request.content:
+            return httpx.Response(500)
+
+        return httpx.Response(
+            200,
+            json={
+                "head": {"vars": ["x"]},
+                "results": {"bindings": [{"x": {"type": "uri", "value": "urn:x"}}]},
+            },
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_sparqlwrapper_coalesce_queries(client, requests):
+    """Check that concurrent identical queries result in a single request."""
+    sparql_wrapper = SPARQLWrapper(target=target, client=client)
+    query = "select * where {?x ?p ?o}"
+
+    results = sparql_wrapper.queries(*[query] * 5, "select ?x where {?x ?p ?o}")
+
+    assert len(requests) == 2
+    assert all(list(result) == [{"x": URIRef("urn:x")}] for result in results)
+
+    sparql_wrapper.queries(query)
+    assert len(requests) == 3
+
+
+def test_sparqlwrapper_coalesce_queries_disabled(client, requests):
+    sparql_wrapper = SPARQLWrapper(target=target, client=client, coalesce_queries=False)
+
+    sparql_wrapper.queries(*["select * where {?x ?p ?o}"] * 5)
+    assert len(requests) == 5
+
+
+def test_sparqlwrapper_coalesce_queries_fail(client, requests):
+    """Check that errors are propagated to all waiting callers."""
+    sparql_wrapper = SPARQLWrapper(target=target, client=client)
+
+    async def _aqueries():
+        return await asyncio.gather(
+            *(sparql_wrapper.aqueries("select * where {fail}") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(_aqueries())
+
+    assert len(requests) == 1
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+
+
+def test_sparqlwrapper_coalesce_queries_cancel(client, requests):
+    """Check that cancelling a caller does not cancel the shared query."""
+    sparql_wrapper = SPARQLWrapper(target=target, client=client)
+    query = "select * where {?x ?p ?o}"
+
+    async def _aqueries():
+        cancelled = asyncio.create_task(sparql_wrapper.aqueries(query))
+        waiting = asyncio.create_task(sparql_wrapper.aqueries(query))
+
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+
+        return await waiting
+
+    result, *_ = asyncio.run(_aqueries())
+
+    assert len(requests) == 1
+    assert list(result) == [{"x": URIRef("urn:x")}]
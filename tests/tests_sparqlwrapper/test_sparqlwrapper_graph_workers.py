@@ -0,0 +1,45 @@
+"""Tests for running rdflib.Graph queries in SPARQLWrapper worker processes."""
+
+from rdflib import Graph, URIRef
+from rdfproxy.sparqlwrapper import SPARQLWrapper
+
+
+query = "select ?s ?o where {?s <urn:p> ?o} order by ?o"
+
+
+def _get_graph() -> Graph:
+    graph = Graph()
+    graph.parse(
+        data="<urn:a> <urn:p> 1, 2 . <urn:b> <urn:p> 3 .",
+        format="turtle",
+    )
+    return graph
+
+
+def test_sparqlwrapper_graph_workers():
+    """Check that graph worker queries produce the same bindings as thread queries."""
+    graph = _get_graph()
+    expected, *_ = SPARQLWrapper(target=graph).queries(query)
+
+    with SPARQLWrapper(target=graph, graph_workers=2) as sparql_wrapper:
+        items, count = sparql_wrapper.queries(
+            query, "select (count(*) as ?cnt) where {?s ?p ?o}"
+        )
+
+        assert list(items) == list(expected)
+        assert list(count) == [{"cnt": 3}]
+        assert sparql_wrapper._process_pool is not None
+
+    assert sparql_wrapper._process_pool is None
+
+
+def test_sparqlwrapper_graph_workers_snapshot():
+    """Check that graph workers operate on the graph state at pool start."""
+    graph = _get_graph()
+
+    with SPARQLWrapper(target=graph, graph_workers=1) as sparql_wrapper:
+        before, *_ = sparql_wrapper.queries(query)
+        graph.add((URIRef("urn:c"), URIRef("urn:p"), URIRef("urn:o")))
+        after, *_ = sparql_wrapper.queries(query)
+
+        assert list(before) == list(after)
@@ -0,0 +1,76 @@
+"""Tests for the scope of the SPARQL parser lock in rdflib.Graph queries of SPARQLWrapper."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from rdflib import Graph
+from rdflib.plugins.sparql.sparql import Query
+import rdfproxy.sparqlwrapper
+from rdfproxy.sparqlwrapper import SPARQLWrapper
+from rdfproxy.utils.sparql_utils import _SPARQL_PARSER_LOCK
+
+
+query = "select ?s ?o where {?s <urn:p> ?o} order by ?o"
+
+
+def _is_parser_lock_free() -> bool:
+    """Check from another thread if the (reentrant) SPARQL parser lock is free."""
+
+    def _try_acquire() -> bool:
+        if acquired := _SPARQL_PARSER_LOCK.acquire(blocking=False):
+            _SPARQL_PARSER_LOCK.release()
+        return acquired
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_try_acquire).result()
+
+
+class LockCheckingGraph(Graph):
+    """Graph that records the query argument and the parser lock state of Graph.query calls."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.query_calls: list[tuple[object, bool]] = []
+
+    def query(self, query_object, *args, **kwargs):
+        self.query_calls.append((query_object, _is_parser_lock_free()))
+        return super().query(query_object, *args, **kwargs)
+
+
+def test_sparqlwrapper_graph_query_outside_parser_lock():
+    """Check that only query parsing holds the parser lock, not Graph.query."""
+    graph = LockCheckingGraph()
+    graph.parse(data="<urn:a> <urn:p> 1, 2 .", format="turtle")
+
+    with SPARQLWrapper(target=graph) as sparql_wrapper:
+        result, *_ = sparql_wrapper.queries(query)
+
+    assert [binding["o"] for binding in result] == [1, 2]
+
+    ((query_object, lock_free),) = graph.query_calls
+    assert isinstance(query_object, Query)
+    assert lock_free
+
+
+def test_sparqlwrapper_graph_bindings_outside_parser_lock(monkeypatch):
+    """Check that query results are materialized to bindings outside the parser lock."""
+    lock_checks: list[bool] = []
+    _get_bindings = rdfproxy.sparqlwrapper.get_bindings_from_query_result
+
+    def _lock_checking_get_bindings(result):
+        for binding in _get_bindings(result):
+            lock_checks.append(_is_parser_lock_free())
+            yield binding
+
+    monkeypatch.setattr(
+        rdfproxy.sparqlwrapper,
+        "get_bindings_from_query_result",
+        _lock_checking_get_bindings,
+    )
+
+    graph = Graph()
+    graph.parse(data="<urn:a> <urn:p> 1, 2 .", format="turtle")
+
+    result, *_ = SPARQLWrapper(target=graph).queries(query)
+
+    assert [binding["o"] for binding in result] == [1, 2]
+    assert lock_checks == [True, True]
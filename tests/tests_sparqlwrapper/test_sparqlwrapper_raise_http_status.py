@@ -1,5 +1,6 @@
 """Pytest entry point for SPARQLWrapper tests that raise httpx.HTTPStatusError exceptions."""
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -40,3 +41,29 @@ def test_sparqlwrapper_raise_for_status(param):
     ):
         with pytest.raises(httpx.HTTPStatusError, match=error_message_match):
             sparql_wrapper.queries(query)
+
+
+def test_sparqlwrapper_raise_for_status_cancels_queries():
+    """Check that a failing query cancels the other queries of SPARQLWrapper.queries."""
+    target = "https://test.endpoint/sparql"
+    cancelled: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if b"fail" in request.content:
+            return httpx.Response(400, json={"text": "Oh noooo!"})
+
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(request.content.decode())
+            raise
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sparql_wrapper = SPARQLWrapper(target=target, client=client)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        sparql_wrapper.queries(
+            "select * where {?s ?p ?o}", "select * where {?s ?p 'fail'}"
+        )
+
+    assert len(cancelled) == 1
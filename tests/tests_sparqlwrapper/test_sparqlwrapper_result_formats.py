@@ -0,0 +1,105 @@
+"""Tests for rdfproxy.SPARQLWrapper result format negotiation."""
+
+import datetime
+from decimal import Decimal
+
+import httpx
+import pytest
+from rdflib import BNode, Literal, URIRef, XSD
+import rdfproxy.sparqlwrapper
+from rdfproxy.sparqlwrapper import SPARQLWrapper
+
+
+target = "https://test.endpoint/sparql"
+
+tsv_response = (
+    "?x\t?y\n"
+    "2\t\n"
+    '2.2\t"2.2"^^<http://www.w3.org/2001/XMLSchema#decimal>\n'
+    "<https://test.uri>\t_:b0\n"
+    '"2024-01-01"^^<http://www.w3.org/2001/XMLSchema#date>\t"a\\tb"@en\n'
+    '"2024"^^<http://www.w3.org/2001/XMLSchema#gYear>\t"2024-01"^^<http://www.w3.org/2001/XMLSchema#gYearMonth>\n'
+    "true\t1e3"
+)
+
+json_response = {
+    "head": {"vars": ["x", "y"]},
+    "results": {
+        "bindings": [
+            {"x": {"type": "literal", "value": "2", "datatype": str(XSD.integer)}},
+            {
+                "x": {"type": "literal", "value": "2.2", "datatype": str(XSD.decimal)},
+                "y": {"type": "literal", "value": "2.2", "datatype": str(XSD.decimal)},
+            },
+            {
+                "x": {"type": "uri", "value": "https://test.uri"},
+                "y": {"type": "bnode", "value": "b0"},
+            },
+            {
+                "x": {
+                    "type": "literal",
+                    "value": "2024-01-01",
+                    "datatype": str(XSD.date),
+                },
+                "y": {"type": "literal", "value": "a\tb", "xml:lang": "en"},
+            },
+            {
+                "x": {"type": "literal", "value": "2024", "datatype": str(XSD.gYear)},
+                "y": {
+                    "type": "literal",
+                    "value": "2024-01",
+                    "datatype": str(XSD.gYearMonth),
+                },
+            },
+            {
+                "x": {"type": "literal", "value": "true", "datatype": str(XSD.boolean)},
+                "y": {"type": "literal", "value": "1e3", "datatype": str(XSD.double)},
+            },
+        ]
+    },
+}
+
+expected = [
+    {"x": 2, "y": None},
+    {"x": Decimal("2.2"), "y": Decimal("2.2")},
+    {"x": URIRef("https://test.uri"), "y": BNode("b0")},
+    {"x": datetime.date(2024, 1, 1), "y": "a\tb"},
+    {
+        "x": Literal("2024", datatype=XSD.gYear),
+        "y": Literal("2024-01", datatype=XSD.gYearMonth),
+    },
+    {"x": True, "y": 1000.0},
+]
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    match request.headers["Accept"]:
+        case "text/tab-separated-values":
+            return httpx.Response(200, text=tsv_response)
+        case "application/sparql-results+json":
+            return httpx.Response(200, json=json_response)
+        case _:  # pragma: no cover
+            return httpx.Response(406)
+
+
+@pytest.mark.parametrize("stream_json", [True, False])
+@pytest.mark.parametrize("result_format", ["json", "tsv"])
+def test_sparqlwrapper_result_formats(monkeypatch, result_format, stream_json):
+    """Check that JSON (streamed or buffered) and TSV result formats produce the same bindings."""
+    if stream_json:
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(rdfproxy.sparqlwrapper, "ijson", None)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    with SPARQLWrapper(
+        target=target, client=client, result_format=result_format
+    ) as sparql_wrapper:
+        result, *_ = sparql_wrapper.queries("select * where {?x ?p ?y}")
+        assert list(result) == expected
+
+
+def test_sparqlwrapper_unsupported_result_format():
+    with pytest.raises(ValueError):
+        SPARQLWrapper(target=target, result_format="xml")
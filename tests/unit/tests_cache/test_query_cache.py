@@ -0,0 +1,93 @@
+"""Unit tests for rdfproxy.cache query caches."""
+
+import asyncio
+
+import pytest
+from rdflib import Literal, URIRef, XSD
+from rdfproxy.cache import MemoryCache, QueryCache, SQLiteCache, get_cache_key
+
+
+bindings = [
+    {"x": URIRef("https://test.uri"), "y": 1},
+    {"x": None, "y": Literal("2024", datatype=XSD.gYear)},
+]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache_factory(request, tmp_path):
+    def _cache_factory(**kwargs) -> QueryCache:
+        if request.param == "memory":
+            return MemoryCache(**kwargs)
+        return SQLiteCache(path=str(tmp_path / "cache.sqlite"), **kwargs)
+
+    return _cache_factory
+
+
+def test_cache_get_set(cache_factory):
+    cache = cache_factory()
+
+    assert cache.get("key") is None
+
+    cache.set("key", bindings)
+    assert cache.get("key") == bindings
+
+    cache.clear()
+    assert cache.get("key") is None
+
+
+def test_cache_aget_aset(cache_factory):
+    cache = cache_factory()
+
+    async def _aget_aset():
+        assert await cache.aget("key") is None
+        await cache.aset("key", bindings)
+        return await cache.aget("key")
+
+    assert asyncio.run(_aget_aset()) == bindings
+    assert cache.get("key") == bindings
+
+
+def test_cache_lru_eviction(cache_factory):
+    cache = cache_factory(maxsize=2)
+
+    cache.set("a", bindings)
+    cache.set("b", bindings)
+    cache.get("a")
+    cache.set("c", bindings)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == bindings
+    assert cache.get("c") == bindings
+
+
+def test_cache_ttl(cache_factory, monkeypatch):
+    cache = cache_factory(ttl=10)
+    cache.set("key", bindings)
+
+    assert cache.get("key") == bindings
+
+    monkeypatch.setattr("rdfproxy.cache.time.monotonic", lambda: float("inf"))
+    monkeypatch.setattr("rdfproxy.cache.time.time", lambda: float("inf"))
+
+    assert cache.get("key") is None
+
+
+def test_sqlite_cache_persistence(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+
+    cache = SQLiteCache(path=path)
+    cache.set("key", bindings)
+    cache.close()
+
+    assert SQLiteCache(path=path).get("key") == bindings
+
+
+def test_cache_invalid_maxsize():
+    with pytest.raises(ValueError):
+        MemoryCache(maxsize=0)
+
+
+def test_get_cache_key():
+    assert get_cache_key("target", "query") == get_cache_key("target", "query")
+    assert get_cache_key("target", "query") != get_cache_key("target", "query2")
+    assert get_cache_key("ab", "c") != get_cache_key("a", "bc")
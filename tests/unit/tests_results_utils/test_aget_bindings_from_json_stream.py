@@ -0,0 +1,74 @@
+"""Unit tests for rdfproxy.utils.results_utils.aget_bindings_from_json_stream."""
+
+import asyncio
+from collections.abc import AsyncIterator
+import json
+
+import pytest
+from rdflib import BNode, URIRef, XSD
+from rdfproxy.utils.results_utils import (
+    aget_bindings_from_json_stream,
+    get_bindings_from_json_response,
+)
+
+
+pytest.importorskip("ijson")
+
+
+bindings = [
+    {
+        "x": {"type": "uri", "value": "urn:x"},
+        "y": {"type": "literal", "value": "1", "datatype": str(XSD.integer)},
+    },
+    {"x": {"type": "bnode", "value": "b0"}},
+    {"y": {"type": "literal", "value": 'a "quoted" {value}', "xml:lang": "en"}},
+]
+
+expected = [
+    {"x": URIRef("urn:x"), "y": 1},
+    {"x": BNode("b0"), "y": None},
+    {"x": None, "y": 'a "quoted" {value}'},
+]
+
+
+async def _aiter_chunks(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for index in range(0, len(data), size):
+        yield data[index : index + size]
+
+
+def _get_bindings(json_response: dict, size: int) -> list[dict]:
+    data = json.dumps(json_response).encode()
+
+    async def _aget_bindings():
+        return [
+            binding
+            async for binding in aget_bindings_from_json_stream(
+                _aiter_chunks(data, size)
+            )
+        ]
+
+    return asyncio.run(_aget_bindings())
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+@pytest.mark.parametrize(
+    "json_response",
+    [
+        {"head": {"vars": ["x", "y"]}, "results": {"bindings": bindings}},
+        {"results": {"bindings": bindings}, "head": {"vars": ["x", "y"]}},
+        {"head": {"link": [], "vars": ["x", "y"]}, "results": {"bindings": bindings}},
+    ],
+)
+def test_aget_bindings_from_json_stream(json_response, size):
+    assert _get_bindings(json_response, size) == expected
+    assert expected == list(get_bindings_from_json_response(json_response))
+
+
+def test_aget_bindings_from_json_stream_empty():
+    json_response = {"head": {"vars": ["x"]}, "results": {"bindings": []}}
+    assert _get_bindings(json_response, 3) == []
+
+
+def test_aget_bindings_from_json_stream_fail():
+    with pytest.raises(ValueError):
+        _get_bindings({"results": {"bindings": bindings}}, 3)
@@ -0,0 +1,52 @@
+"""Unit tests for rdfproxy.utils.results_utils.get_bindings_from_query_result."""
+
+import json
+
+import pytest
+from rdflib import Graph
+from rdfproxy.utils.results_utils import (
+    get_bindings_from_json_response,
+    get_bindings_from_query_result,
+)
+
+
+graph = Graph()
+graph.parse(
+    data="""
+    <urn:s> <urn:p> 1, 2.2, "foo", "foo"@en, "2024"^^<http://www.w3.org/2001/XMLSchema#gYear>, _:b0 .
+    """,
+    format="turtle",
+)
+
+queries = [
+    "select * where {?s ?p ?o}",
+    "select ?o ?dne where {?s ?p ?o}",
+    """
+    select * where {
+      values (?x ?y) {
+         (2 UNDEF)
+         (UNDEF UNDEF)
+         (<https://test.uri> '2024-01-01'^^xsd:date)
+         ('2024-01'^^xsd:gYearMonth 'abc'^^xsd:integer)
+        }
+    }
+    """,
+    "select * where {bind (BNODE() as ?x)}",
+    "select * where {?s ?p ?o} limit 0",
+]
+
+
+def _get_bindings_from_json_serialization(result) -> list[dict]:
+    """Reference implementation: SPARQL JSON round-trip."""
+    json_result = json.loads(result.serialize(format="json"))
+    return list(get_bindings_from_json_response(json_result))
+
+
+@pytest.mark.parametrize("query", queries)
+def test_get_bindings_from_query_result(query):
+    """Check that direct result conversion is equivalent to the JSON round-trip."""
+    result = graph.query(query)
+
+    assert list(get_bindings_from_query_result(result)) == (
+        _get_bindings_from_json_serialization(result)
+    )
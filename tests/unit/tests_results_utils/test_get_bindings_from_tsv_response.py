@@ -0,0 +1,27 @@
+"""Unit tests for rdfproxy.utils.results_utils.get_bindings_from_tsv_response."""
+
+import pytest
+from rdflib import URIRef
+from rdfproxy.utils.results_utils import get_bindings_from_tsv_response
+
+
+@pytest.mark.parametrize(
+    ["tsv_response", "expected"],
+    [
+        ("?x\t?y\n<urn:x>\t1", [{"x": URIRef("urn:x"), "y": 1}]),
+        ("?x\t?y\n<urn:x>\t1\n", [{"x": URIRef("urn:x"), "y": 1}]),
+        ("?x\t?y\r\n<urn:x>\t1\r\n", [{"x": URIRef("urn:x"), "y": 1}]),
+        ("?x\t?y\n\t\n", [{"x": None, "y": None}]),
+        ("?x\t?y\n", []),
+        ("?x", []),
+        ("\n\n", [{}]),
+    ],
+)
+def test_get_bindings_from_tsv_response(tsv_response, expected):
+    assert list(get_bindings_from_tsv_response(tsv_response)) == expected
+
+
+@pytest.mark.parametrize("tsv_response", ["", "?x\t?y\n<urn:x>", "?x\n<urn:x"])
+def test_get_bindings_from_tsv_response_fail(tsv_response):
+    with pytest.raises(ValueError):
+        list(get_bindings_from_tsv_response(tsv_response))
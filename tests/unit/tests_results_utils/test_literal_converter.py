@@ -0,0 +1,70 @@
+"""Unit tests for rdfproxy.utils.results_utils.LiteralConverter."""
+
+import pytest
+from rdflib import Literal, RDF, URIRef, XSD
+from rdfproxy.utils.results_utils import LiteralConverter
+
+
+literals = [
+    ("foo", None),
+    ("foo", XSD.string),
+    ("  foo  ", XSD.token),
+    ("1", XSD.integer),
+    ("01", XSD.integer),
+    ("-5", XSD.int),
+    ("2.20", XSD.decimal),
+    ("1e3", XSD.double),
+    ("INF", XSD.float),
+    ("true", XSD.boolean),
+    ("0", XSD.boolean),
+    ("2024-01-01", XSD.date),
+    ("2024-01-01T12:00:00", XSD.dateTime),
+    ("12:00:00", XSD.time),
+    ("P1D", XSD.duration),
+    ("DEADBEEF", XSD.hexBinary),
+    ("abc", XSD.integer),
+    ("foo", URIRef("urn:unknown:datatype")),
+]
+
+
+@pytest.mark.parametrize(["value", "datatype"], literals)
+def test_literal_converter(value, datatype):
+    """Check that LiteralConverter is equivalent to Literal.toPython."""
+    expected = Literal(value, datatype=datatype).toPython()
+
+    for _datatype in (datatype, None if datatype is None else str(datatype)):
+        converted = LiteralConverter()(value, _datatype)
+
+        assert type(converted) is type(expected)
+        assert converted == expected
+
+
+@pytest.mark.parametrize("datatype", [XSD.gYear, XSD.gYearMonth])
+@pytest.mark.parametrize("value", ["2024", "2024-01"])
+def test_literal_converter_gyear(value, datatype):
+    """Check that gYear and gYearMonth literals are not cast."""
+    converted = LiteralConverter()(value, str(datatype))
+    assert converted == Literal(value, datatype=datatype)
+
+
+def test_literal_converter_cache():
+    """Check that repeated lexical forms hit the bounded cache."""
+    convert_literal = LiteralConverter(maxsize=2)
+
+    first = convert_literal("2024-01-01", str(XSD.date))
+    assert convert_literal("2024-01-01", str(XSD.date)) is first
+
+    convert_literal("1", str(XSD.integer))
+    convert_literal("2", str(XSD.integer))
+
+    assert len(convert_literal._cache) == 2
+
+
+def test_literal_converter_xml_literal_uncached():
+    """Check that mutable XMLLiteral values are not shared between bindings."""
+    convert_literal = LiteralConverter()
+    value = "<p>foo</p>"
+
+    assert convert_literal(value, str(RDF.XMLLiteral)) is not convert_literal(
+        value, str(RDF.XMLLiteral)
+    )
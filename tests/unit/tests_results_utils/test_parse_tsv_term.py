@@ -0,0 +1,39 @@
+"""Unit tests for rdfproxy.utils.results_utils.parse_tsv_term."""
+
+import pytest
+from rdflib import XSD
+from rdfproxy.utils.results_utils import parse_tsv_term
+
+
+@pytest.mark.parametrize(
+    ["term", "expected"],
+    [
+        ("", None),
+        ("<https://test.uri>", {"type": "uri", "value": "https://test.uri"}),
+        ("<urn:\\u0041\\U00000042>", {"type": "uri", "value": "urn:AB"}),
+        ("_:b0", {"type": "bnode", "value": "b0"}),
+        ('"foo"', {"type": "literal", "value": "foo"}),
+        ('""', {"type": "literal", "value": ""}),
+        ('"foo"@en-US', {"type": "literal", "value": "foo", "xml:lang": "en-US"}),
+        (
+            '"a\\tb\\nc\\"d\\\\e\\u00FC"',
+            {"type": "literal", "value": 'a\tb\nc"d\\eü'},
+        ),
+        (
+            '"1"^^<http://www.w3.org/2001/XMLSchema#int>',
+            {"type": "literal", "value": "1", "datatype": str(XSD.int)},
+        ),
+        ("-1", {"type": "literal", "value": "-1", "datatype": str(XSD.integer)}),
+        ("1.5", {"type": "literal", "value": "1.5", "datatype": str(XSD.decimal)}),
+        ("1.5E-2", {"type": "literal", "value": "1.5E-2", "datatype": str(XSD.double)}),
+        ("false", {"type": "literal", "value": "false", "datatype": str(XSD.boolean)}),
+    ],
+)
+def test_parse_tsv_term(term, expected):
+    assert parse_tsv_term(term) == expected
+
+
+@pytest.mark.parametrize("term", ["foo", '"foo', '"foo"^^xsd:int', '"\\x"', "1.2.3"])
+def test_parse_tsv_term_fail(term):
+    with pytest.raises(ValueError):
+        parse_tsv_term(term)
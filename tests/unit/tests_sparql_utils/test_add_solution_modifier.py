@@ -37,6 +37,11 @@ parameters = [
         parameters={"order_by": "?x", "limit": 1, "offset": 1},
         expected="prefix ns: <https://some.namespace> select * where {?s ?p ?o } order by ?x limit 1 offset 1",
     ),
+    AddSolutionModifierParameter(
+        query="select ?s (count(?o) as ?cnt) where {?s ?p ?o }",
+        parameters={"group_by": "?s", "order_by": "?cnt", "limit": 1},
+        expected="select ?s (count(?o) as ?cnt) where {?s ?p ?o } group by ?s order by ?cnt limit 1",
+    ),
     # order
     AddSolutionModifierParameter(
         query="prefix ns: <https://some.namespace> select * where {?s ?p ?o }",
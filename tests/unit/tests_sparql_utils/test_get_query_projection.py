@@ -4,6 +4,7 @@ from typing import NamedTuple
 
 import pytest
 
+from rdfproxy.utils._types import ParsedSPARQL
 from rdfproxy.utils.sparql_utils import get_query_projection
 
 
@@ -23,6 +24,11 @@ parameters = [
         select ?s ?o where {?s ?p ?o}""",
         expected=["s", "o"],
     ),
+    # explicit projection with alias
+    QueryProjectionParameter(
+        query="select ?s (str(?o) as ?label) where {?s ?p ?o}",
+        expected=["s", "label"],
+    ),
     # implicit projection
     QueryProjectionParameter(
         query="select * where {?s ?p ?o}",
@@ -61,3 +67,11 @@ parameters = [
 def test_get_query_projection(query, expected):
     projection = [str(binding) for binding in get_query_projection(query)]
     assert projection == expected
+
+
+@pytest.mark.parametrize(["query", "expected"], parameters)
+def test_get_query_projection_parsed_sparql(query, expected):
+    projection = [
+        str(binding) for binding in get_query_projection(ParsedSPARQL(query=query))
+    ]
+    assert projection == expected
@@ -3,7 +3,7 @@
 from typing import NamedTuple
 
 import pytest
-from rdfproxy.utils.sparql_utils import inject_into_query
+from rdfproxy.utils.sparql_utils import QueryTemplate
 
 
 class InjectSubqueryParameter(NamedTuple):
@@ -103,7 +103,5 @@ inject_filter_parameters = [
     ["query", "filter_clause", "expected"], inject_filter_parameters
 )
 def test_inject_subquery(query, filter_clause, expected):
-    injected = inject_into_query(
-        query=query, injectant=filter_clause, inject_into_pattern=False
-    )
+    injected = QueryTemplate(query).render(tail_injectant=filter_clause)
     assert injected == expected
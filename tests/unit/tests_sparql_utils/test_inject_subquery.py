@@ -4,7 +4,7 @@ from typing import NamedTuple
 
 import pytest
 
-from rdfproxy.utils.sparql_utils import inject_into_query, remove_sparql_prefixes
+from rdfproxy.utils.sparql_utils import QueryTemplate
 
 
 class InjectSubqueryParameter(NamedTuple):
@@ -119,6 +119,6 @@ inject_subquery_parameters = [
 
 @pytest.mark.parametrize(["query", "subquery", "expected"], inject_subquery_parameters)
 def test_inject_subquery(query, subquery, expected):
-    injectant = remove_sparql_prefixes(subquery)
-    injected = inject_into_query(query=query, injectant=injectant)
+    injectant = QueryTemplate(subquery).unprefixed.render()
+    injected = QueryTemplate(query).render(tail_injectant=f"{{{injectant}}}")
     assert injected == expected
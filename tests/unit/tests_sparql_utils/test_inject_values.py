@@ -0,0 +1,31 @@
+"""Unit tests for query injection at the start of the WHERE clause (e.g. VALUES clauses)."""
+
+import pytest
+from rdfproxy.utils.exceptions import QueryConstructionException
+from rdfproxy.utils.sparql_utils import QueryTemplate
+
+
+@pytest.mark.parametrize(
+    ["query", "injectant", "expected"],
+    [
+        (
+            "select * where {?s ?p ?o .}",
+            "values ?s { <urn:s> }",
+            "select * where { values ?s { <urn:s> } ?s ?p ?o .}",
+        ),
+        (
+            "PREFIX crm: <http://www.cidoc-crm.org/cidoc-crm/> SELECT ?s\nWHERE\n{ { select ?s where {?s ?p ?o} } }",
+            "values ?s { <urn:s> }",
+            "PREFIX crm: <http://www.cidoc-crm.org/cidoc-crm/> SELECT ?s\nWHERE\n{ values ?s { <urn:s> }  { select ?s where {?s ?p ?o} } }",
+        ),
+    ],
+)
+def test_inject_values(query, injectant, expected):
+    assert QueryTemplate(query).render(head_injectant=injectant) == expected
+
+
+def test_inject_values_fail():
+    with pytest.raises(QueryConstructionException):
+        QueryTemplate("select * {?s ?p ?o}").render(
+            head_injectant="values ?s { <urn:s> }"
+        )
@@ -0,0 +1,58 @@
+"""Unit tests for sparql_utils.QueryTemplate."""
+
+import pytest
+
+from rdfproxy.utils.exceptions import QueryConstructionException
+from rdfproxy.utils.sparql_utils import QueryTemplate, remove_sparql_prefixes
+
+
+queries = [
+    "select * where {?s ?p ?o .}",
+    "select ?s ?o where {?s ?p ?o .}",
+    "SELECT ?s WHERE{?s ?p ?o}",
+    "prefix : <some_prefix> select * where {?s ?p ?o .}",
+    """
+    PREFIX crm: <http://www.cidoc-crm.org/cidoc-crm/>
+    PREFIX lrmoo: <http://iflastandards.info/ns/lrm/lrmoo/>
+
+    SELECT
+    ?location
+    ?location__location_descriptive_name
+
+    WHERE {
+    ?location a crm:E53_Place.
+
+    ?location crm:P3_has_note ?location__location_descriptive_name.
+    {
+        select ?location where { ?location ?p ?o }
+    }
+    }
+    """,
+]
+
+
+@pytest.mark.parametrize("query", queries)
+def test_query_template_render(query):
+    """Check that QueryTemplate renderings only modify the respective query parts."""
+    template = QueryTemplate(query)
+    select_clause = "select (count(*) as ?cnt)"
+
+    assert template.render() == query
+    assert template.render(select_clause=select_clause) == query.replace(
+        template.select_clause, select_clause, 1
+    )
+    assert template.render(
+        head_injectant="values ?s {1}", tail_injectant="filter (?s)"
+    ) == (
+        f"{template.prologue}{template.select_clause}{template.where_head}"
+        f" values ?s {{1}} {template.where_body} filter (?s) {template.tail}"
+    )
+    assert template.unprefixed.render() == remove_sparql_prefixes(query)
+
+
+@pytest.mark.parametrize(
+    "query", ["ask where {?s ?p ?o}", "select * {?s ?p ?o}", "select * where ?s"]
+)
+def test_query_template_fail(query):
+    with pytest.raises(QueryConstructionException):
+        QueryTemplate(query)
@@ -0,0 +1,33 @@
+"""Unit tests for projection extension with rdfproxy.utils.sparql_utils.QueryTemplate."""
+
+import pytest
+from rdfproxy.utils.sparql_utils import QueryTemplate
+
+
+@pytest.mark.parametrize(
+    ["query", "variables", "expected"],
+    [
+        (
+            "select ?s ?p where {?s ?p ?o}",
+            ("o",),
+            "select ?s ?p ?o where {?s ?p ?o}",
+        ),
+        (
+            "PREFIX ns: <https://some.namespace> SELECT DISTINCT ?s\nWHERE {?s ?p ?o}",
+            ("p", "o"),
+            "PREFIX ns: <https://some.namespace> SELECT DISTINCT ?s ?p ?o\nWHERE {?s ?p ?o}",
+        ),
+        (
+            "select * where {?s ?p ?o}",
+            ("x",),
+            "select * where {?s ?p ?o}",
+        ),
+    ],
+)
+def test_query_template_get_select_clause(query, variables, expected):
+    template = QueryTemplate(query)
+
+    assert (
+        template.render(select_clause=template.get_select_clause(*variables))
+        == expected
+    )
@@ -1,11 +1,11 @@
-"""Unit tests for rdfproxy.utils.sparql_utils.replace_query_select_clause."""
+"""Unit tests for SELECT clause replacement with rdfproxy.utils.sparql_utils.QueryTemplate."""
 
 import re
 from textwrap import dedent
 
 import pytest
 
-from rdfproxy.utils.sparql_utils import replace_query_select_clause
+from rdfproxy.utils.sparql_utils import QueryTemplate
 from tests.utils._types import QueryConstructionParameter
 
 
@@ -64,9 +64,11 @@ query_construction_parameters = [
     ["input_query", "expected_query"], query_construction_parameters
 )
 def test_basic_replace_query_select_clause(input_query, expected_query):
-    _constructed_indent: str = replace_query_select_clause(input_query, "select <test>")
-    _constructed_dedent: str = replace_query_select_clause(
-        dedent(input_query), "select <test>"
+    _constructed_indent: str = QueryTemplate(input_query).render(
+        select_clause="select <test>"
+    )
+    _constructed_dedent: str = QueryTemplate(dedent(input_query)).render(
+        select_clause="select <test>"
     )
 
     constructed_indent = _normalize_whitespace(_constructed_indent)
@@ -1,8 +1,8 @@
-"""Sad path tests for rdfproxy.utils.sparql_utils.replace_query_select_clause."""
+"""Sad path tests for SELECT clause replacement with rdfproxy.utils.sparql_utils.QueryTemplate."""
 
 import pytest
 
-from rdfproxy.utils.sparql_utils import replace_query_select_clause
+from rdfproxy.utils.sparql_utils import QueryTemplate
 
 
 fail_queries: list[str] = [
@@ -17,4 +17,4 @@ fail_queries: list[str] = [
 @pytest.mark.parametrize("fail_query", fail_queries)
 def test_basic_sad_path_replace_query_select_clause(fail_query):
     with pytest.raises(Exception, match="Unable to obtain SELECT clause."):
-        replace_query_select_clause(fail_query, "<test>")
+        QueryTemplate(fail_query).render(select_clause="<test>")
@@ -11,6 +11,7 @@ import pytest
 from rdflib import BNode, Literal, URIRef
 from rdflib.xsd_datetime import Duration
 from rdfproxy.utils.type_utils import (
+    _is_iri_static_type,
     _is_list_pydantic_model_static_type,
     _is_list_static_type,
     _is_pydantic_model_static_type,
@@ -176,3 +177,26 @@ def test_is_sparql_bound_field_type_false(obj):
 def test_is_sparql_bound_field_type_instance_fail(obj):
     with pytest.raises(ValueError):
         _is_sparql_bound_field_type(obj)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        URIRef,
+        AnyUrl,
+        AnyHttpUrl,
+        AnyUrl | None,
+        Optional[URIRef],
+        AnyUrl | URIRef,
+        Annotated[AnyUrl, "metadata"],
+    ],
+)
+def test_is_iri_static_type(obj):
+    assert _is_iri_static_type(obj)
+
+
+@pytest.mark.parametrize(
+    "obj", [str, int, Literal, None, AnyUrl | str, Union[URIRef, int], list[AnyUrl]]
+)
+def test_is_iri_static_type_false(obj):
+    assert not _is_iri_static_type(obj)
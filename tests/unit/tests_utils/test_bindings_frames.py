@@ -0,0 +1,84 @@
+"""Unit tests for the bindings frames of rdfproxy.utils.frames."""
+
+import math
+
+import pytest
+from rdfproxy import MapperEngine
+from rdfproxy.utils.frames import (
+    _BindingsFrame,
+    _PythonBindingsFrame,
+    get_bindings_frame_type,
+)
+from rdfproxy.utils.utils import _SENTINEL
+
+
+bindings = [
+    {"x": 1, "y": "a"},
+    {"x": None, "y": "b"},
+    {"x": 1, "y": "c"},
+    {"x": 2, "y": None},
+    {"x": None, "y": "a"},
+]
+
+
+def get_column(frame: _BindingsFrame, column: str) -> list:
+    return [row.get_first_value(column) for row in frame.iter_rows()]
+
+
+@pytest.fixture(params=list(MapperEngine))
+def frame(request) -> _BindingsFrame:
+    return get_bindings_frame_type(request.param).from_bindings(bindings)
+
+
+def test_bindings_frame_rows(frame):
+    rows = list(frame.iter_rows())
+
+    assert all(isinstance(row, _PythonBindingsFrame) for row in rows)
+    assert get_column(frame, "y") == ["a", "b", "c", None, "a"]
+    assert rows[0].get_first_value("dne") is _SENTINEL
+
+
+def test_bindings_frame_groups(frame):
+    groups = [get_column(group, "y") for group in frame.iter_groups("x")]
+    assert groups == [["a", "c"], ["b", "a"], [None]]
+
+
+def test_bindings_frame_partition(frame):
+    assert get_column(frame.partition("x", 1), "y") == ["a", "c"]
+    assert get_column(frame.partition("x", None), "y") == ["b", "a"]
+    assert get_column(frame.partition("x", math.nan), "y") == ["b", "a"]
+    assert frame.partition("x", 3).empty
+
+
+def test_bindings_frame_aggregation(frame):
+    assert frame.get_unique_values("y") == ["a", "b", "c"]
+    assert frame.count_unique("x") == 3
+    assert frame.count_unique("y") == 4
+
+
+def test_bindings_frame_empty():
+    for engine in MapperEngine:
+        frame_type = get_bindings_frame_type(engine)
+
+        assert frame_type.from_bindings([]).empty
+        assert frame_type.from_bindings([{}]).empty
+        assert not frame_type.from_bindings([{"x": None}]).empty
+
+
+def test_bindings_frame_missing_column(frame):
+    with pytest.raises(KeyError):
+        frame.get_unique_values("dne")
+
+
+def test_bindings_frame_partition_cached(frame):
+    """Check that partitions are looked up from a group index once per group value."""
+    assert frame.partition("x", 1) is frame.partition("x", 1)
+    assert frame.partition("x", None) is frame.partition("x", math.nan)
+
+
+def test_bindings_frame_partition_unhashable():
+    frame = _PythonBindingsFrame.from_bindings(
+        [{"x": [1], "y": "a"}, {"x": [2], "y": "b"}, {"x": [1], "y": "c"}]
+    )
+
+    assert get_column(frame.partition("x", [1]), "y") == ["a", "c"]
@@ -0,0 +1,77 @@
+"""Unit tests for keyset pagination cursor encoding/decoding."""
+
+import base64
+import datetime
+import json
+
+import pytest
+from rdflib import BNode, Literal, URIRef, XSD
+from rdfproxy.utils.cursor_utils import (
+    decode_cursor,
+    encode_cursor,
+    get_cursor_lang_variable,
+    get_cursor_values,
+)
+
+
+def _cursor(terms: list) -> str:
+    return base64.urlsafe_b64encode(json.dumps(terms).encode()).decode()
+
+
+@pytest.mark.parametrize(
+    ["values", "expected"],
+    [
+        ([], []),
+        ([None], [None]),
+        ([URIRef("https://test.uri")], [URIRef("https://test.uri")]),
+        (["x", 1], [Literal("x"), Literal(1)]),
+        ([Literal("x", lang="en")], [Literal("x", lang="en")]),
+        ([Literal("2024", datatype=XSD.gYear)], [Literal("2024", datatype=XSD.gYear)]),
+        (
+            [datetime.date(2024, 1, 1), 1.5, None],
+            [Literal(datetime.date(2024, 1, 1)), Literal(1.5), None],
+        ),
+        (['"quoted" } value'], [Literal('"quoted" } value')]),
+    ],
+)
+def test_cursor_roundtrip(values, expected):
+    assert decode_cursor(encode_cursor(values)) == expected
+
+
+def test_encode_cursor_bnode():
+    with pytest.raises(ValueError):
+        encode_cursor([BNode()])
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        _cursor({"type": "uri", "value": "https://test.uri"}),
+        _cursor([{"type": "bnode", "value": "b0"}]),
+        _cursor([{"type": "uri", "value": "urn:x> } drop all; <urn:y"}]),
+        _cursor([{"type": "literal", "value": "1", "datatype": "urn:x> } <urn:y"}]),
+        _cursor([{"type": "literal", "value": "x", "xml:lang": "en } filter"}]),
+    ],
+)
+def test_decode_cursor_invalid(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_get_cursor_values():
+    binding = {
+        "x": "alpha",
+        "y": 1,
+        "z": URIRef("urn:z"),
+        get_cursor_lang_variable("x"): "en",
+        get_cursor_lang_variable("y"): "",
+        get_cursor_lang_variable("z"): None,
+    }
+
+    assert get_cursor_values(binding, ["x", "y", "z", "dne"]) == [
+        Literal("alpha", lang="en"),
+        1,
+        URIRef("urn:z"),
+        None,
+    ]
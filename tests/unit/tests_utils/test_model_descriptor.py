@@ -0,0 +1,71 @@
+"""Unit tests for rdfproxy.utils.mapper_utils.get_model_descriptor."""
+
+from typing import Annotated
+
+from pydantic import BaseModel
+from rdfproxy import ConfigDict, SPARQLBinding
+from rdfproxy.utils.mapper_utils import (
+    _FieldKind,
+    default_model_bool_predicate,
+    get_model_descriptor,
+)
+
+
+class Child(BaseModel):
+    model_config = ConfigDict(model_bool="name")
+
+    name: str | None = None
+
+
+class Nested(BaseModel):
+    x: int
+
+
+class Parent(BaseModel):
+    model_config = ConfigDict(group_by="key", enforce_grouping_consistency=False)
+
+    key: Annotated[str, SPARQLBinding("parent")]
+    values: list[int]
+    children: list[Child]
+    nested: Nested
+    optional_nested: Nested | None = None
+    label: str = "default"
+
+
+def test_model_descriptor():
+    descriptor = get_model_descriptor(Parent)
+
+    assert descriptor.grouped
+    assert descriptor.group_by == "parent"
+    assert descriptor.enforce_grouping_consistency is False
+    assert descriptor.model_bool_predicate is default_model_bool_predicate
+
+    assert [
+        (field.name, field.binding, field.kind, field.nested_model)
+        for field in descriptor.fields
+    ] == [
+        ("key", "parent", _FieldKind.SCALAR, None),
+        ("values", "values", _FieldKind.LIST, None),
+        ("children", "children", _FieldKind.LIST_MODEL, Child),
+        ("nested", "nested", _FieldKind.MODEL, Nested),
+        ("optional_nested", "optional_nested", _FieldKind.MODEL_UNION, Nested),
+        ("label", "label", _FieldKind.SCALAR, None),
+    ]
+    assert [field.name for field in descriptor.fields if field.sparql_bound] == [
+        "key",
+        "label",
+    ]
+    assert descriptor.fields[-1].default == "default"
+
+
+def test_model_descriptor_ungrouped():
+    descriptor = get_model_descriptor(Child)
+
+    assert not descriptor.grouped
+    assert descriptor.group_by is None
+    assert descriptor.model_bool_predicate(Child(name="x"))
+    assert not descriptor.model_bool_predicate(Child())
+
+
+def test_model_descriptor_cached():
+    assert get_model_descriptor(Parent) is get_model_descriptor(Parent)
@@ -0,0 +1,93 @@
+"""Unit tests for rdfproxy.utils.mapper_utils.get_model_key."""
+
+from pydantic import BaseModel, ConfigDict
+import pytest
+from rdfproxy.mapper import GroupedModelConstructor
+from rdfproxy.utils.mapper_utils import get_model_key
+
+
+class Child(BaseModel):
+    name: str
+    values: list[int] = []
+
+
+class Parent(BaseModel):
+    name: str
+    children: list[Child] = []
+
+
+class Other(BaseModel):
+    name: str
+    values: list[int] = []
+
+
+class Unhashable(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str
+    value: object = None
+
+
+@pytest.mark.parametrize(
+    ["model_1", "model_2"],
+    [
+        (Child(name="a"), Child(name="a")),
+        (Child(name="a", values=[1, 2]), Child(name="a", values=[1, 2])),
+        (
+            Parent(name="p", children=[Child(name="a")]),
+            Parent(name="p", children=[Child(name="a")]),
+        ),
+    ],
+)
+def test_model_key_equal(model_1, model_2):
+    assert model_1 == model_2
+    assert get_model_key(model_1) == get_model_key(model_2)
+    assert hash(get_model_key(model_1)) == hash(get_model_key(model_2))
+
+
+@pytest.mark.parametrize(
+    ["model_1", "model_2"],
+    [
+        (Child(name="a"), Child(name="b")),
+        (Child(name="a", values=[1, 2]), Child(name="a", values=[2, 1])),
+        (Child(name="a"), Other(name="a")),
+        (
+            Parent(name="p", children=[Child(name="a")]),
+            Parent(name="p", children=[Child(name="b")]),
+        ),
+    ],
+)
+def test_model_key_not_equal(model_1, model_2):
+    assert model_1 != model_2
+    assert get_model_key(model_1) != get_model_key(model_2)
+
+
+def test_get_unique_models():
+    models = [
+        Child(name="b"),
+        Child(name="a"),
+        Child(name="b"),
+        Child(name=""),
+        Child(name="a", values=[1]),
+        Child(name="a"),
+    ]
+
+    assert GroupedModelConstructor._get_unique_models(iter(models)) == [
+        Child(name="b"),
+        Child(name="a"),
+        Child(name="a", values=[1]),
+    ]
+
+
+def test_get_unique_models_unhashable():
+    models = [
+        Unhashable(name="a", value=bytearray(b"x")),
+        Unhashable(name="a", value=bytearray(b"x")),
+        Unhashable(name="a"),
+        Unhashable(name="a"),
+    ]
+
+    assert GroupedModelConstructor._get_unique_models(iter(models)) == [
+        Unhashable(name="a", value=bytearray(b"x")),
+        Unhashable(name="a"),
+    ]
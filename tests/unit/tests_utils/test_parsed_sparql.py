@@ -0,0 +1,38 @@
+"""Unit tests for rdfproxy.utils._types.ParsedSPARQL."""
+
+from rdflib import Variable
+from rdfproxy.utils._types import ParsedSPARQL
+
+
+query = """
+PREFIX crm: <http://www.cidoc-crm.org/cidoc-crm/>
+PREFIX lrmoo:<http://iflastandards.info/ns/lrm/lrmoo/>
+select ?s ?o
+where {
+    ?s crm:P1 ?o .
+}
+"""
+
+
+def test_parsed_sparql_parts():
+    parsed_sparql = ParsedSPARQL(query=query)
+
+    assert parsed_sparql == query
+    assert parsed_sparql.projection == [Variable("s"), Variable("o")]
+    assert parsed_sparql.pattern_variables == {Variable("s"), Variable("o")}
+    assert parsed_sparql.where_variables == {Variable("s"), Variable("o")}
+    assert parsed_sparql.template.render() == query
+
+
+def test_parsed_sparql_parse_once(monkeypatch):
+    """Check that ParsedSPARQL parts do not reparse the query."""
+    parsed_sparql = ParsedSPARQL(query=query)
+
+    def _parse_query(*args, **kwargs):
+        raise AssertionError("Query was reparsed.")
+
+    monkeypatch.setattr("rdfproxy.utils.sparql_utils.parseQuery", _parse_query)
+
+    assert parsed_sparql.projection
+    assert parsed_sparql.pattern_variables
+    assert parsed_sparql.template
@@ -1,4 +1,4 @@
-"""Pytest entry point for rdfproxy.utils.CurryModel tests."""
+"""Unit tests for rdfproxy.utils.utils.validate_model_field."""
 
 from typing import NamedTuple
 
@@ -16,6 +16,11 @@ class PointStrict(Point):
     model_config = ConfigDict(strict=True)
 
 
+class Line(BaseModel):
+    start: Point
+    points: list[Point] = []
+
+
 class ValidateModelFieldParameter(NamedTuple):
     model: type[BaseModel]
     kwargs: dict
@@ -28,6 +33,8 @@ pass_params = [
     ValidateModelFieldParameter(model=Point, kwargs={"x": "1"}),
     ValidateModelFieldParameter(model=Point, kwargs={"y": 2}),
     ValidateModelFieldParameter(model=Point, kwargs={"x": 1, "y": 2}),
+    ValidateModelFieldParameter(model=Line, kwargs={"start": {"x": 1, "y": 2}}),
+    ValidateModelFieldParameter(model=Line, kwargs={"points": [Point(x=1, y=2)]}),
 ]
 
 fail_params = [
@@ -43,6 +50,12 @@ fail_params = [
     ValidateModelFieldParameter(
         model=PointStrict, kwargs={"z": 3}, exception=ValueError
     ),
+    ValidateModelFieldParameter(
+        model=Point, kwargs={"y": -1}, exception=ValidationError
+    ),
+    ValidateModelFieldParameter(
+        model=Line, kwargs={"start": {"x": 1, "y": -1}}, exception=ValidationError
+    ),
 ]
 
 
@@ -57,3 +70,19 @@ def test_validate_model_field_basic_fail(param):
     with pytest.raises(param.exception):
         for k, v in param.kwargs.items():
             validate_model_field(model=param.model, field=k, value=v)
+
+
+@pytest.mark.parametrize(
+    ["model", "field", "value", "loc"],
+    [
+        (Point, "y", -1, ("y",)),
+        (Line, "start", {"x": 1}, ("start", "y")),
+        (Line, "points", [{"x": 1, "y": 1}, {"x": "a", "y": 1}], ("points", 1, "x")),
+    ],
+)
+def test_validate_model_field_error_loc(model, field, value, loc):
+    with pytest.raises(ValidationError) as e:
+        validate_model_field(model=model, field=field, value=value)
+
+    assert e.value.title == model.__name__
+    assert [error["loc"] for error in e.value.errors()] == [loc]